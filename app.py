@@ -1,11 +1,18 @@
 import streamlit as st
 
+from components.sidebar import render_debug_panel, render_sidebar
+from utils.profiling import session_profile
+from utils.watcher import start_data_watcher
+
 # Configurare pagină
 st.set_page_config(
     page_title="Brenado For House",
     layout="wide"
 )
 
+# Pornire watcher pentru exporturile din data/ (o singură dată per proces)
+start_data_watcher()
+
 # Definirea paginilor cu noua structură st.navigation
 pages = {
     "Brenado For House": [
@@ -19,6 +26,11 @@ pages = {
     ],
 }
 
-# Crearea și rularea navigației
+# Sidebar (inclusiv comutatorul panoului de depanare)
+render_sidebar()
+
+# Crearea și rularea navigației - rerun-ul este profilat când panoul de depanare este activ
 pg = st.navigation(pages)
-pg.run()
+with session_profile(pg.title):
+    pg.run()
+render_debug_panel()
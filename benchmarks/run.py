@@ -0,0 +1,224 @@
+"""
+Benchmark-uri pentru drumurile critice ale dashboard-ului
+
+Măsoară, pe exporturi sintetice LaData/Perioada de 10k, 100k și 1M rânduri:
+încărcarea (parsare Excel, snapshot, cache), indexul de filtrare și filtrele
+în cascadă, cubul pentru Treemap, construcția figurilor și KPI-urile.
+
+Rezultatele sunt adăugate în istoricul JSONL; un timp mai mare decât mediana
+ultimelor rulări de pe aceeași mașină (peste toleranță) este o regresie și
+rularea se încheie cu cod de ieșire 1.
+
+Utilizare (din rădăcina proiectului):
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10000 100000 --repeats 3
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import utils.artifacts as artifacts  # noqa: E402
+import utils.snapshots as snapshots  # noqa: E402
+from benchmarks.synthetic import ensure_workbooks  # noqa: E402
+from components.charts import stock_donut_figure, stock_treemap_figure  # noqa: E402
+from config.settings import DATA_PATHS  # noqa: E402
+from utils.aggregations import build_stock_cube  # noqa: E402
+from utils.data_loaders import DATASET_CACHE, load_balanta_la_data, load_balanta_perioada  # noqa: E402
+from utils.filter_index import FilterIndex, get_filter_index  # noqa: E402
+from utils.metrics import MetricsEngine  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_DATA_DIR = ROOT / "benchmarks" / ".data"
+DEFAULT_HISTORY = ROOT / "benchmarks" / "results" / "history.jsonl"
+
+# Un caz este regresie dacă depășește mediana istorică cu TOLERANCE și cu cel puțin MIN_DELTA secunde
+TOLERANCE = 0.25
+MIN_DELTA = 0.005
+HISTORY_WINDOW = 5
+
+# Parsarea Excel rulează o singură dată (minute la 1M rânduri): o singură măsurătoare e mai zgomotoasă
+SINGLE_RUN_CASES = ('load_la_data_parse', 'load_perioada_parse')
+SINGLE_RUN_TOLERANCE = 0.5
+
+
+def _timed(func, repeats=1, setup=None):
+    """Cel mai bun timp din `repeats` rulări și rezultatul ultimei rulări (setup rulează înainte, necronometrat)"""
+    best, result = None, None
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _load(loader, rows):
+    df = loader()
+    if len(df) != rows:
+        raise RuntimeError(f"Încărcarea a returnat {len(df)} rânduri în loc de {rows} (date demo?)")
+    return df
+
+
+def _cascade(index, df):
+    """Aceeași succesiune de operații ca filtrele în cascadă din tab-ul La Dată"""
+    gestiuni = index.options('DenumireGest')[:3]
+    mask_gestiune = index.mask({'DenumireGest': gestiuni})
+    grupe = index.options('Grupa', mask_gestiune)[:5]
+    mask_grupa = index.mask({'Grupa': grupe}, base=mask_gestiune)
+    produse = index.options('Denumire', mask_grupa)[:10]
+    mask = index.mask({'Denumire': produse}, base=mask_grupa)
+    view = index.view(df, mask)
+    view.sum('ValoareStocFinal')
+    view.sum('ValoareVanzare')
+    return view
+
+
+def run_size(rows, data_dir, repeats):
+    """
+    Rulează toate cazurile pentru o dimensiune
+
+    Returns:
+        Dicționar caz -> secunde
+    """
+    paths = ensure_workbooks(data_dir, rows)
+    previous_paths = dict(DATA_PATHS)
+    previous_snapshot_dir = snapshots.SNAPSHOT_DIR
+    previous_artifacts_dir = artifacts.ARTIFACTS_DIR
+    results = {}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        DATA_PATHS.update({key: str(path) for key, path in paths.items()})
+        snapshots.SNAPSHOT_DIR = str(Path(work_dir) / "snapshots")
+        # Fără artefactele publicate pe mașină: altfel fiecare încărcare ar calcula întâi hash-ul sursei
+        artifacts.ARTIFACTS_DIR = str(Path(work_dir) / "artifacts")
+        try:
+            DATASET_CACHE.invalidate()
+            results['load_la_data_parse'], _ = _timed(lambda: _load(load_balanta_la_data, rows))
+            results['load_perioada_parse'], _ = _timed(lambda: _load(load_balanta_perioada, rows))
+
+            results['load_la_data_snapshot'], _ = _timed(
+                lambda: _load(load_balanta_la_data, rows), repeats, setup=DATASET_CACHE.invalidate
+            )
+            results['load_perioada_snapshot'], _ = _timed(
+                lambda: _load(load_balanta_perioada, rows), repeats, setup=DATASET_CACHE.invalidate
+            )
+            results['load_la_data_cached'], balanta_df = _timed(lambda: _load(load_balanta_la_data, rows), repeats)
+            perioada_df = load_balanta_perioada()
+
+            results['filter_index_build'], _ = _timed(lambda: FilterIndex(balanta_df), repeats)
+            index = get_filter_index(balanta_df)
+            results['filter_cascade'], view = _timed(lambda: _cascade(index, balanta_df), repeats)
+
+            results['stock_cube'], cube = _timed(lambda: build_stock_cube(balanta_df), repeats)
+            results['treemap_figure'], _ = _timed(lambda: stock_treemap_figure(cube).to_json(), repeats)
+            results['donut_figure'], _ = _timed(
+                lambda: stock_donut_figure(view, title="Benchmark").to_json(), repeats
+            )
+
+            results['metrics_la_data'], _ = _timed(lambda: MetricsEngine(balanta_df), repeats)
+            results['metrics_perioada'], _ = _timed(lambda: MetricsEngine(perioada_df), repeats)
+        finally:
+            DATA_PATHS.clear()
+            DATA_PATHS.update(previous_paths)
+            snapshots.SNAPSHOT_DIR = previous_snapshot_dir
+            artifacts.ARTIFACTS_DIR = previous_artifacts_dir
+            DATASET_CACHE.invalidate()
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def read_history(path):
+    """Citește înregistrările din istoricul JSONL (lista goală dacă nu există)"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def append_history(path, records):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def find_regressions(records, history, tolerance=TOLERANCE, min_delta=MIN_DELTA, window=HISTORY_WINDOW):
+    """
+    Compară rezultatele curente cu mediana ultimelor rulări de pe aceeași mașină
+
+    Cazurile din SINGLE_RUN_CASES (o singură măsurătoare) folosesc cel puțin
+    SINGLE_RUN_TOLERANCE.
+
+    Returns:
+        Lista de (rows, case, secunde, mediana istorică)
+    """
+    regressions = []
+    for record in records:
+        previous = [
+            item['seconds'] for item in history
+            if item.get('host') == record['host'] and item['rows'] == record['rows'] and item['case'] == record['case']
+        ][-window:]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        allowed = max(tolerance, SINGLE_RUN_TOLERANCE) if record['case'] in SINGLE_RUN_CASES else tolerance
+        if record['seconds'] > baseline * (1 + allowed) and record['seconds'] - baseline > min_delta:
+            regressions.append((record['rows'], record['case'], record['seconds'], baseline))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark-uri pentru încărcare, filtre și grafice")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numărul de rânduri al exporturilor")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetări pentru cazurile rapide (se păstrează minimul)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directorul exporturilor sintetice")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="Fișierul JSONL cu istoricul rezultatelor")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Creșterea relativă acceptată")
+    parser.add_argument("--no-record", action="store_true", help="Nu adăuga rezultatele în istoric")
+    args = parser.parse_args(argv)
+
+    history = read_history(args.history)
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    common = {'timestamp': timestamp, 'commit': _git_commit(), 'host': platform.node(), 'python': platform.python_version()}
+
+    records = []
+    for rows in args.sizes:
+        print(f"== {rows:,} rânduri")
+        for case, seconds in run_size(rows, args.data_dir, args.repeats).items():
+            print(f"  {case:<26} {seconds * 1000:>10.1f} ms")
+            records.append({**common, 'rows': rows, 'case': case, 'seconds': seconds})
+
+    regressions = find_regressions(records, history, tolerance=args.tolerance)
+    if not args.no_record:
+        append_history(args.history, records)
+
+    for rows, case, seconds, baseline in regressions:
+        print(f"REGRESIE {case} ({rows:,} rânduri): {seconds * 1000:.1f} ms față de mediana {baseline * 1000:.1f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
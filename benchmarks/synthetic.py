@@ -0,0 +1,91 @@
+"""
+Generator de exporturi sintetice cu forma LaData.xlsx / Perioada.xlsx
+
+Fișierele sunt scrise o singură dată (openpyxl în mod write-only) și
+reutilizate la rulările următoare ale benchmark-urilor.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from openpyxl import Workbook
+
+N_GESTIUNI = 12
+N_GRUPE = 60
+N_PRODUSE = 5000
+N_FURNIZORI = 80
+N_PRODUCATORI = 40
+
+
+def _names(prefix, count):
+    return np.array([f"{prefix} {i}" for i in range(count)], dtype=object)
+
+
+def la_data_columns(rows, seed=0):
+    """Coloanele unui export Balanță la dată cu `rows` rânduri"""
+    rng = np.random.default_rng(seed)
+    produse = rng.integers(0, N_PRODUSE, rows)
+    stoc = rng.integers(0, 500, rows).astype(float)
+    pret = rng.random(rows) * 200
+    return {
+        'DenumireGest': _names("Gestiune", N_GESTIUNI)[rng.integers(0, N_GESTIUNI, rows)],
+        'Grupa': _names("Grupa", N_GRUPE)[produse % N_GRUPE],
+        'Denumire': _names("Produs", N_PRODUSE)[produse],
+        'UM': np.where(produse % 3 == 0, "kg", "buc").astype(object),
+        'Stoc final': stoc,
+        'ValoareStocFinal': np.round(stoc * pret, 2),
+        'ValoareVanzare': np.round(stoc * pret * 1.3, 2),
+    }
+
+
+def perioada_columns(rows, seed=1):
+    """Coloanele unui export Balanță pe perioadă cu `rows` rânduri"""
+    rng = np.random.default_rng(seed)
+    produse = rng.integers(0, N_PRODUSE, rows)
+    stoc = rng.integers(0, 500, rows).astype(float)
+    return {
+        'Denumire gestiune': _names("Gestiune", N_GESTIUNI)[rng.integers(0, N_GESTIUNI, rows)],
+        'Denumire': _names("Produs", N_PRODUSE)[produse],
+        'Furnizor IN': _names("Furnizor", N_FURNIZORI)[produse % N_FURNIZORI],
+        'Producator': _names("Producator", N_PRODUCATORI)[produse % N_PRODUCATORI],
+        'Stoc final': stoc,
+        'Pret vanzare': np.round(rng.random(rows) * 200, 2),
+        'Valoare intrare': np.round(stoc * rng.random(rows) * 150, 2),
+        'ZileVechime': rng.integers(0, 720, rows),
+    }
+
+
+def write_workbook(path, columns):
+    """Scrie coloanele într-un fișier xlsx (o singură foaie, cu antet)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp.xlsx")
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(columns))
+    arrays = [values.tolist() for values in columns.values()]
+    for row in zip(*arrays):
+        sheet.append(row)
+    workbook.save(tmp_path)
+    tmp_path.replace(path)
+    return path
+
+
+def ensure_workbooks(directory, rows):
+    """
+    Returnează căile exporturilor sintetice pentru `rows` rânduri, generându-le dacă lipsesc
+
+    Returns:
+        Dicționar cheie DATA_PATHS -> cale
+    """
+    directory = Path(directory)
+    paths = {
+        'balanta_la_data': directory / f"LaData_{rows}.xlsx",
+        'balanta_perioada': directory / f"Perioada_{rows}.xlsx",
+    }
+    builders = {'balanta_la_data': la_data_columns, 'balanta_perioada': perioada_columns}
+    for key, path in paths.items():
+        if not path.exists():
+            write_workbook(path, builders[key](rows))
+    return paths
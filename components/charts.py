@@ -0,0 +1,269 @@
+# components/charts.py
+"""
+Componente pentru graficele din paginile de stocuri
+"""
+
+import plotly.graph_objects as go
+
+from utils.aggregations import treemap_nodes
+
+
+def stock_donut_figure(view, title, um="buc", center_label="Total Stoc"):
+    """
+    Donut cu stocul final pe gestiuni pentru rândurile selectate
+
+    Args:
+        view: FrameView-ul (sau DataFrame-ul) filtrat, cu DenumireGest și Stoc final
+        title: Titlul graficului
+        um: Unitatea de măsură afișată
+        center_label: Eticheta totalului din centrul graficului
+
+    Returns:
+        go.Figure sau None dacă nicio gestiune nu are stoc
+    """
+    # Grupare după gestiune și sumarea stocurilor
+    stoc_pe_gestiune = view.group_sum('DenumireGest', 'Stoc final').reset_index()
+    stoc_pe_gestiune = stoc_pe_gestiune[stoc_pe_gestiune['Stoc final'] > 0]  # Doar gestiunile cu stoc
+    if stoc_pe_gestiune.empty:
+        return None
+
+    # Calculare total pentru centru
+    total_stoc = stoc_pe_gestiune['Stoc final'].sum()
+
+    fig = go.Figure(data=[go.Pie(
+        labels=stoc_pe_gestiune['DenumireGest'],
+        values=stoc_pe_gestiune['Stoc final'],
+        hole=0.4,  # Crează gaura din mijloc pentru donut
+        textinfo='label+value',
+        texttemplate=f'%{{label}}<br>%{{value}} {um}',
+        textposition='outside',
+        hovertemplate=f'<b>%{{label}}</b><br>Stoc: %{{value}} {um}<extra></extra>'
+    )])
+
+    # Adăugare text în centru cu totalul
+    fig.add_annotation(
+        text=f"<b>{center_label}<br>{total_stoc:,.0f} {um}</b>",
+        x=0.5, y=0.5,
+        font_size=16,
+        showarrow=False
+    )
+
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        height=500,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05
+        )
+    )
+    return fig
+
+
+def stock_treemap_figure(cube, max_depth=2):
+    """
+    Treemap ierarhic Total → Gestiuni → Grupe, citit direct din cubul de stoc
+
+    Args:
+        cube: Cubul construit de utils.aggregations.build_stock_cube
+        max_depth: Adâncimea maximă a nodurilor afișate
+    """
+    df_treemap = treemap_nodes(cube, max_depth=max_depth)
+
+    fig = go.Figure(go.Treemap(
+        ids=df_treemap['ids'],
+        labels=df_treemap['labels'],
+        parents=df_treemap['parents'],
+        values=df_treemap['ValoareStocFinal'],
+        customdata=df_treemap['ValoareVanzare'],
+        branchvalues="total",
+        maxdepth=3,
+        textinfo="label+value",
+        texttemplate="<b>%{label}</b><br>Total_Stoc: %{value:,.0f}<br>Total_Vânzare: %{customdata:,.0f}",
+        hovertemplate='<b>%{label}</b><br>' +
+                     'Stoc Final: %{value:,.0f} RON<br>' +
+                     'Vânzare: %{customdata:,.0f} RON<extra></extra>',
+        textposition="middle center",
+        textfont_size=11,
+        pathbar_textfont_size=12,
+        marker_line_width=2,
+        marker_line_color="white"
+    ))
+
+    # Layout optimizat pentru treemap
+    fig.update_layout(
+        height=700,
+        title="Analiză Treemap: Brenado For House → Gestiuni → Grupe",
+        title_x=0.5,
+        font_size=11,
+        margin=dict(t=60, l=10, r=10, b=10)
+    )
+    return fig
+
+
+def stock_ageing_figure(table, labels, dimension, top=15):
+    """
+    Bare orizontale stivuite cu valoarea stocului pe intervale de vechime
+
+    Args:
+        table: Rezultatul AgeingEngine.by (indexat după valorile dimensiunii)
+        labels: Etichetele intervalelor de vechime (coloanele din table)
+        dimension: Numele dimensiunii afișate (ex. 'Producător')
+        top: Numărul de valori cu cea mai mare valoare afișate
+
+    Returns:
+        go.Figure sau None dacă nu există stoc
+    """
+    table = table.head(top)
+    if table.empty:
+        return None
+
+    # Cele mai mari valori sus
+    table = table.iloc[::-1]
+    names = [str(value) for value in table.index]
+    fig = go.Figure([
+        go.Bar(
+            y=names,
+            x=table[label],
+            name=label,
+            orientation='h',
+            customdata=table['Vechime ponderată'],
+            hovertemplate=f'<b>%{{y}}</b><br>{label}: %{{x:,.0f}} RON<br>'
+                          'Vechime ponderată: %{customdata:.0f} zile<extra></extra>',
+        )
+        for label in labels
+    ])
+
+    fig.update_layout(
+        barmode='stack',
+        title=f"Vechimea stocului pe {dimension.lower()} (top {len(table)} după valoare)",
+        title_x=0.5,
+        height=max(400, 28 * len(table) + 150),
+        xaxis_title="Valoare (RON)",
+        legend_title="Vechime",
+        margin=dict(l=10, r=10),
+    )
+    return fig
+
+
+def top_ranking_figure(table, entity, metric, title, max_bars=30):
+    """
+    Bare orizontale pentru un clasament Top-N
+
+    Args:
+        table: Rezultatul TopNEngine.top (deja ordonat descrescător)
+        entity: Coloana entității clasate (ex. 'Denumire')
+        metric: Coloana după care s-a făcut clasamentul
+        title: Titlul graficului
+        max_bars: Numărul maxim de poziții afișate
+
+    Returns:
+        go.Figure sau None dacă clasamentul este gol
+    """
+    table = table.head(max_bars)
+    if table.empty:
+        return None
+
+    # Primul loc sus
+    table = table.iloc[::-1]
+    unit = "RON" if metric == 'Valoare' else ""
+    fig = go.Figure(go.Bar(
+        y=[str(value) for value in table[entity]],
+        x=table[metric],
+        orientation='h',
+        customdata=table['Pondere (%)'],
+        hovertemplate=f'<b>%{{y}}</b><br>{metric}: %{{x:,.0f}} {unit}<br>'
+                      'Pondere: %{customdata:.1f}%<extra></extra>',
+    ))
+
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        height=max(400, 24 * len(table) + 150),
+        xaxis_title=f"{metric} {unit}".strip(),
+        margin=dict(l=10, r=10),
+    )
+    return fig
+
+
+def sales_trend_figure(rollup, metric, title):
+    """
+    Bare cu evoluția unei metrici pe perioade (zi, săptămână, lună)
+
+    Args:
+        rollup: Rezultatul DateIndex.rollup (indexat după începutul perioadei)
+        metric: Coloana afișată (ex. 'Valoare')
+        title: Titlul graficului
+
+    Returns:
+        go.Figure sau None dacă nu există perioade sau metrica lipsește
+    """
+    if rollup.empty or metric not in rollup.columns:
+        return None
+
+    unit = "RON" if metric == 'Valoare' else ""
+    fig = go.Figure(go.Bar(
+        x=rollup.index,
+        y=rollup[metric],
+        customdata=rollup['randuri'],
+        hovertemplate=f'<b>%{{x|%d.%m.%Y}}</b><br>{metric}: %{{y:,.0f}} {unit}<br>'
+                      'Rânduri: %{customdata:,.0f}<extra></extra>',
+    ))
+
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        height=400,
+        yaxis_title=f"{metric} {unit}".strip(),
+        margin=dict(l=10, r=10),
+    )
+    return fig
+
+
+def overdue_exposure_figure(table, labels, partner, top=15):
+    """
+    Bare orizontale stivuite cu soldul partenerilor pe intervale de întârziere
+
+    Args:
+        table: Rezultatul DueAgeingEngine.exposure (indexat după partener)
+        labels: Etichetele intervalelor (coloanele din table)
+        partner: Numele coloanei partenerului (ex. 'Client')
+        top: Numărul de parteneri afișați
+
+    Returns:
+        go.Figure sau None dacă nu există solduri
+    """
+    table = table.head(top)
+    if table.empty:
+        return None
+
+    # Cele mai mari restanțe sus
+    table = table.iloc[::-1]
+    names = [str(value) for value in table.index]
+    fig = go.Figure([
+        go.Bar(
+            y=names,
+            x=table[label],
+            name=label,
+            orientation='h',
+            customdata=table['Zile întârziere maxime'],
+            hovertemplate=f'<b>%{{y}}</b><br>{label}: %{{x:,.0f}} RON<br>'
+                          'Întârziere maximă: %{customdata:.0f} zile<extra></extra>',
+        )
+        for label in labels
+    ])
+
+    fig.update_layout(
+        barmode='stack',
+        title=f"Sold pe {partner.lower()} și întârziere (top {len(table)} după restant)",
+        title_x=0.5,
+        height=max(400, 28 * len(table) + 150),
+        xaxis_title="Sold (RON)",
+        legend_title="Întârziere",
+        margin=dict(l=10, r=10),
+    )
+    return fig
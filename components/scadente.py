@@ -0,0 +1,131 @@
+# components/scadente.py
+"""
+Secțiunea comună a paginilor de scadențe: facturi neîncasate, neachitate și efecte de plată
+"""
+
+import pandas as pd
+import streamlit as st
+
+from components.charts import overdue_exposure_figure, sales_trend_figure
+from components.sidebar import render_amount_filter
+from components.tables import render_filtered_dataframe
+from config.settings import FILTER_DEFAULTS
+from utils.chart_cache import cached_figure
+from utils.date_index import ROLLUP_FREQUENCIES
+from utils.profiling import span
+from utils.receivables import get_due_ageing
+
+
+def render_due_ageing(df, key, partner_label, prefix):
+    """
+    Renderează scadențele unui set de documente deschise
+
+    Toate valorile vin din motorul de scadențe (calculat o dată per versiune
+    de date): schimbarea datei de referință, a partenerilor sau a pragului de
+    sumă înseamnă doar căutări binare în tablourile precalculate.
+
+    Args:
+        df: DataFrame-ul exportului (din cache)
+        key: Cheia setului de date din DUE_DATASETS
+        partner_label: Eticheta partenerului în interfață (ex. "client")
+        prefix: Prefixul cheilor pentru widget-uri
+    """
+    scadente = get_due_ageing(df, key)
+    if not scadente.available:
+        st.info("Exportul nu conține coloanele necesare pentru scadențe.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        la_data = st.date_input("La data:", value=pd.Timestamp.today().date(), key=f"la_data_{prefix}")
+    with col2:
+        parteneri = st.multiselect(
+            f"Filtrează după {partner_label}:",
+            options=list(scadente.partners),
+            default=[],
+            key=f"partener_filter_{prefix}"
+        )
+    with col3:
+        suma_minima = render_amount_filter(
+            "Sold minim document:",
+            key=f"suma_filter_{prefix}",
+            min_value=FILTER_DEFAULTS['suma_minima'],
+            step=FILTER_DEFAULTS['suma_step']
+        )
+
+    with span("intervale scadențe", 'aggregate'):
+        intervale = scadente.buckets(la_data, parteneri, suma_minima)
+        expunere = scadente.exposure(la_data, parteneri, suma_minima)
+
+    # Metrici principale
+    sold_total = intervale['Sold'].sum()
+    restant = intervale['Sold'].iloc[1:].sum()
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Sold Total", f"{sold_total:,.0f} RON")
+    with col2:
+        st.metric("Restant", f"{restant:,.0f} RON")
+    with col3:
+        st.metric("Documente", f"{intervale['Documente'].sum():,}")
+    with col4:
+        st.metric("Documente Restante", f"{intervale['Documente'].iloc[1:].sum():,}")
+
+    if suma_minima and not parteneri:
+        # Pragul de sumă: o felie din soldurile ordonate
+        documente, sold = scadente.above(suma_minima)
+        st.caption(f"{documente:,} documente cu sold de cel puțin {suma_minima:,.0f} RON ({sold:,.0f} RON)")
+
+    st.markdown("---")
+
+    # Intervalele de întârziere
+    st.markdown("#### ⏳ Sold pe Intervale de Întârziere")
+    st.dataframe(
+        intervale.style.format({'Documente': '{:,}', 'Sold': '{:,.0f}', 'Pondere (%)': '{:.1f}%'}),
+        use_container_width=True
+    )
+
+    # Expunerea pe parteneri
+    st.markdown(f"#### 👥 Expunere pe {partner_label.capitalize()}")
+    fig = cached_figure(
+        f'expunere_{key}',
+        df,
+        {scadente.partner: parteneri},
+        lambda: overdue_exposure_figure(expunere, scadente.labels, scadente.partner),
+        options={'la_data': str(la_data), 'suma_minima': suma_minima},
+    )
+    if fig is not None:
+        with span(f"grafic expunere {key}", 'render'):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Nu există solduri pentru selecția curentă.")
+    render_filtered_dataframe(expunere.reset_index(), key=f"tabel_expunere_{prefix}")
+
+    # Calendarul scadențelor - din totalurile zilnice precalculate
+    if len(scadente.calendar):
+        st.markdown("#### 📅 Calendarul Scadențelor")
+        granularitate = st.radio(
+            "Granularitate:", list(ROLLUP_FREQUENCIES), index=2, horizontal=True, key=f"granularitate_{prefix}"
+        )
+        frecventa = ROLLUP_FREQUENCIES[granularitate]
+        fig = cached_figure(
+            f'calendar_{key}',
+            df,
+            {},
+            lambda: sales_trend_figure(
+                scadente.calendar.rollup(frecventa), scadente.amount, f"Scadențe pe {granularitate.lower()}"
+            ),
+            options={'frecventa': frecventa},
+        )
+        if fig is not None:
+            with span(f"grafic calendar {key}", 'render'):
+                st.plotly_chart(fig, use_container_width=True)
+
+    # Documentele selectate, cu zilele de întârziere la data de referință
+    st.markdown("#### 📄 Documente")
+    doar_restante = st.checkbox("Doar documentele restante", key=f"restante_{prefix}")
+    with span(f"documente {key}", 'filter'):
+        documente = scadente.documents(la_data, parteneri, suma_minima, overdue_only=doar_restante)
+        tabel = scadente.table(documente, la_data)
+    render_filtered_dataframe(tabel, key=f"tabel_documente_{prefix}")
@@ -3,13 +3,60 @@
 Componenta sidebar pentru aplicația Brenado For House
 """
 
+import pandas as pd
 import streamlit as st
 
+from utils.profiling import DEBUG_KEY, STAGES, export_profiles, profile_history
+
 def render_sidebar():
     """Renderează sidebar-ul aplicației"""
     with st.sidebar:
         st.title("🏠 Brenado For House")
         st.caption("Segmentul rezidențial")
+        st.toggle("🛠️ Panou de depanare", key=DEBUG_KEY, help="Măsoară timpii și memoria pe etape la fiecare rerun")
+
+def render_debug_panel():
+    """Renderează în sidebar timpii ultimului rerun profilat și exportul jurnalului"""
+    if not st.session_state.get(DEBUG_KEY):
+        return
+    profiles = list(profile_history())
+
+    with st.sidebar.expander("⏱️ Profilare rerun-uri", expanded=True):
+        if not profiles:
+            st.caption("Niciun rerun profilat încă.")
+            return
+
+        last = profiles[-1]
+        memory = f" · Δ memorie {last.memory_delta / 1024 ** 2:+.1f} MB" if last.memory_delta is not None else ""
+        st.caption(f"{last.label} · {last.seconds * 1000:,.0f} ms{memory}")
+
+        stages = last.stage_totals()
+        st.dataframe(
+            pd.DataFrame({
+                'Etapă': [stage for stage in STAGES if stage in stages],
+                'ms': [round(stages[stage] * 1000, 1) for stage in STAGES if stage in stages],
+            }),
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.dataframe(
+            pd.DataFrame({
+                'Interval': [item.name for item in last.spans],
+                'Etapă': [item.stage for item in last.spans],
+                'ms': [round(item.seconds * 1000, 1) for item in last.spans],
+                'Δ MB': [None if item.memory_delta is None else round(item.memory_delta / 1024 ** 2, 2) for item in last.spans],
+            }),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("CSV", export_profiles(profiles, "csv"), file_name="profilare.csv", mime="text/csv")
+        with col2:
+            st.download_button("JSON", export_profiles(profiles, "json"), file_name="profilare.json", mime="application/json")
+        if st.button("Golește jurnalul"):
+            profile_history().clear()
 
 # src/components/metrics.py
 """
@@ -50,7 +97,8 @@ Componente pentru filtrele comune în aplicația Brenado For House
 
 import streamlit as st
 import pandas as pd
-from config.settings import FILTER_DEFAULTS
+from config.settings import DATE_OPTIONS_DEFAULT, FILTER_DEFAULTS
+from utils.date_index import DateIndex
 
 def render_multiselect_filter(label, options, key, default=None):
     """
@@ -101,18 +149,49 @@ def render_date_filter(label, date_series, key):
     
     Args:
         label: Eticheta filtrului
-        date_series: Seria pandas cu datele
+        date_series: DateIndex-ul setului de date (utils.date_index.get_date_index),
+                     cu opțiunile calculate o singură dată per versiune de date,
+                     sau o serie pandas cu datele
         key: Cheia unică pentru widget
     
     Returns:
         Data selectată sau 'Toate zilele'
     """
-    # Convertește la datetime și creează opțiuni
-    date_series = pd.to_datetime(date_series, errors='coerce')
-    date_options = ["Toate zilele"] + sorted([str(date.date()) for date in date_series.dropna().unique()])
+    if isinstance(date_series, DateIndex):
+        date_options = DATE_OPTIONS_DEFAULT + date_series.options
+    else:
+        # Convertește la datetime și creează opțiuni
+        date_series = pd.to_datetime(date_series, errors='coerce')
+        date_options = DATE_OPTIONS_DEFAULT + sorted([str(date.date()) for date in date_series.dropna().unique()])
     
     return st.selectbox(label, options=date_options, key=key)
 
+def render_date_range_filter(label, date_index, key):
+    """
+    Renderează un filtru pentru un interval de zile
+    
+    Args:
+        label: Eticheta filtrului
+        date_index: DateIndex-ul setului de date
+        key: Cheia unică pentru widget
+    
+    Returns:
+        (prima zi, ultima zi) sau None când intervalul nu este complet ales
+    """
+    if not len(date_index):
+        return None
+    
+    selected = st.date_input(
+        label,
+        value=(date_index.first.date(), date_index.last.date()),
+        min_value=date_index.first.date(),
+        max_value=date_index.last.date(),
+        key=key
+    )
+    if isinstance(selected, (tuple, list)) and len(selected) == 2:
+        return tuple(selected)
+    return None
+
 def render_amount_filter(label, key, min_value=0, step=1000):
     """
     Renderează un filtru pentru sume
@@ -141,31 +220,30 @@ Componente pentru afișarea tabelelor în aplicația Brenado For House
 
 import streamlit as st
 
-def render_filtered_dataframe(df, title=None):
-    """
-    Renderează un DataFrame cu titlu opțional
-    
-    Args:
-        df: DataFrame-ul de afișat
-        title: Titlul opțional
-    """
-    if title:
-        st.subheader(f"📋 {title} ({len(df)} înregistrări)")
-    
-    st.dataframe(df, use_container_width=True)
+# Tabelul paginat este definit în components/tables.py
+from components.tables import render_filtered_dataframe
+from utils.statistics import get_statistics, stat_specs
+from utils.views import FrameView
 
 def render_statistics_for_filtered_data(df, columns_config):
     """
     Renderează statistici pentru datele filtrate
     
+    Toate cardurile se calculează împreună, într-o singură parcurgere a
+    rândurilor selectate, și sunt memoizate per versiune de date și rânduri
+    selectate (utils.statistics).
+    
     Args:
-        df: DataFrame-ul filtrat
+        df: DataFrame-ul sau FrameView-ul filtrat
         columns_config: Configurarea coloanelor pentru statistici
                        [{"column": "col_name", "label": "Label", "format": "currency/number"}]
+                       (coloana "count_rows" afișează numărul de rânduri)
     """
-    if not df.empty:
+    view = df if isinstance(df, FrameView) else FrameView(df)
+    if not view.empty:
         st.markdown("#### 📊 Statistici Date Filtrate")
         
+        stats = get_statistics(view.frame).compute(stat_specs(columns_config), view.positions)
         cols = st.columns(len(columns_config))
         
         for i, config in enumerate(columns_config):
@@ -173,22 +251,17 @@ def render_statistics_for_filtered_data(df, columns_config):
                 column_name = config["column"]
                 label = config["label"]
                 format_type = config.get("format", "number")
+                (spec,) = stat_specs([config])
                 
-                if column_name in df.columns:
-                    if format_type == "sum":
-                        value = df[column_name].sum()
-                        formatted_value = f"{value:,.0f}"
-                    elif format_type == "mean":
-                        value = df[column_name].mean()
+                if spec in stats:
+                    value = stats[spec]
+                    if format_type == "mean":
                         formatted_value = f"{value:.0f}"
                     elif format_type == "count":
-                        value = df[column_name].nunique()
                         formatted_value = f"{value}"
                     elif format_type == "currency":
-                        value = df[column_name].sum()
                         formatted_value = f"{value:,.0f} RON"
-                    else:  # number
-                        value = len(df) if column_name == "count_rows" else df[column_name].sum()
+                    else:  # sum, number
                         formatted_value = f"{value:,.0f}"
                     
                     st.metric(label, formatted_value)
@@ -1 +1,69 @@
+# components/tables.py
+"""
+Componente pentru afișarea tabelelor în aplicația Brenado For House
+"""
 
+import math
+
+import streamlit as st
+
+from config.settings import TABLE_PAGE_SIZES
+from utils.profiling import span
+from utils.views import FrameView, search_view, sort_view
+
+NO_SORT_OPTION = "Fără sortare"
+
+
+def render_filtered_dataframe(df, title=None, key=None, search_columns=None):
+    """
+    Renderează un DataFrame cu titlu opțional, paginat pe server
+
+    Căutarea și sortarea se fac pe datele din cache, iar în browser se
+    trimite doar pagina curentă, indiferent câte rânduri corespund filtrelor.
+
+    Args:
+        df: DataFrame-ul sau FrameView-ul de afișat
+        title: Titlul opțional
+        key: Prefixul cheilor pentru widget-uri; fără cheie tabelul nu este paginat
+        search_columns: Coloanele în care se caută (implicit toate coloanele text)
+    """
+    view = df if isinstance(df, FrameView) else FrameView(df)
+    with span(f"tabel {key or title or ''}".strip(), 'render'):
+        _render_table(view, title, key, search_columns)
+
+
+def _render_table(view, title, key, search_columns):
+    if title:
+        st.subheader(f"📋 {title} ({len(view)} înregistrări)")
+
+    if key is None or len(view) <= TABLE_PAGE_SIZES[0]:
+        st.dataframe(view.to_frame(), use_container_width=True)
+        return
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        search_text = st.text_input("Caută în tabel:", key=f"{key}_search")
+    with col2:
+        sort_column = st.selectbox(
+            "Sortează după:",
+            options=[NO_SORT_OPTION] + list(view.columns),
+            key=f"{key}_sort"
+        )
+    with col3:
+        descending = st.toggle("Descrescător", key=f"{key}_desc")
+    with col4:
+        page_size = st.selectbox("Rânduri/pagină", options=TABLE_PAGE_SIZES, key=f"{key}_page_size")
+
+    view = search_view(view, search_text, search_columns)
+    if sort_column != NO_SORT_OPTION:
+        view = sort_view(view, sort_column, ascending=not descending)
+
+    total_pages = max(1, math.ceil(len(view) / page_size))
+    # Fără max_value: numărul de pagini se schimbă odată cu filtrele, pagina se limitează manual
+    page = st.number_input("Pagina", min_value=1, value=1, step=1, key=f"{key}_page")
+    page = min(int(page), total_pages)
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(view))
+    st.dataframe(view.to_frame(start=start, stop=stop), use_container_width=True)
+    st.caption(f"Rândurile {start + 1 if len(view) else 0}–{stop} din {len(view):,} · pagina {page} din {total_pages}")
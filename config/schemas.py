@@ -0,0 +1,90 @@
+"""
+Schema tipurilor de date pentru fiecare export din DATA_PATHS
+
+Tipuri posibile:
+    'category' - coloane dimensiune cu valori repetitive (gestiuni, grupe, parteneri)
+    'integer'  - numere întregi, reduse la cel mai mic tip întreg posibil
+    'float32'  - cantități, unde precizia float32 este suficientă
+    'float'    - valori monetare, păstrate float64 pentru totaluri exacte
+    'datetime' - date calendaristice
+
+Coloanele care lipsesc dintr-un export sunt ignorate.
+"""
+
+DATASET_SCHEMAS = {
+    'balanta_la_data': {
+        'DenumireGest': 'category',
+        'Grupa': 'category',
+        'Denumire': 'category',
+        'UM': 'category',
+        'Stoc final': 'float32',
+        'ValoareStocFinal': 'float',
+        'ValoareVanzare': 'float',
+    },
+    'balanta_perioada': {
+        'Denumire gestiune': 'category',
+        'Grupa': 'category',
+        'Denumire': 'category',
+        'UM': 'category',
+        'Furnizor IN': 'category',
+        'Producator': 'category',
+        'Stoc final': 'float32',
+        'Pret vanzare': 'float',
+        'Valoare intrare': 'float',
+        'ZileVechime': 'integer',
+    },
+    'vanzari_zi_clienti': {
+        'Data': 'datetime',
+        'Client': 'category',
+        'Denumire': 'category',
+        'Gestiune': 'category',
+        'UM': 'category',
+        'Cantitate': 'float32',
+        'Valoare': 'float',
+    },
+    'top_produse': {
+        'Denumire': 'category',
+        'Grupa': 'category',
+        'UM': 'category',
+        'Cantitate': 'float32',
+        'Valoare': 'float',
+    },
+    'cumparari_cipd': {
+        'Data': 'datetime',
+        'Furnizor': 'category',
+        'Denumire': 'category',
+        'Gestiune': 'category',
+        'UM': 'category',
+        'Cantitate': 'float32',
+        'Valoare': 'float',
+    },
+    'cumparari_ciis': {
+        'Data': 'datetime',
+        'Furnizor': 'category',
+        'Denumire': 'category',
+        'Gestiune': 'category',
+        'UM': 'category',
+        'Cantitate': 'float32',
+        'Valoare': 'float',
+    },
+    'neachitate': {
+        'Furnizor': 'category',
+        'Data document': 'datetime',
+        'Data scadenta': 'datetime',
+        'Valoare': 'float',
+        'Rest de plata': 'float',
+    },
+    'neincasate': {
+        'Client': 'category',
+        'Data document': 'datetime',
+        'Data scadenta': 'datetime',
+        'Valoare': 'float',
+        'Rest de incasat': 'float',
+    },
+    'plati_cu_efecte': {
+        'Furnizor': 'category',
+        'Data emitere': 'datetime',
+        'Data scadenta': 'datetime',
+        'Suma': 'float',
+    },
+}
@@ -18,7 +18,7 @@ DATA_PATHS = {
     'cumparari_ciis': "data/CIIS.xlsx",
     'neachitate': "data/Neachitate.xlsx",
     'neincasate': "data/Neincasate.xlsx",
-    'plati_cu_efecte': "data/PlatiCuEfecte"
+    'plati_cu_efecte': "data/PlatiCuEfecte.xlsx"
 }
 
 # Opțiuni pentru dropdown-uri
@@ -27,6 +27,35 @@ DATE_OPTIONS_DEFAULT = ["Toate zilele"]
 
 # Configurări cache
 CACHE_TTL = 3600  # 1 oră în secunde
+CACHE_MAX_ENTRIES = 32  # numărul maxim de seturi de date păstrate în memorie
+CACHE_MAX_BYTES = 2 * 1024 ** 3  # memoria maximă estimată pentru cache (2 GB)
+
+# Numărul de selecții de filtre ale căror rezultate sunt memoizate per motor (KPI, clasamente, scadențe etc.)
+SELECTION_CACHE_SIZE = 256
+
+# Watcher pentru directorul data/ (secunde între verificări)
+WATCHER_INTERVAL = 5
+
+# Încărcarea exporturilor la pornire: "parallel", "sequential" sau None (dezactivată)
+STARTUP_INGEST_MODE = "parallel"
+INGEST_WORKERS = None  # None = numărul de nuclee
+
+# Reîncărcare incrementală: doar rândurile noi/modificate actualizează artefactele derivate
+INGEST_INCREMENTAL = True
+INCREMENTAL_MAX_CHANGE = 0.5  # fracția de rânduri modificate peste care se recalculează tot
+
+# Numărul de rânduri citite dintr-o dată din fișierele Excel
+EXCEL_CHUNK_ROWS = 50_000
+
+# Snapshot-uri generate din fișierele Excel
+SNAPSHOT_DIR = "data/.cache"
+# "parquet" (comprimat, o copie per proces) sau "arrow" (Arrow IPC memory-mapped,
+# partajat de toate replicile Streamlit de pe același server)
+SNAPSHOT_FORMAT = "parquet"
+
+# Artefacte precalculate de precompute.py (date, cub, indexuri), versionate
+ARTIFACTS_DIR = "data/artifacts"
+ARTIFACTS_KEEP = 3  # numărul de versiuni păstrate
 
 # Configurări pentru formatarea numerelor
 NUMBER_FORMAT = {
@@ -35,6 +64,26 @@ NUMBER_FORMAT = {
     'currency_symbol': 'RON'
 }
 
+# Limitele superioare (zile, inclusiv) ale intervalelor de vechime a stocului;
+# ultimul interval cuprinde tot ce depășește ultima limită
+AGEING_BUCKETS = [30, 90, 180]
+
+# Limitele superioare (zile de întârziere, inclusiv) ale intervalelor de scadență
+# pentru facturile neîncasate / neachitate și efectele de plată
+OVERDUE_BUCKETS = [30, 60, 90]
+
+# Zilele fără vânzări după care un produs aflat în stoc este considerat stoc mort
+DEAD_STOCK_DAYS = 90
+
+# Numărul maxim de figuri Plotly păstrate în cache-ul de grafice
+CHART_CACHE_MAX_ENTRIES = 128
+
+# Numărul de rerun-uri profilate păstrate per sesiune (panoul de depanare)
+PROFILE_HISTORY = 50
+
+# Configurări pentru tabele paginate (prima valoare este implicită)
+TABLE_PAGE_SIZES = [100, 500, 1000]
+
 # Configurări pentru filtre
 FILTER_DEFAULTS = {
     'suma_minima': 0,
@@ -4,25 +4,34 @@ Conține 2 subcategorii: La Dată și În Perioadă
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from utils.data_loaders import load_balanta_la_data, load_balanta_perioada
+from components.charts import stock_ageing_figure, stock_donut_figure
+from components.tables import render_filtered_dataframe
+from utils.ageing import AGEING_DIMENSIONS, get_ageing
+from utils.chart_cache import cached_figure
+from utils.data_loaders import load_balanta_la_data, load_balanta_perioada, load_vanzari_zi_clienti
+from utils.filter_index import get_filter_index
+from utils.metrics import get_metrics
+from utils.product_index import get_stock_sales
+from utils.profiling import profiled, span
 
 # Titlu pagină
 st.markdown("### 📦 Balanță Stocuri")
 
-# Tabs pentru subcategoriile Balanță Stocuri
-tab1, tab2 = st.tabs(["📅 La Data", "📊 Perioadă"])
 
-with tab1:
+# Fiecare secțiune este un fragment: interacțiunile dintr-un tab rerulează doar acel tab
+@st.fragment
+@profiled("Balanță Stocuri · La Dată")
+def render_la_data():
     st.markdown("#### 📅 Balanță Stocuri la Data")
     
     # Încărcare date
     balanta_df = load_balanta_la_data()
     
-    # Calculare metrici
-    total_valoare_vanzare = balanta_df['ValoareVanzare'].sum() if 'ValoareVanzare' in balanta_df.columns else 0
-    total_valoare_stoc_final = balanta_df['ValoareStocFinal'].sum() if 'ValoareStocFinal' in balanta_df.columns else 0
+    # Calculare metrici (KPI-uri calculate o dată per versiune de date)
+    metrici_balanta = get_metrics(balanta_df)
+    totaluri_balanta = metrici_balanta.totals()
+    total_valoare_vanzare = totaluri_balanta['valoare_vanzare']
+    total_valoare_stoc_final = totaluri_balanta['valoare_stoc']
     
     # Metrici principale
     col1, col2 = st.columns(2)
@@ -34,143 +43,149 @@ with tab1:
     
     st.markdown("---")
     
-    # Filtrare date - INTERDEPENDENTE
+    # Filtrare date - INTERDEPENDENTE (din indexul de filtrare, fără copii ale datelor)
+    index_balanta = get_filter_index(balanta_df)
+    gestiune_filter, grupa_filter, produs_filter = [], [], []
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if 'DenumireGest' in balanta_df.columns:
+        if 'DenumireGest' in index_balanta:
             gestiune_filter = st.multiselect(
                 "Filtrează după gestiune:",
-                options=balanta_df['DenumireGest'].unique(),
+                options=index_balanta.options('DenumireGest'),
                 default=[],
                 key="gestiune_filter_tab1"
             )
     
-    # Filtrare pentru grupa bazată pe gestiunea selectată
-    df_for_grupa = balanta_df.copy()
-    if 'DenumireGest' in balanta_df.columns and gestiune_filter:
-        df_for_grupa = df_for_grupa[df_for_grupa['DenumireGest'].isin(gestiune_filter)]
+    # Rândurile din gestiunile selectate
+    mask_gestiune = index_balanta.mask({'DenumireGest': gestiune_filter})
     
     with col2:
-        if 'Grupa' in balanta_df.columns:
+        if 'Grupa' in index_balanta:
             # Afișează doar grupele din gestiunile selectate
-            grupa_options = df_for_grupa['Grupa'].unique() if not df_for_grupa.empty else []
             grupa_filter = st.multiselect(
                 "Filtrează după grupă:",
-                options=grupa_options,
+                options=index_balanta.options('Grupa', mask_gestiune),
                 default=[],
                 key="grupa_filter_tab1"
             )
     
-    # Filtrare pentru produs bazată pe gestiunea și grupa selectate
-    df_for_produs = df_for_grupa.copy()
-    if 'Grupa' in balanta_df.columns and grupa_filter:
-        df_for_produs = df_for_produs[df_for_produs['Grupa'].isin(grupa_filter)]
+    # Rândurile din gestiunile și grupele selectate
+    mask_grupa = index_balanta.mask({'Grupa': grupa_filter}, base=mask_gestiune)
     
     with col3:
-        if 'Denumire' in balanta_df.columns:
+        if 'Denumire' in index_balanta:
             # Afișează doar produsele din gestiunile și grupele selectate
-            produs_options = df_for_produs['Denumire'].unique() if not df_for_produs.empty else []
             produs_filter = st.multiselect(
                 "Filtrează după produs:",
-                options=produs_options,
+                options=index_balanta.options('Denumire', mask_grupa),
                 default=[],
                 key="produs_filter_tab1"
             )
     
-    # Aplicare filtre
-    filtered_balanta = balanta_df.copy()
-    if 'DenumireGest' in balanta_df.columns and gestiune_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['DenumireGest'].isin(gestiune_filter)]
-    
-    if 'Grupa' in balanta_df.columns and grupa_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['Grupa'].isin(grupa_filter)]
-    
-    if 'Denumire' in balanta_df.columns and produs_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['Denumire'].isin(produs_filter)]
+    # Aplicare filtre - continuăm intersecția din cascadă
+    with span("filtre la dată", 'filter'):
+        mask_balanta = index_balanta.mask({'Denumire': produs_filter}, base=mask_grupa)
+        filtered_balanta = index_balanta.view(balanta_df, mask_balanta)
     
     # Tabel cu date
-    st.dataframe(filtered_balanta, use_container_width=True)
+    render_filtered_dataframe(filtered_balanta, key="tabel_balanta_tab1")
     
     # Statistici pentru datele filtrate (doar când s-au aplicat filtre)
     if not filtered_balanta.empty and (gestiune_filter or grupa_filter or produs_filter):
         st.markdown("#### 📊 Statistici Date Filtrate")
         col1, col2 = st.columns(2)
         
+        # Totalurile selecției, din sumele parțiale pe grupuri
+        totaluri_filtrate = metrici_balanta.totals({
+            'DenumireGest': gestiune_filter,
+            'Grupa': grupa_filter,
+            'Denumire': produs_filter,
+        })
+        
         with col1:
-            valoare_stoc_filtrata = filtered_balanta['ValoareStocFinal'].sum() if 'ValoareStocFinal' in filtered_balanta.columns else 0
+            valoare_stoc_filtrata = totaluri_filtrate['valoare_stoc']
             st.metric("Total Valoare Stoc", f"{valoare_stoc_filtrata:,.2f} RON")
         with col2:
-            valoare_vanzare_filtrata = filtered_balanta['ValoareVanzare'].sum() if 'ValoareVanzare' in filtered_balanta.columns else 0
+            valoare_vanzare_filtrata = totaluri_filtrate['valoare_vanzare']
             st.metric("Total Valoare Vânzare", f"{valoare_vanzare_filtrata:,.2f} RON")
     
     # Donut Chart pentru stocuri pe gestiuni (doar când se filtrează după produs)
     if produs_filter and 'Stoc final' in filtered_balanta.columns and 'DenumireGest' in filtered_balanta.columns:
         st.markdown("#### 📊 Distribuția Stocului pe Gestiuni")
         
-        # Grupare după gestiune și sumarea stocurilor
-        stoc_pe_gestiune = filtered_balanta.groupby('DenumireGest')['Stoc final'].sum().reset_index()
-        stoc_pe_gestiune = stoc_pe_gestiune[stoc_pe_gestiune['Stoc final'] > 0]  # Doar gestiunile cu stoc
+        # Figura este memoizată per (versiune date, filtre) - reutilizată la rerun-uri fără schimbări
+        fig = cached_figure(
+            'donut_stoc_gestiuni',
+            balanta_df,
+            {'DenumireGest': gestiune_filter, 'Grupa': grupa_filter, 'Denumire': produs_filter},
+            lambda: stock_donut_figure(filtered_balanta, title="Distribuția Stocului Final pe Gestiuni"),
+        )
         
-        if not stoc_pe_gestiune.empty:
-            # Calculare total pentru centru
-            total_stoc = stoc_pe_gestiune['Stoc final'].sum()
-            
-            # Crearea donut chart-ului
-            fig = go.Figure(data=[go.Pie(
-                labels=stoc_pe_gestiune['DenumireGest'],
-                values=stoc_pe_gestiune['Stoc final'],
-                hole=0.4,  # Crează gaura din mijloc pentru donut
-                textinfo='label+value',
-                texttemplate='%{label}<br>%{value} buc',
-                textposition='outside',
-                hovertemplate='<b>%{label}</b><br>Stoc: %{value} buc<extra></extra>'
-            )])
-            
-            # Adăugare text în centru cu totalul
-            fig.add_annotation(
-                text=f"<b>Total Stoc<br>{total_stoc:,.0f} buc</b>",
-                x=0.5, y=0.5,
-                font_size=16,
-                showarrow=False
-            )
-            
-            # Configurare layout
-            fig.update_layout(
-                title="Distribuția Stocului Final pe Gestiuni",
-                title_x=0.5,
-                height=500,
-                showlegend=True,
-                legend=dict(
-                    orientation="v",
-                    yanchor="middle",
-                    y=0.5,
-                    xanchor="left",
-                    x=1.05
-                )
-            )
-            
+        if fig is not None:
             # Afișare grafic
-            st.plotly_chart(fig, use_container_width=True)
+            with span("grafic donut", 'render'):
+                st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Nu există date de stoc pentru produsele filtrate.")
+    
+    # Rotația și acoperirea - din indexul comun stoc-vânzări (fără merge pe DataFrame-uri)
+    st.markdown("#### 🔄 Rotație și Acoperire")
+    legatura = get_stock_sales(balanta_df, load_vanzari_zi_clienti())
+    if legatura is None or not legatura.period_days:
+        st.info("Nu există vânzări pentru calculul rotației și acoperirii.")
+        return
+    
+    with span("rotație și acoperire", 'aggregate'):
+        # Aceeași selecție ca restul tab-ului: gestiunile în legătură, grupele și produsele prin produsele rămase
+        produse = None
+        if (grupa_filter or produs_filter) and 'Denumire' in index_balanta:
+            produse = index_balanta.options('Denumire', mask_balanta)
+        indicatori = legatura.kpis(gestiune_filter)
+        if produse is not None:
+            indicatori = indicatori[indicatori.index.isin(produse)]
+        sumar = legatura.summary(gestiune_filter, produse)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Produse cu Stoc", f"{sumar['produse_cu_stoc']:,}")
+    with col2:
+        st.metric(f"Stoc Mort (> {legatura.dead_days} zile)", f"{sumar['stoc_mort']:,}")
+    with col3:
+        st.metric("Valoare Stoc Mort", f"{sumar['valoare_stoc_mort']:,.2f} RON")
+    with col4:
+        st.metric("Acoperire Mediană", f"{sumar['acoperire_mediana']:,.0f} zile")
+    
+    st.caption(
+        f"Vânzări între {legatura.first:%d.%m.%Y} și {legatura.last:%d.%m.%Y} ({legatura.period_days} zile)"
+    )
+    
+    doar_stoc_mort = st.checkbox("Doar stocul mort", key="stoc_mort_tab1")
+    if doar_stoc_mort:
+        indicatori = indicatori[indicatori['Stoc mort']]
+    render_filtered_dataframe(indicatori.reset_index(), key="tabel_rotatie_tab1")
 
 
 
 
 
 
-with tab2:
+@st.fragment
+@profiled("Balanță Stocuri · Perioadă")
+def render_perioada():
     st.markdown("#### 📊 Balanță Stocuri pe Perioadă")
     
     # Încărcare date
     perioada_df = load_balanta_perioada()
     
-    # Calculare metrici
-    total_stoc = perioada_df['Stoc final'].sum() if 'Stoc final' in perioada_df.columns else 0
-    valoare_intrare = perioada_df['Valoare intrare'].sum() if 'Valoare intrare' in perioada_df.columns else 0
-    numar_produse = len(perioada_df)
-    vechime_medie = perioada_df['ZileVechime'].mean() if 'ZileVechime' in perioada_df.columns else 0
+    # Calculare metrici (KPI-uri calculate o dată per versiune de date)
+    metrici_perioada = get_metrics(perioada_df)
+    totaluri_perioada = metrici_perioada.totals()
+    total_stoc = totaluri_perioada['stoc']
+    valoare_intrare = totaluri_perioada['valoare_intrare']
+    numar_produse = totaluri_perioada['randuri']
+    vechime_medie = metrici_perioada.mean('zile_vechime')
     
     # Metrici principale
     col1, col2, col3, col4 = st.columns(4)
@@ -186,51 +201,105 @@ with tab2:
     
     st.markdown("---")
     
-    # Filtrare date
+    # Filtrare date (din indexul de filtrare, fără copii ale datelor)
+    index_perioada = get_filter_index(perioada_df)
+    gestiune_filter, produs_filter = [], []
     col1, col2 = st.columns(2)
     with col1:
-        if 'Denumire gestiune' in perioada_df.columns:
+        if 'Denumire gestiune' in index_perioada:
             gestiune_filter = st.multiselect(
                 "Filtrează după gestiune:",
-                options=perioada_df['Denumire gestiune'].unique(),
+                options=index_perioada.options('Denumire gestiune'),
                 default=[],
                 key="gestiune_filter_tab2"
             )
     
     with col2:
-        if 'Denumire' in perioada_df.columns:
+        if 'Denumire' in index_perioada:
             produs_filter = st.multiselect(
                 "Filtrează după produs:",
-                options=perioada_df['Denumire'].unique(),
+                options=index_perioada.options('Denumire'),
                 default=[],
                 key="produs_filter_tab2"
             )
     
     # Aplicare filtre
-    filtered_perioada = perioada_df.copy()
-    if 'Denumire gestiune' in perioada_df.columns and gestiune_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Denumire gestiune'].isin(gestiune_filter)]
-    
-    if 'Denumire' in perioada_df.columns and produs_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Denumire'].isin(produs_filter)]
+    with span("filtre perioadă", 'filter'):
+        mask_perioada = index_perioada.mask({
+            'Denumire gestiune': gestiune_filter,
+            'Denumire': produs_filter,
+        })
+        filtered_perioada = index_perioada.view(perioada_df, mask_perioada)
     
     # Tabel cu date
-    st.dataframe(filtered_perioada, use_container_width=True)
+    render_filtered_dataframe(filtered_perioada, key="tabel_perioada_tab2")
+    
+    selectie = {'Denumire gestiune': gestiune_filter, 'Denumire': produs_filter}
     
-    # Statistici pentru datele filtrate
+    # Statistici pentru datele filtrate - din sumele parțiale pe grupuri
     if not filtered_perioada.empty:
+        filtrate = metrici_perioada.totals(selectie)
         st.markdown("#### 📊 Statistici Date Filtrate")
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            stoc_filtrat = filtered_perioada['Stoc final'].sum() if 'Stoc final' in filtered_perioada.columns else 0
-            st.metric("Stoc Filtrat", f"{stoc_filtrat:,.0f} buc")
+            st.metric("Stoc Filtrat", f"{filtrate['stoc']:,.0f} buc")
         with col2:
-            valoare_filtrata = filtered_perioada['Valoare intrare'].sum() if 'Valoare intrare' in filtered_perioada.columns else 0
-            st.metric("Valoare Filtrată", f"{valoare_filtrata:,.0f} RON")
+            st.metric("Valoare Filtrată", f"{filtrate['valoare_intrare']:,.0f} RON")
         with col3:
-            produse_filtrate = len(filtered_perioada)
-            st.metric("Produse Filtrate", f"{produse_filtrate:,}")
+            st.metric("Produse Filtrate", f"{filtrate['randuri']:,}")
         with col4:
-            vechime_filtrata = filtered_perioada['ZileVechime'].mean() if 'ZileVechime' in filtered_perioada.columns else 0
-            st.metric("Vechime Medie", f"{vechime_filtrata:.0f} zile")
+            st.metric("Vechime Medie", f"{metrici_perioada.mean('zile_vechime', selectie):.0f} zile")
+    
+    # Vechimea stocului pe intervale - din sumele parțiale pe (grup, interval)
+    vechime = get_ageing(perioada_df)
+    if vechime.available and not filtered_perioada.empty:
+        st.markdown("#### ⏳ Vechimea Stocului")
+        intervale = vechime.buckets(selectie)
+        
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.metric("Vechime Ponderată cu Valoarea", f"{vechime.weighted_age(selectie):.0f} zile")
+            dimensiune = st.radio(
+                "Defalcare după:",
+                [label for label, column in AGEING_DIMENSIONS.items() if column in index_perioada],
+                horizontal=True,
+                key="vechime_dimensiune_tab2"
+            )
+        with col2:
+            st.dataframe(
+                intervale,
+                use_container_width=True,
+                column_config={
+                    'Stoc': st.column_config.NumberColumn(format="%.0f"),
+                    'Valoare': st.column_config.NumberColumn(format="%.0f RON"),
+                    'Pondere valoare (%)': st.column_config.NumberColumn(format="%.1f%%"),
+                    'Vechime ponderată': st.column_config.NumberColumn(format="%.0f zile"),
+                }
+            )
+        
+        if dimensiune:
+            fig = cached_figure(
+                'vechime_stoc',
+                perioada_df,
+                selectie,
+                lambda: stock_ageing_figure(
+                    vechime.by(AGEING_DIMENSIONS[dimensiune], selectie), vechime.labels, dimensiune
+                ),
+                options={'dimensiune': dimensiune},
+            )
+            if fig is not None:
+                with span("grafic vechime", 'render'):
+                    st.plotly_chart(fig, use_container_width=True)
+
+
+# Tabs pentru subcategoriile Balanță Stocuri - doar tab-ul deschis se calculează
+tab1, tab2 = st.tabs(["📅 La Data", "📊 Perioadă"], key="tab_balanta_stocuri", on_change="rerun")
+
+with tab1:
+    if tab1.open:
+        render_la_data()
+
+with tab2:
+    if tab2.open:
+        render_perioada()
@@ -4,25 +4,33 @@ Conține 2 subcategorii: La Dată și În Perioadă
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
+from components.charts import stock_donut_figure, stock_treemap_figure
+from components.tables import render_filtered_dataframe
+from utils.chart_cache import cached_figure
 from utils.data_loaders import load_balanta_la_data, load_balanta_perioada
+from utils.filter_index import get_filter_index
+from utils.metrics import get_metrics
+from utils.profiling import profiled, span
+from utils.aggregations import get_stock_cube, cube_totals, gestiune_summary
 
 # Titlu pagină
 st.markdown("### 📦 Balanță Stocuri")
 
-# Tabs pentru subcategoriile Balanță Stocuri
-tab1, tab2, tab3 = st.tabs(["📅 În Dată", "📊 Perioadă", "🔍 Analize Stocuri"])
 
-with tab1:
+# Fiecare secțiune este un fragment: interacțiunile dintr-un tab rerulează doar acel tab
+@st.fragment
+@profiled("Balanță Stocuri · La Dată")
+def render_la_data():
     st.markdown("#### 📅 Balanță Stocuri la Dată")
     
     # Încărcare date
     balanta_df = load_balanta_la_data()
     
-    # Calculare metrici
-    total_valoare_vanzare = balanta_df['ValoareVanzare'].sum() if 'ValoareVanzare' in balanta_df.columns else 0
-    total_valoare_stoc_final = balanta_df['ValoareStocFinal'].sum() if 'ValoareStocFinal' in balanta_df.columns else 0
+    # Calculare metrici (KPI-uri calculate o dată per versiune de date)
+    metrici_balanta = get_metrics(balanta_df)
+    totaluri_balanta = metrici_balanta.totals()
+    total_valoare_vanzare = totaluri_balanta['valoare_vanzare']
+    total_valoare_stoc_final = totaluri_balanta['valoare_stoc']
     
     # Metrici principale
     col1, col2 = st.columns(2)
@@ -34,63 +42,53 @@ with tab1:
     
     st.markdown("---")
     
-    # Filtrare date - INTERDEPENDENTE
+    # Filtrare date - INTERDEPENDENTE (din indexul de filtrare, fără copii ale datelor)
+    index_balanta = get_filter_index(balanta_df)
+    gestiune_filter, grupa_filter, produs_filter = [], [], []
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if 'DenumireGest' in balanta_df.columns:
+        if 'DenumireGest' in index_balanta:
             gestiune_filter = st.multiselect(
                 "Filtrează după gestiune:",
-                options=balanta_df['DenumireGest'].unique(),
+                options=index_balanta.options('DenumireGest'),
                 default=[],
                 key="gestiune_filter_tab1"
             )
     
-    # Filtrare pentru grupa bazată pe gestiunea selectată
-    df_for_grupa = balanta_df.copy()
-    if 'DenumireGest' in balanta_df.columns and gestiune_filter:
-        df_for_grupa = df_for_grupa[df_for_grupa['DenumireGest'].isin(gestiune_filter)]
+    # Rândurile din gestiunile selectate
+    mask_gestiune = index_balanta.mask({'DenumireGest': gestiune_filter})
     
     with col2:
-        if 'Grupa' in balanta_df.columns:
+        if 'Grupa' in index_balanta:
             # Afișează doar grupele din gestiunile selectate
-            grupa_options = df_for_grupa['Grupa'].unique() if not df_for_grupa.empty else []
             grupa_filter = st.multiselect(
                 "Filtrează după grupă:",
-                options=grupa_options,
+                options=index_balanta.options('Grupa', mask_gestiune),
                 default=[],
                 key="grupa_filter_tab1"
             )
     
-    # Filtrare pentru produs bazată pe gestiunea și grupa selectate
-    df_for_produs = df_for_grupa.copy()
-    if 'Grupa' in balanta_df.columns and grupa_filter:
-        df_for_produs = df_for_produs[df_for_produs['Grupa'].isin(grupa_filter)]
+    # Rândurile din gestiunile și grupele selectate
+    mask_grupa = index_balanta.mask({'Grupa': grupa_filter}, base=mask_gestiune)
     
     with col3:
-        if 'Denumire' in balanta_df.columns:
+        if 'Denumire' in index_balanta:
             # Afișează doar produsele din gestiunile și grupele selectate
-            produs_options = df_for_produs['Denumire'].unique() if not df_for_produs.empty else []
             produs_filter = st.multiselect(
                 "Filtrează după produs:",
-                options=produs_options,
+                options=index_balanta.options('Denumire', mask_grupa),
                 default=[],
                 key="produs_filter_tab1"
             )
     
-    # Aplicare filtre
-    filtered_balanta = balanta_df.copy()
-    if 'DenumireGest' in balanta_df.columns and gestiune_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['DenumireGest'].isin(gestiune_filter)]
-    
-    if 'Grupa' in balanta_df.columns and grupa_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['Grupa'].isin(grupa_filter)]
-    
-    if 'Denumire' in balanta_df.columns and produs_filter:
-        filtered_balanta = filtered_balanta[filtered_balanta['Denumire'].isin(produs_filter)]
+    # Aplicare filtre - continuăm intersecția din cascadă
+    with span("filtre la dată", 'filter'):
+        mask_balanta = index_balanta.mask({'Denumire': produs_filter}, base=mask_grupa)
+        filtered_balanta = index_balanta.view(balanta_df, mask_balanta)
     
     # Tabel cu date
-    st.dataframe(filtered_balanta, use_container_width=True)
+    render_filtered_dataframe(filtered_balanta, key="tabel_balanta_tab1")
 
 
     
@@ -99,89 +97,67 @@ with tab1:
         st.markdown("#### 📊 Statistici Date Filtrate")
         col1, col2 = st.columns(2)
         
+        # Totalurile selecției, din sumele parțiale pe grupuri
+        totaluri_filtrate = metrici_balanta.totals({
+            'DenumireGest': gestiune_filter,
+            'Grupa': grupa_filter,
+            'Denumire': produs_filter,
+        })
+        
         with col1:
-            valoare_stoc_filtrata = filtered_balanta['ValoareStocFinal'].sum() if 'ValoareStocFinal' in filtered_balanta.columns else 0
+            valoare_stoc_filtrata = totaluri_filtrate['valoare_stoc']
             st.metric("Total Valoare Stoc Final Filtrată", f"{valoare_stoc_filtrata:,.0f} RON")
         with col2:
-            valoare_vanzare_filtrata = filtered_balanta['ValoareVanzare'].sum() if 'ValoareVanzare' in filtered_balanta.columns else 0
+            valoare_vanzare_filtrata = totaluri_filtrate['valoare_vanzare']
             st.metric("Total Valoare Vânzare Filtrată", f"{valoare_vanzare_filtrata:,.0f} RON")
     
     # Donut Chart pentru stocuri pe gestiuni (doar când se filtrează după produs)
     if produs_filter and 'Stoc final' in filtered_balanta.columns and 'DenumireGest' in filtered_balanta.columns:
         st.markdown("#### 📊 Distribuția Stocului pe Gestiuni")
         
-        # Grupare după gestiune și sumarea stocurilor
-        stoc_pe_gestiune = filtered_balanta.groupby('DenumireGest')['Stoc final'].sum().reset_index()
-        stoc_pe_gestiune = stoc_pe_gestiune[stoc_pe_gestiune['Stoc final'] > 0]  # Doar gestiunile cu stoc
+        # Extragerea unității de măsură pentru produsul selectat
+        um_produs = filtered_balanta.first('UM', "unități")
         
-        if not stoc_pe_gestiune.empty:
-            # Calculare total pentru centru
-            total_stoc = stoc_pe_gestiune['Stoc final'].sum()
-            
-            # Extragerea unității de măsură pentru produsul selectat
-            if 'UM' in filtered_balanta.columns:
-                um_produs = filtered_balanta['UM'].iloc[0] if not filtered_balanta.empty else "unități"
-            else:
-                um_produs = "unități"
-            
-            # Numele produsului pentru label central
-            nume_produs = produs_filter[0] if len(produs_filter) == 1 else "Produse Selectate"
-            
-            # Crearea donut chart-ului
-            fig = go.Figure(data=[go.Pie(
-                labels=stoc_pe_gestiune['DenumireGest'],
-                values=stoc_pe_gestiune['Stoc final'],
-                hole=0.4,  # Crează gaura din mijloc pentru donut
-                textinfo='label+value',
-                texttemplate=f'%{{label}}<br>%{{value}} {um_produs}',
-                textposition='outside',
-                hovertemplate=f'<b>%{{label}}</b><br>Stoc: %{{value}} {um_produs}<extra></extra>'
-            )])
-            
-            # Adăugare text în centru cu totalul - DINAMIC
-            fig.add_annotation(
-                text=f"<b>Stoc total:<br>{total_stoc:,.0f} {um_produs}</b>",
-                x=0.5, y=0.5,
-                font_size=16,
-                showarrow=False
-            )
-            
-            # Configurare layout
-            fig.update_layout(
+        # Numele produsului pentru label central
+        nume_produs = produs_filter[0] if len(produs_filter) == 1 else "Produse Selectate"
+        
+        # Figura este memoizată per (versiune date, filtre) - reutilizată la rerun-uri fără schimbări
+        fig = cached_figure(
+            'donut_stoc_gestiuni_produs',
+            balanta_df,
+            {'DenumireGest': gestiune_filter, 'Grupa': grupa_filter, 'Denumire': produs_filter},
+            lambda: stock_donut_figure(
+                filtered_balanta,
                 title=f"Distribuția Stocului: {nume_produs} ({um_produs})",
-                title_x=0.5,
-                height=500,
-                showlegend=True,
-                legend=dict(
-                    orientation="v",
-                    yanchor="middle",
-                    y=0.5,
-                    xanchor="left",
-                    x=1.05
-                )
-            )
-            
+                um=um_produs,
+                center_label="Stoc total:",
+            ),
+        )
+        
+        if fig is not None:
             # Afișare grafic
-            st.plotly_chart(fig, use_container_width=True)
+            with span("grafic donut", 'render'):
+                st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Nu există date de stoc pentru produsele filtrate.")
 
 
 
 
-with tab2:
+@st.fragment
+@profiled("Balanță Stocuri · Perioadă")
+def render_perioada():
     st.markdown("#### 📊 Balanță Stocuri pe Perioadă")
     
     # Încărcare date
     perioada_df = load_balanta_perioada()
     
-    # Calculare metrici
-    total_valoare_intrare = perioada_df['Valoare intrare'].sum() if 'Valoare intrare' in perioada_df.columns else 0
-    # Calculare total preț vânzare = Stoc final × Preț vânzare pentru fiecare produs
-    if 'Stoc final' in perioada_df.columns and 'Pret vanzare' in perioada_df.columns:
-        total_pret_vanzare = (perioada_df['Stoc final'] * perioada_df['Pret vanzare']).sum()
-    else:
-        total_pret_vanzare = 0
+    # Calculare metrici (KPI-uri calculate o dată per versiune de date)
+    metrici_perioada = get_metrics(perioada_df)
+    totaluri_perioada = metrici_perioada.totals()
+    total_valoare_intrare = totaluri_perioada['valoare_intrare']
+    # Total preț vânzare = Stoc final × Preț vânzare pentru fiecare produs (coloană derivată pe rând)
+    total_pret_vanzare = totaluri_perioada['valoare_pret_vanzare']
     
     # Metrici principale
     col1, col2 = st.columns(2)
@@ -193,221 +169,134 @@ with tab2:
     
     st.markdown("---")
     
-    # Filtrare date
+    # Filtrare date (din indexul de filtrare, fără copii ale datelor)
+    index_perioada = get_filter_index(perioada_df)
+    gestiune_filter, produs_filter, furnizor_filter, producator_filter = [], [], [], []
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        if 'Denumire gestiune' in perioada_df.columns:
+        if 'Denumire gestiune' in index_perioada:
             gestiune_filter = st.multiselect(
                 "Filtrează după gestiune:",
-                options=perioada_df['Denumire gestiune'].unique(),
+                options=index_perioada.options('Denumire gestiune'),
                 default=[],
                 key="gestiune_filter_tab2"
             )
     
     with col2:
-        if 'Denumire' in perioada_df.columns:
+        if 'Denumire' in index_perioada:
             produs_filter = st.multiselect(
                 "Filtrează după produs:",
-                options=perioada_df['Denumire'].unique(),
+                options=index_perioada.options('Denumire'),
                 default=[],
                 key="produs_filter_tab2"
             )
     
     with col3:
-        if 'Furnizor IN' in perioada_df.columns:
+        if 'Furnizor IN' in index_perioada:
             furnizor_filter = st.multiselect(
                 "Filtrează după furnizor:",
-                options=perioada_df['Furnizor IN'].unique(),
+                options=index_perioada.options('Furnizor IN'),
                 default=[],
                 key="furnizor_filter_tab2"
             )
     
     with col4:
-        if 'Producator' in perioada_df.columns:
+        if 'Producator' in index_perioada:
             producator_filter = st.multiselect(
                 "Filtrează după producător:",
-                options=perioada_df['Producator'].unique(),
+                options=index_perioada.options('Producator'),
                 default=[],
                 key="producator_filter_tab2"
             )
     
     # Aplicare filtre
-    filtered_perioada = perioada_df.copy()
-    if 'Denumire gestiune' in perioada_df.columns and gestiune_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Denumire gestiune'].isin(gestiune_filter)]
-    
-    if 'Denumire' in perioada_df.columns and produs_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Denumire'].isin(produs_filter)]
-    
-    if 'Furnizor IN' in perioada_df.columns and furnizor_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Furnizor IN'].isin(furnizor_filter)]
-    
-    if 'Producator' in perioada_df.columns and producator_filter:
-        filtered_perioada = filtered_perioada[filtered_perioada['Producator'].isin(producator_filter)]
+    with span("filtre perioadă", 'filter'):
+        mask_perioada = index_perioada.mask({
+            'Denumire gestiune': gestiune_filter,
+            'Denumire': produs_filter,
+            'Furnizor IN': furnizor_filter,
+            'Producator': producator_filter,
+        })
+        filtered_perioada = index_perioada.view(perioada_df, mask_perioada)
     
     # Tabel cu date
-    st.dataframe(filtered_perioada, use_container_width=True)
+    render_filtered_dataframe(filtered_perioada, key="tabel_perioada_tab2")
     
     # Statistici pentru datele filtrate
     if not filtered_perioada.empty:
         st.markdown("#### 📊 Statistici Date Filtrate")
         col1, col2 = st.columns(2)
         
+        # Totalurile selecției, din sumele parțiale pe grupuri
+        totaluri_filtrate = metrici_perioada.totals({
+            'Denumire gestiune': gestiune_filter,
+            'Denumire': produs_filter,
+            'Furnizor IN': furnizor_filter,
+            'Producator': producator_filter,
+        })
+        
         with col1:
-            valoare_intrare_filtrata = filtered_perioada['Valoare intrare'].sum() if 'Valoare intrare' in filtered_perioada.columns else 0
+            valoare_intrare_filtrata = totaluri_filtrate['valoare_intrare']
             st.metric("Total Valoare Intrare Filtrată", f"{valoare_intrare_filtrata:,.0f} RON")
         with col2:
-            # Calculare total preț vânzare filtrat = Stoc final × Preț vânzare pentru datele filtrate
-            if 'Stoc final' in filtered_perioada.columns and 'Pret vanzare' in filtered_perioada.columns:
-                pret_vanzare_filtrat = (filtered_perioada['Stoc final'] * filtered_perioada['Pret vanzare']).sum()
-            else:
-                pret_vanzare_filtrat = 0
+            # Total preț vânzare filtrat = Stoc final × Preț vânzare pentru datele filtrate
+            pret_vanzare_filtrat = totaluri_filtrate['valoare_pret_vanzare']
             st.metric("Total Preț Vânzare Filtrat", f"{pret_vanzare_filtrat:,.0f} RON")
 
 
 
 
 
-with tab3:
+@st.fragment
+@profiled("Balanță Stocuri · Analize Stocuri")
+def render_analize():
     st.markdown("#### 🔍 Analize Stocuri ")
     
-    # Folosim datele și totalurile deja calculate în tab1
-    analiza_df = balanta_df.copy()  # Folosim aceleași date
+    # Aceleași date ca în tab1 (din cache); agregările vin din cubul calculat o dată per versiune de date
+    analiza_df = load_balanta_la_data()
     
     if not analiza_df.empty and all(col in analiza_df.columns for col in ['DenumireGest', 'Grupa', 'ValoareStocFinal', 'ValoareVanzare']):
         
-        # Folosim totalurile deja calculate în tab1
-        # total_valoare_stoc_general = total_valoare_stoc_final (din tab1)
-        # total_valoare_vanzare_general = total_valoare_vanzare (din tab1)
+        cube = get_stock_cube(analiza_df)
+        totaluri = cube_totals(cube)
         
-        # Metrici generale în partea de sus (folosind valorile din tab1)
+        # Metrici generale în partea de sus
         st.markdown("#### 📊 Totaluri Generale")
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Total Valoare Stoc Final", f"{total_valoare_stoc_final:,.0f} RON")
+            st.metric("Total Valoare Stoc Final", f"{totaluri['ValoareStocFinal']:,.0f} RON")
         with col2:
-            st.metric("Total Valoare Vânzare", f"{total_valoare_vanzare:,.0f} RON")
+            st.metric("Total Valoare Vânzare", f"{totaluri['ValoareVanzare']:,.0f} RON")
         
         st.markdown("---")
         
         # Vizualizare Treemap ierarhic cu ambele valori
         st.markdown("#### 🗂️ Vizualizare Treemap Ierarhic")
         
-        # Preparare date pentru Treemap ierarhic
-        import pandas as pd
-        
-        # Construire date pentru treemap cu path ierarhic
-        treemap_data = []
+        # Nodurile Total → Gestiuni → Grupe, citite direct din cub (figura memoizată per versiune de date)
+        fig = cached_figure('treemap_stoc', analiza_df, {}, lambda: stock_treemap_figure(cube, max_depth=2))
         
-        # Grupe - nivelul cel mai detaliat
-        grupe_data = analiza_df.groupby(['DenumireGest', 'Grupa']).agg({
-            'ValoareStocFinal': 'sum',
-            'ValoareVanzare': 'sum'
-        }).reset_index()
-        
-        for _, grupa in grupe_data.iterrows():
-            treemap_data.append({
-                'ids': f"{grupa['DenumireGest']}-{grupa['Grupa']}",
-                'labels': grupa['Grupa'],
-                'parents': grupa['DenumireGest'],
-                'values': grupa['ValoareStocFinal'],
-                'vanzare': grupa['ValoareVanzare'],
-                'niveau': 'grupa'
-            })
-        
-        # Gestiuni - nivelul intermediar
-        gestiuni_data = analiza_df.groupby('DenumireGest').agg({
-            'ValoareStocFinal': 'sum',
-            'ValoareVanzare': 'sum'
-        }).reset_index()
-        
-        for _, gestiune in gestiuni_data.iterrows():
-            treemap_data.append({
-                'ids': gestiune['DenumireGest'],
-                'labels': gestiune['DenumireGest'],
-                'parents': 'Brenado For House',
-                'values': gestiune['ValoareStocFinal'],
-                'vanzare': gestiune['ValoareVanzare'],
-                'niveau': 'gestiune'
-            })
-        
-        # Total - root (folosind totalurile din tab1)
-        treemap_data.append({
-            'ids': 'Brenado For House',
-            'labels': 'Brenado For House',
-            'parents': '',
-            'values': total_valoare_stoc_final,  # Din tab1
-            'vanzare': total_valoare_vanzare,    # Din tab1
-            'niveau': 'total'
-        })
-        
-        # Conversie la DataFrame
-        df_treemap = pd.DataFrame(treemap_data)
-        
-        # Crearea Treemap cu go.Figure pentru control complet
-        fig = go.Figure(go.Treemap(
-            ids=df_treemap['ids'],
-            labels=df_treemap['labels'],
-            parents=df_treemap['parents'],
-            values=df_treemap['values'],
-            customdata=df_treemap['vanzare'],
-            branchvalues="total",
-            maxdepth=3,
-            textinfo="label+value",
-            texttemplate="<b>%{label}</b><br>Total_Stoc: %{value:,.0f}<br>Total_Vânzare: %{customdata:,.0f}",
-            hovertemplate='<b>%{label}</b><br>' +
-                         'Stoc Final: %{value:,.0f} RON<br>' +
-                         'Vânzare: %{customdata:,.0f} RON<extra></extra>',
-            textposition="middle center",
-            textfont_size=11,
-            pathbar_textfont_size=12,
-            marker_line_width=2,
-            marker_line_color="white"
-        ))
-        
-        # Layout optimizat pentru treemap
-        fig.update_layout(
-            height=700,
-            title="Analiză Treemap: Brenado For House → Gestiuni → Grupe",
-            title_x=0.5,
-            font_size=11,
-            margin=dict(t=60, l=10, r=10, b=10)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        with span("grafic treemap", 'render'):
+            st.plotly_chart(fig, use_container_width=True)
 
         # Analiză detaliată pe gestiuni cu ambele valori
         st.markdown("#### 📊 Analiză Detaliată pe Gestiuni")
-        gestiuni_summary = analiza_df.groupby('DenumireGest').agg({
-            'ValoareStocFinal': 'sum',
-            'ValoareVanzare': 'sum'
-        }).reset_index()
+        gestiuni_summary_numeric = gestiune_summary(cube)[['DenumireGest', 'ValoareStocFinal', 'ValoareVanzare']]
         
-        # Păstrăm valorile numerice pentru metrici
-        gestiuni_summary_numeric = gestiuni_summary.copy()
-        
-        # Rotunjirea valorilor pentru afișare
-        gestiuni_summary['ValoareStocFinal'] = gestiuni_summary['ValoareStocFinal'].round(0).astype(int)
-        gestiuni_summary['ValoareVanzare'] = gestiuni_summary['ValoareVanzare'].round(0).astype(int)
-        
-        # Sortarea înainte de formatare (pe valori numerice)
-        gestiuni_summary = gestiuni_summary.sort_values('ValoareStocFinal', ascending=False)
-        gestiuni_summary_numeric = gestiuni_summary_numeric.sort_values('ValoareStocFinal', ascending=False)
-        
-        # Formatarea cu separatoare de mii după sortare DOAR pentru DataFrame afișat
-        gestiuni_summary_display = gestiuni_summary.copy()
-        gestiuni_summary_display['ValoareStocFinal'] = gestiuni_summary_display['ValoareStocFinal'].apply(lambda x: f"{x:,}")
-        gestiuni_summary_display['ValoareVanzare'] = gestiuni_summary_display['ValoareVanzare'].apply(lambda x: f"{x:,}")
+        # Formatarea cu separatoare de mii DOAR pentru DataFrame afișat (sortarea vine din cub)
+        gestiuni_summary_display = gestiuni_summary_numeric.copy()
+        gestiuni_summary_display['ValoareStocFinal'] = gestiuni_summary_display['ValoareStocFinal'].round(0).astype(int).map(lambda x: f"{x:,}")
+        gestiuni_summary_display['ValoareVanzare'] = gestiuni_summary_display['ValoareVanzare'].round(0).astype(int).map(lambda x: f"{x:,}")
         
         gestiuni_summary_display.columns = ['Gestiune', 'Valoare Stoc Final', 'Valoare Vânzare']
         
         st.dataframe(gestiuni_summary_display, use_container_width=True)
         
-        # Metrici sumare - folosind valorile numerice
+        # Metrici sumare - folosind valorile numerice din cub
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            nr_gestiuni = analiza_df['DenumireGest'].nunique()
+            nr_gestiuni = len(gestiuni_summary_numeric)
             st.metric("Gestiuni", f"{nr_gestiuni}")
         
         with col2:
@@ -424,3 +313,23 @@ with tab3:
     
     else:
         st.warning("Nu sunt disponibile datele necesare pentru analiza Treemap. Verifică că fișierul conține coloanele: DenumireGest, Grupa, ValoareStocFinal, ValoareVanzare.")
+
+
+# Tabs pentru subcategoriile Balanță Stocuri - doar tab-ul deschis se calculează
+tab1, tab2, tab3 = st.tabs(
+    ["📅 În Dată", "📊 Perioadă", "🔍 Analize Stocuri"],
+    key="tab_balanta_stocuri",
+    on_change="rerun",
+)
+
+with tab1:
+    if tab1.open:
+        render_la_data()
+
+with tab2:
+    if tab2.open:
+        render_perioada()
+
+with tab3:
+    if tab3.open:
+        render_analize()
@@ -1 +1,24 @@
+"""
+Pagina Facturi Neachitate pentru aplicația Brenado For House
+Soldurile datorate furnizorilor pe intervale de întârziere, la o dată de referință
+"""
 
+import streamlit as st
+from components.scadente import render_due_ageing
+from utils.data_loaders import load_neachitate
+from utils.profiling import profiled
+
+# Titlu pagină
+st.markdown("### ❌ Facturi Neachitate")
+
+
+@st.fragment
+@profiled("Facturi Neachitate")
+def render_neachitate():
+    # Încărcare date
+    neachitate_df = load_neachitate()
+
+    render_due_ageing(neachitate_df, 'neachitate', "furnizor", prefix="neachitate")
+
+
+render_neachitate()
@@ -1 +1,24 @@
+"""
+Pagina Facturi Neîncasate pentru aplicația Brenado For House
+Soldurile clienților pe intervale de întârziere, la o dată de referință
+"""
 
+import streamlit as st
+from components.scadente import render_due_ageing
+from utils.data_loaders import load_neincasate
+from utils.profiling import profiled
+
+# Titlu pagină
+st.markdown("### 📥 Facturi Neîncasate")
+
+
+@st.fragment
+@profiled("Facturi Neîncasate")
+def render_neincasate():
+    # Încărcare date
+    neincasate_df = load_neincasate()
+
+    render_due_ageing(neincasate_df, 'neincasate', "client", prefix="neincasate")
+
+
+render_neincasate()
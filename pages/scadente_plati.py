@@ -1 +1,24 @@
+"""
+Pagina Scadențe Plăți Cu Efecte pentru aplicația Brenado For House
+Efectele de plată (CEC, bilete la ordin) pe intervale de scadență, la o dată de referință
+"""
 
+import streamlit as st
+from components.scadente import render_due_ageing
+from utils.data_loaders import load_plati_cu_efecte
+from utils.profiling import profiled
+
+# Titlu pagină
+st.markdown("### ⏰ Scadențe Plăți Cu Efecte")
+
+
+@st.fragment
+@profiled("Scadențe Plăți Cu Efecte")
+def render_plati_cu_efecte():
+    # Încărcare date
+    plati_df = load_plati_cu_efecte()
+
+    render_due_ageing(plati_df, 'plati_cu_efecte', "furnizor", prefix="plati_efecte")
+
+
+render_plati_cu_efecte()
@@ -1 +1,234 @@
+"""
+Pagina Vânzări pentru aplicația Brenado For House
+Conține 2 subcategorii: Vânzări pe Zile și Clienți și Top Produse
+"""
 
+import streamlit as st
+from components.charts import sales_trend_figure, top_ranking_figure
+from components.sidebar import render_date_filter, render_date_range_filter
+from components.tables import render_filtered_dataframe
+from config.settings import DATE_OPTIONS_DEFAULT, SHOW_OPTIONS
+from utils.chart_cache import cached_figure
+from utils.data_loaders import load_top_produse, load_vanzari_zi_clienti
+from utils.date_index import ROLLUP_FREQUENCIES, get_date_index
+from utils.profiling import profiled, span
+from utils.ranking import RANKING_ENTITIES, get_ranking, show_option_limit
+
+# Titlu pagină
+st.markdown("### 📊 Vânzări")
+
+
+# Fiecare secțiune este un fragment: interacțiunile dintr-un tab rerulează doar acel tab
+@st.fragment
+@profiled("Vânzări · Zile și Clienți")
+def render_vanzari_zilnice():
+    st.markdown("#### 📅 Vânzări pe Zile și Clienți")
+
+    # Încărcare date
+    vanzari_df = load_vanzari_zi_clienti()
+
+    # Sumele pe produse și clienți (calculate o dată per versiune de date)
+    clasament = get_ranking(vanzari_df)
+    if not clasament.entities or not clasament.metrics:
+        st.info("Exportul de vânzări nu conține coloanele necesare pentru clasament.")
+        return
+
+    totaluri = clasament.summary()
+    # Criteriul clasamentului (Valoare când exportul o conține)
+    metrica = clasament.metrics[0]
+    unitate = "RON" if metrica == 'Valoare' else ""
+    
+    # Zilele ordonate, cu offset-uri și totaluri zilnice (calculate o dată per versiune de date)
+    index_date = get_date_index(vanzari_df)
+
+    # Metrici principale
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Valoare Vânzări", f"{totaluri.get('Valoare', 0):,.0f} RON")
+    with col2:
+        st.metric("Cantitate", f"{totaluri.get('Cantitate', 0):,.0f}")
+    with col3:
+        st.metric("Produse", f"{totaluri.get('Denumire', 0):,}")
+    with col4:
+        st.metric("Clienți", f"{totaluri.get('Client', 0):,}")
+
+    st.markdown("---")
+
+    # Filtrare după zi și clienți (din sumele parțiale precalculate)
+    zile, clienti = [], []
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        if 'Data' in clasament.partitions:
+            zi = render_date_filter("Selectează ziua:", index_date, key="zi_filter_tab1")
+            if zi != DATE_OPTIONS_DEFAULT[0]:
+                zile = index_date.values(zi)
+
+    with col2:
+        if 'Client' in clasament.partitions:
+            # Doar clienții cu vânzări în ziua selectată
+            clienti = st.multiselect(
+                "Filtrează după client:",
+                options=clasament.options('Client', {'Data': zile}),
+                default=[],
+                key="client_filter_tab1"
+            )
+
+    with col3:
+        optiune_top = st.selectbox("Afișează:", options=SHOW_OPTIONS, key="top_filter_tab1")
+
+    with col4:
+        entitati = {label: column for label, column in RANKING_ENTITIES.items() if column in clasament.entities}
+        entitate = st.radio("Clasament:", list(entitati), horizontal=True, key="entitate_filter_tab1")
+
+    selectie = {'Data': zile, 'Client': clienti}
+    coloana = entitati[entitate]
+    limita = show_option_limit(optiune_top)
+
+    # Clasamentul: selecție parțială din totalurile selecției
+    with span("clasament vânzări", 'aggregate'):
+        top = clasament.top(coloana, limita, metric=metrica, filters=selectie)
+
+    # Statistici pentru selecție (doar când s-au aplicat filtre)
+    if zile or clienti:
+        filtrate = clasament.summary(selectie)
+        st.markdown("#### 📊 Statistici Date Filtrate")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric(f"{metrica} Filtrată", f"{filtrate[metrica]:,.0f} {unitate}".strip())
+        with col2:
+            st.metric("Produse Vândute", f"{filtrate.get('Denumire', 0):,}")
+        with col3:
+            st.metric("Clienți", f"{filtrate.get('Client', 0):,}")
+
+    # Tabel cu clasamentul
+    titlu = f"Top {limita} {entitate.lower()}" if limita else f"{entitate} - toate"
+    titlu = f"{titlu} după {metrica.lower()}"
+    render_filtered_dataframe(top, title=titlu, key="tabel_top_tab1")
+
+    # Grafic - memoizat per (versiune date, filtre, clasament)
+    fig = cached_figure(
+        'top_vanzari',
+        vanzari_df,
+        selectie,
+        lambda: top_ranking_figure(top, coloana, metrica, titlu),
+        options={'entitate': coloana, 'limita': limita, 'metrica': metrica},
+    )
+    if fig is not None:
+        with span("grafic top vânzări", 'render'):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Nu există vânzări pentru selecția curentă.")
+    
+    # Evoluția vânzărilor - din totalurile zilnice precalculate
+    if len(index_date):
+        st.markdown("#### 📈 Evoluția Vânzărilor")
+        col1, col2, col3 = st.columns([2, 2, 1])
+        
+        with col1:
+            interval = render_date_range_filter("Interval:", index_date, key="interval_filter_tab1")
+        with col2:
+            granularitate = st.radio(
+                "Granularitate:", list(ROLLUP_FREQUENCIES), horizontal=True, key="granularitate_filter_tab1"
+            )
+        
+        start, end = interval or (None, None)
+        with col3:
+            # Totalul intervalului: diferența a două sume cumulative
+            st.metric(f"{metrica} Interval", f"{index_date.totals(start, end).get(metrica, 0):,.0f} {unitate}".strip())
+        
+        frecventa = ROLLUP_FREQUENCIES[granularitate]
+        fig = cached_figure(
+            'evolutie_vanzari',
+            vanzari_df,
+            {},
+            lambda: sales_trend_figure(
+                index_date.rollup(frecventa, start, end), metrica, f"Vânzări pe {granularitate.lower()}"
+            ),
+            options={'frecventa': frecventa, 'interval': (str(start), str(end)), 'metrica': metrica},
+        )
+        if fig is not None:
+            with span("grafic evoluție vânzări", 'render'):
+                st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+@profiled("Vânzări · Top Produse")
+def render_top_produse():
+    st.markdown("#### 🏆 Top Produse")
+
+    # Încărcare date
+    produse_df = load_top_produse()
+
+    clasament = get_ranking(produse_df)
+    if 'Denumire' not in clasament.entities or not clasament.metrics:
+        st.info("Exportul Top produse nu conține coloanele necesare pentru clasament.")
+        return
+
+    totaluri = clasament.summary()
+
+    # Metrici principale
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Valoare Vânzări", f"{totaluri.get('Valoare', 0):,.0f} RON")
+    with col2:
+        st.metric("Cantitate", f"{totaluri.get('Cantitate', 0):,.0f}")
+    with col3:
+        st.metric("Produse", f"{totaluri.get('Denumire', 0):,}")
+
+    st.markdown("---")
+
+    grupa_filter = []
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if 'Grupa' in clasament.partitions:
+            grupa_filter = st.multiselect(
+                "Filtrează după grupă:",
+                options=clasament.options('Grupa'),
+                default=[],
+                key="grupa_filter_tab2"
+            )
+
+    with col2:
+        optiune_top = st.selectbox("Afișează:", options=SHOW_OPTIONS, key="top_filter_tab2")
+
+    with col3:
+        criteriu = st.radio("Clasează după:", clasament.metrics, horizontal=True, key="criteriu_filter_tab2")
+
+    selectie = {'Grupa': grupa_filter}
+    limita = show_option_limit(optiune_top)
+
+    with span("clasament produse", 'aggregate'):
+        top = clasament.top('Denumire', limita, metric=criteriu, filters=selectie)
+
+    # Tabel cu clasamentul
+    render_filtered_dataframe(top, title=f"{optiune_top} după {criteriu.lower()}", key="tabel_top_tab2")
+
+    fig = cached_figure(
+        'top_produse',
+        produse_df,
+        selectie,
+        lambda: top_ranking_figure(top, 'Denumire', criteriu, f"{optiune_top} după {criteriu.lower()}"),
+        options={'criteriu': criteriu, 'limita': limita},
+    )
+    if fig is not None:
+        with span("grafic top produse", 'render'):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Nu există produse pentru selecția curentă.")
+
+
+# Tabs pentru subcategoriile Vânzări - doar tab-ul deschis se calculează
+tab1, tab2 = st.tabs(["📅 Zile și Clienți", "🏆 Top Produse"], key="tab_vanzari", on_change="rerun")
+
+with tab1:
+    if tab1.open:
+        render_vanzari_zilnice()
+
+with tab2:
+    if tab2.open:
+        render_top_produse()
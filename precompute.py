@@ -0,0 +1,72 @@
+"""
+Precalculează artefactele dashboard-ului în afara aplicației Streamlit
+
+Citește toate exporturile din DATA_PATHS (prin snapshot-urile Parquet),
+construiește indexurile de filtrare și cubul de stoc și le publică într-o
+nouă versiune din ARTIFACTS_DIR. Aplicația încarcă apoi direct aceste
+artefacte (memory-mapped), fără parsare la primul click. Cu --keys se
+reconstruiesc doar seturile cerute; celelalte sunt preluate din versiunea
+activă.
+
+Utilizare (de exemplu din cron, imediat după exportul din ERP):
+    python precompute.py
+    python precompute.py --keys balanta_la_data balanta_perioada --sequential
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from config.settings import ARTIFACTS_DIR, DATA_PATHS
+from utils.aggregations import build_stock_cube
+from utils.artifacts import publish_artifacts
+from utils.data_loaders import load_dataset_cached
+from utils.filter_index import FilterIndex
+from utils.ingest import ingest_all
+
+# Seturile de date pentru care se precalculează cubul de stoc (folosit de Treemap)
+CUBE_DATASETS = ('balanta_la_data',)
+
+
+def build_dataset_artifacts(key):
+    """Datele tipizate și artefactele derivate pentru un set de date"""
+    df = load_dataset_cached(key)
+    return {
+        'source': DATA_PATHS[key],
+        'frame': df,
+        'filter_index': FilterIndex(df),
+        'stock_cube': build_stock_cube(df) if key in CUBE_DATASETS else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precalculează artefactele pentru dashboard")
+    parser.add_argument("--keys", nargs="+", choices=list(DATA_PATHS), help="Seturile de date (implicit toate)")
+    parser.add_argument("--output", default=ARTIFACTS_DIR, help="Directorul de artefacte")
+    parser.add_argument("--sequential", action="store_true", help="Parsează exporturile pe rând, nu în paralel")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    start = time.perf_counter()
+
+    report = ingest_all(args.keys, parallel=not args.sequential)
+    ready = [result['key'] for result in report['files'] if result['status'] in ('parsat', 'snapshot')]
+    for result in report['files']:
+        if result['key'] not in ready:
+            print(f"{result['key']}: {result['status']} {result.get('error', '')}".rstrip())
+    if not ready:
+        print("Niciun export disponibil - artefactele nu au fost actualizate")
+        return 1
+
+    datasets = {key: build_dataset_artifacts(key) for key in ready}
+    manifest = publish_artifacts(datasets, args.output)
+
+    print(f"Versiunea {manifest['version']} publicată în {args.output} ({time.perf_counter() - start:.1f}s)")
+    for key, entry in manifest['datasets'].items():
+        print(f"  {key}: {entry['rows']:,} rânduri, fișiere: {', '.join(entry['files'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.ageing import AgeingEngine, assign_buckets, bucket_labels
+
+
+def _perioada(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Denumire gestiune': pd.Categorical(rng.choice(['G1', 'G2', 'G3'], n)),
+        'Denumire': rng.choice([f'p{i}' for i in range(40)], n),
+        'Producator': pd.Categorical(rng.choice(['P1', 'P2', None], n)),
+        'Furnizor IN': pd.Categorical(rng.choice(['F1', 'F2', 'F3', 'F4'], n)),
+        'Stoc final': rng.integers(0, 50, n).astype('float32'),
+        'Valoare intrare': rng.uniform(0, 1000, n),
+        'ZileVechime': np.where(rng.random(n) < 0.05, np.nan, rng.integers(0, 400, n)),
+    })
+
+
+def test_assign_buckets_uses_inclusive_upper_limits():
+    ages = [-3, 0, 30, 31, 90, 91, 180, 181, np.nan]
+
+    assert assign_buckets(ages, [30, 90, 180]).tolist() == [0, 0, 0, 1, 1, 2, 2, 3, -1]
+    assert bucket_labels([30, 90, 180]) == ['0–30 zile', '31–90 zile', '91–180 zile', 'peste 180 zile']
+
+
+@pytest.mark.parametrize('selections', [
+    {},
+    {'Denumire gestiune': ['G1']},
+    {'Denumire gestiune': ['G2', 'G3'], 'Furnizor IN': ['F1']},
+    {'Denumire gestiune': ['G1', 'G2'], 'Denumire': ['p1', 'p7', 'p30']},
+])
+def test_ageing_buckets_match_scan_of_filtered_rows(selections):
+    df = _perioada()
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in selections.items():
+        mask &= df[column].isin(values).to_numpy()
+    filtered = df[mask & df['ZileVechime'].notna().to_numpy()]
+    bucket = pd.cut(filtered['ZileVechime'], [-np.inf, 30, 90, 180, np.inf], labels=False)
+
+    table = AgeingEngine(df, [30, 90, 180]).buckets(selections)
+
+    expected = filtered.groupby(bucket)
+    assert table['Produse'].tolist() == expected.size().reindex(range(4), fill_value=0).tolist()
+    np.testing.assert_allclose(table['Valoare'], expected['Valoare intrare'].sum().reindex(range(4), fill_value=0))
+    np.testing.assert_allclose(table['Stoc'], expected['Stoc final'].sum().reindex(range(4), fill_value=0))
+    weighted = (filtered['ZileVechime'] * filtered['Valoare intrare']).groupby(bucket).sum()
+    np.testing.assert_allclose(
+        table['Vechime ponderată'],
+        (weighted / expected['Valoare intrare'].sum()).reindex(range(4), fill_value=0),
+    )
+    assert table['Pondere valoare (%)'].sum() == pytest.approx(100)
+
+
+@pytest.mark.parametrize('products', [[], ['p2', 'p5', 'p11', 'p20']])
+def test_ageing_breakdown_by_dimension_and_weighted_age(products):
+    df = _perioada()
+    selections = {'Denumire gestiune': ['G1', 'G3'], 'Denumire': products}
+    engine = AgeingEngine(df, [30, 90, 180])
+
+    table = engine.by('Producator', selections)
+
+    if products:
+        df = df[df['Denumire'].isin(products)]
+    rows = df[df['Denumire gestiune'].isin(['G1', 'G3']) & df['ZileVechime'].notna() & df['Producator'].notna()]
+    value = rows.groupby('Producator', observed=True)['Valoare intrare'].sum()
+    age = (rows['ZileVechime'] * rows['Valoare intrare']).groupby(rows['Producator'], observed=True).sum()
+    assert sorted(table.index) == ['P1', 'P2']
+    np.testing.assert_allclose(table['Valoare totală'], value[table.index])
+    np.testing.assert_allclose(table['Vechime ponderată'], (age / value)[table.index])
+    np.testing.assert_allclose(table[engine.labels].sum(axis=1), table['Valoare totală'])
+    assert table['Valoare totală'].is_monotonic_decreasing
+
+    aged = df[df['Denumire gestiune'].isin(['G1', 'G3']) & df['ZileVechime'].notna()]
+    expected = (aged['ZileVechime'] * aged['Valoare intrare']).sum() / aged['Valoare intrare'].sum()
+    assert engine.weighted_age(selections) == pytest.approx(expected)
+
+
+def test_ageing_results_are_memoized_and_not_shared():
+    engine = AgeingEngine(_perioada(), [30, 90, 180])
+
+    first = engine.buckets({'Furnizor IN': ['F2']})
+    first['Valoare'] = 0
+
+    assert engine.buckets({'Furnizor IN': ['F2']})['Valoare'].sum() > 0
+    assert len(engine._results) == 1
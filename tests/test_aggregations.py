@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.aggregations import build_stock_cube, cube_level, cube_totals, gestiune_summary, treemap_nodes
+
+
+def _balanta():
+    return pd.DataFrame({
+        'DenumireGest': ['G1', 'G1', 'G1', 'G2', 'G2'],
+        'Grupa': ['A', 'A', 'B', 'A', None],
+        'Denumire': ['p1', 'p2', 'p3', 'p1', 'p4'],
+        'Stoc final': [1, 2, 3, 4, 5],
+        'ValoareStocFinal': [10.0, 20.0, 30.0, 40.0, 50.0],
+        'ValoareVanzare': [15.0, 25.0, 35.0, 45.0, 55.0],
+    })
+
+
+def test_cube_levels_match_groupby_on_raw_frame():
+    df = _balanta()
+    cube = build_stock_cube(df)
+
+    totals = cube_totals(cube)
+    assert totals['ValoareStocFinal'] == df['ValoareStocFinal'].sum()
+
+    gestiuni = cube_level(cube, 1).set_index('labels')['ValoareStocFinal']
+    expected = df.groupby('DenumireGest')['ValoareStocFinal'].sum()
+    pd.testing.assert_series_equal(gestiuni.sort_index(), expected, check_names=False)
+
+    grupe = cube_level(cube, 2)
+    assert sorted(grupe['ids']) == ['G1/A', 'G1/B', 'G2/A']
+    assert set(grupe['parents']) == {'G1', 'G2'}
+
+    produse = cube_level(cube, 3)
+    assert produse.set_index('ids').loc['G1/A/p2', 'parents'] == 'G1/A'
+
+
+def test_cube_parents_always_reference_existing_nodes():
+    cube = build_stock_cube(_balanta())
+
+    assert set(cube['parents']) - {''} <= set(cube['ids'])
+    assert set(treemap_nodes(cube, 2)['depth']) == {0, 1, 2}
+
+
+def test_gestiune_summary_is_sorted_by_stock_value():
+    summary = gestiune_summary(build_stock_cube(_balanta()))
+
+    assert summary['DenumireGest'].tolist() == ['G2', 'G1']
+    assert summary['ValoareVanzare'].tolist() == [100.0, 75.0]
+
+
+def test_cube_ids_stay_unique_when_names_contain_the_separator():
+    df = pd.DataFrame({
+        'DenumireGest': ['G1', 'G1', 'G1/A', 'G1\\'],
+        'Grupa': ['A/p1', 'A', 'p1', 'A'],
+        'Denumire': ['x', 'p1/x', 'x', 'x'],
+        'Stoc final': [1, 2, 3, 4],
+        'ValoareStocFinal': [10.0, 20.0, 30.0, 40.0],
+    })
+
+    cube = build_stock_cube(df)
+
+    assert cube['ids'].is_unique
+    assert set(cube['parents']) - {''} <= set(cube['ids'])
+    produse = cube_level(cube, 3).set_index('ids')
+    assert produse.loc['G1/A\\/p1/x', 'Stoc final'] == 1
+    assert produse.loc['G1/A/p1\\/x', 'parents'] == 'G1/A'
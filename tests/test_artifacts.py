@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.aggregations import build_stock_cube
+from utils.artifacts import current_dir, load_artifacts, publish_artifacts
+from utils.filter_index import FilterIndex
+
+
+def _balanta():
+    return pd.DataFrame({
+        'DenumireGest': pd.Categorical(['G1', 'G2', 'G1', None]),
+        'Grupa': ['A', 'B', 'A', 'B'],
+        'Denumire': ['p1', 'p2', 'p3', 'p1'],
+        'Stoc final': np.array([1, 2, 3, 4], dtype='float32'),
+        'ValoareStocFinal': [10.0, 20.0, 30.0, 40.0],
+        'ValoareVanzare': [15.0, 25.0, 35.0, 45.0],
+    })
+
+
+def _publish(tmp_path, source):
+    df = _balanta()
+    return publish_artifacts({
+        'balanta_la_data': {
+            'source': source,
+            'frame': df,
+            'filter_index': FilterIndex(df),
+            'stock_cube': build_stock_cube(df),
+        },
+    }, tmp_path / "artifacts")
+
+
+def test_published_artifacts_round_trip_with_derived_state(tmp_path):
+    source = tmp_path / "LaData.xlsx"
+    source.write_bytes(b"export")
+    manifest = _publish(tmp_path, source)
+
+    df, extra = load_artifacts('balanta_la_data', source, base=tmp_path / "artifacts")
+
+    assert current_dir(tmp_path / "artifacts").name == manifest['version']
+    pd.testing.assert_frame_equal(df, _balanta())
+    index = extra['filter_index']
+    expected = FilterIndex(_balanta())
+    selection = {'DenumireGest': ['G1'], 'Grupa': ['A']}
+    np.testing.assert_array_equal(index.mask(selection), expected.mask(selection))
+    mask_b = expected.mask({'Grupa': ['B']})
+    assert index.options('Denumire', mask_b) == expected.options('Denumire', mask_b) == ['p1', 'p2']
+    pd.testing.assert_frame_equal(extra['stock_cube'], build_stock_cube(_balanta()))
+
+
+def test_artifacts_are_ignored_when_source_content_changes(tmp_path):
+    source = tmp_path / "LaData.xlsx"
+    source.write_bytes(b"export")
+    _publish(tmp_path, source)
+
+    source.write_bytes(b"export nou")
+
+    assert load_artifacts('balanta_la_data', source, base=tmp_path / "artifacts") is None
+
+
+def test_column_subset_loads_only_data(tmp_path):
+    source = tmp_path / "LaData.xlsx"
+    source.write_bytes(b"export")
+    _publish(tmp_path, source)
+
+    df, extra = load_artifacts('balanta_la_data', source, columns=['Denumire', 'Lipsa'], base=tmp_path / "artifacts")
+
+    assert list(df.columns) == ['Denumire']
+    assert extra == {}
+
+
+def test_subset_publish_keeps_other_datasets(tmp_path):
+    source = tmp_path / "LaData.xlsx"
+    source.write_bytes(b"export")
+    perioada_source = tmp_path / "Perioada.xlsx"
+    perioada_source.write_bytes(b"perioada")
+    perioada = pd.DataFrame({'Denumire gestiune': ['G1'], 'Denumire': ['p1'], 'Stoc final': [1.0]})
+    first = publish_artifacts({
+        'balanta_la_data': {'source': source, 'frame': _balanta(), 'filter_index': FilterIndex(_balanta())},
+        'balanta_perioada': {'source': perioada_source, 'frame': perioada},
+    }, tmp_path / "artifacts")
+
+    # Doar LaData se reconstruiește (ex. precompute.py --keys balanta_la_data)
+    source.write_bytes(b"export nou")
+    second = _publish(tmp_path, source)
+
+    assert second['version'] != first['version']
+    assert set(second['datasets']) == {'balanta_la_data', 'balanta_perioada'}
+    df, _ = load_artifacts('balanta_perioada', perioada_source, base=tmp_path / "artifacts")
+    pd.testing.assert_frame_equal(df, perioada)
+    df, extra = load_artifacts('balanta_la_data', source, base=tmp_path / "artifacts")
+    assert 'filter_index' in extra and 'stock_cube' in extra
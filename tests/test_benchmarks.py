@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.run import find_regressions
+
+
+def _record(seconds, host='h1', case='stock_cube'):
+    return {'host': host, 'rows': 10_000, 'case': case, 'seconds': seconds}
+
+
+def test_find_regressions_compares_with_median_of_same_host():
+    history = [_record(0.10), _record(0.30), _record(0.11), _record(1.0, host='h2')]
+
+    assert find_regressions([_record(0.12)], history) == []
+    assert find_regressions([_record(0.20)], history) == [(10_000, 'stock_cube', 0.20, 0.11)]
+
+
+def test_find_regressions_ignores_new_cases_and_tiny_deltas():
+    history = [_record(0.001)]
+
+    assert find_regressions([_record(0.004)], history) == []
+    assert find_regressions([_record(5.0, case='nou')], history) == []
+
+
+def test_single_run_parse_cases_get_a_wider_tolerance():
+    history = [_record(1.0, case='load_la_data_parse')]
+
+    assert find_regressions([_record(1.4, case='load_la_data_parse')], history) == []
+    assert find_regressions([_record(1.6, case='load_la_data_parse')], history) == [
+        (10_000, 'load_la_data_parse', 1.6, 1.0)]
+    assert find_regressions([_record(1.4, case='load_la_data_snapshot')], [_record(1.0, case='load_la_data_snapshot')])
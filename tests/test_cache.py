@@ -0,0 +1,105 @@
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.cache import DatasetCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_reuses_value_for_same_fingerprint():
+    cache = DatasetCache(ttl=60, background=False, clock=FakeClock())
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return pd.DataFrame({'a': [1]})
+
+    first = cache.get('la_data', (1, 10), loader)
+    second = cache.get('la_data', (1, 10), loader)
+
+    assert len(calls) == 1
+    assert first is second
+
+
+def test_cache_reloads_after_ttl_and_fingerprint_change():
+    clock = FakeClock()
+    cache = DatasetCache(ttl=60, background=False, clock=clock)
+    versions = iter([1, 2, 3])
+
+    def loader():
+        return next(versions)
+
+    assert cache.get('la_data', (1, 10), loader) == 1
+    clock.now = 61
+    assert cache.get('la_data', (1, 10), loader) == 2
+    assert cache.get('la_data', (2, 10), loader) == 3
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = DatasetCache(ttl=None, max_entries=2, background=False)
+    cache.get('a', 1, lambda: 'A')
+    cache.get('b', 1, lambda: 'B')
+    cache.get('a', 1, lambda: 'A')
+    cache.get('c', 1, lambda: 'C')
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+
+
+def test_cache_evicts_entries_over_memory_budget():
+    frame = pd.DataFrame({'x': range(1000)})
+    cache = DatasetCache(ttl=None, max_bytes=frame.memory_usage(deep=True).sum() + 100, background=False)
+    cache.get('a', 1, lambda: frame)
+    cache.get('b', 1, lambda: frame.copy())
+
+    assert len(cache) == 1
+    assert 'b' in cache
+
+
+def test_cache_serves_previous_value_while_new_version_loads():
+    cache = DatasetCache(ttl=None, background=True)
+    release = threading.Event()
+    cache.get('la_data', 1, lambda: 'vechi')
+
+    def slow_loader():
+        release.wait(5)
+        return 'nou'
+
+    assert cache.get('la_data', 2, slow_loader) == 'vechi'
+    release.set()
+    cache.wait(5)
+    assert cache.get('la_data', 2, slow_loader) == 'nou'
+
+
+def test_derived_locks_live_on_the_entry_and_nested_builders_do_not_block():
+    cache = DatasetCache(ttl=None, background=False)
+    frame = cache.get('stoc', 1, lambda: pd.DataFrame({'a': [1]}))
+    calls = []
+
+    def keys(df):
+        calls.append('keys')
+        return list(df.columns)
+
+    def join(df):
+        calls.append('join')
+        return cache.derived(df, 'keys', keys) + ['b']
+
+    assert cache.derived(frame, 'join', join) == ['a', 'b']
+    assert cache.derived(frame, 'join', join) == ['a', 'b']
+    assert calls == ['join', 'keys']
+    assert not any(key[0] == 'derived' for key in cache._key_locks if isinstance(key, tuple))
+
+    cache.invalidate()
+    assert cache.find(frame) is None
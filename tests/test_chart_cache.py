@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import plotly.graph_objects as go
+import plotly.tools
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.chart_cache import ChartCache, FigureSpec, normalize_filters
+
+
+def _figure():
+    return go.Figure(go.Pie(labels=['G1', 'G2'], values=[1, 2]))
+
+
+def test_normalize_filters_ignores_order_and_empty_selections():
+    assert normalize_filters({'Denumire': ['b', 'a'], 'Grupa': []}) == normalize_filters({'Denumire': ['a', 'b']})
+
+
+def test_chart_cache_builds_once_per_key_and_evicts_lru():
+    cache = ChartCache(max_entries=2)
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return _figure()
+
+    first = cache.get_or_build('a', builder)
+    assert cache.get_or_build('a', builder) is first
+    cache.get_or_build('b', builder)
+    cache.get_or_build('c', builder)
+
+    assert len(calls) == 3
+    assert len(cache) == 2
+    cache.get_or_build('a', builder)
+    assert len(calls) == 4
+
+
+def test_figure_spec_serves_plain_json_dict():
+    spec = FigureSpec(_figure())
+
+    assert isinstance(spec, go.Figure)
+    assert spec.to_dict()['data'][0]['values'] == [1, 2]
+
+
+def test_figure_spec_is_served_without_revalidation():
+    spec = FigureSpec(_figure())
+
+    # Calea folosită de st.plotly_chart: un go.Figure se citește prin to_dict(), fără validare
+    assert plotly.tools.return_figure_from_figure_or_data(spec, validate_figure=True) is spec.to_dict()
@@ -6,14 +6,28 @@ import pandas as pd
 # Ensure the project root is on the Python path when tests are executed
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from utils.data_loaders import load_balanta_la_data, load_balanta_perioada
+from config.schemas import DATASET_SCHEMAS
+from config.settings import DATA_PATHS
+from utils import data_loaders
+from utils.data_loaders import load_balanta_la_data, load_balanta_perioada, load_dataset
 
 
-def test_load_balanta_la_data_returns_placeholder(monkeypatch):
-    def mock_read_excel(*args, **kwargs):
-        raise FileNotFoundError("missing file")
+def _unreadable_export(tmp_path, monkeypatch, key):
+    """Un export existent pe disc pe care cititorul Excel nu îl poate parsa"""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "data" / Path(DATA_PATHS[key]).name
+    path.parent.mkdir()
+    path.write_bytes(b"nu este un xlsx")
+    monkeypatch.setitem(DATA_PATHS, key, str(path))
 
-    monkeypatch.setattr(pd, "read_excel", mock_read_excel)
+    def mock_read_excel_streaming(*args, **kwargs):
+        raise ValueError("export corupt")
+
+    monkeypatch.setattr(data_loaders, "read_excel_streaming", mock_read_excel_streaming)
+
+
+def test_load_balanta_la_data_returns_placeholder(tmp_path, monkeypatch):
+    _unreadable_export(tmp_path, monkeypatch, 'balanta_la_data')
 
     df = load_balanta_la_data()
     expected = pd.DataFrame({
@@ -25,11 +39,8 @@ def test_load_balanta_la_data_returns_placeholder(monkeypatch):
     pd.testing.assert_frame_equal(df, expected)
 
 
-def test_load_balanta_perioada_returns_placeholder(monkeypatch):
-    def mock_read_excel(*args, **kwargs):
-        raise FileNotFoundError("missing file")
-
-    monkeypatch.setattr(pd, "read_excel", mock_read_excel)
+def test_load_balanta_perioada_returns_placeholder(tmp_path, monkeypatch):
+    _unreadable_export(tmp_path, monkeypatch, 'balanta_perioada')
 
     df = load_balanta_perioada()
     expected = pd.DataFrame({
@@ -39,3 +50,12 @@ def test_load_balanta_perioada_returns_placeholder(monkeypatch):
         'ZileVechime': [10]
     })
     pd.testing.assert_frame_equal(df, expected)
+
+
+def test_load_dataset_returns_empty_frame_with_schema_columns_for_missing_export(monkeypatch):
+    monkeypatch.setitem(DATA_PATHS, 'neachitate', "data/lipsa/Neachitate.xlsx")
+
+    df = load_dataset('neachitate')
+
+    assert df.empty
+    assert list(df.columns) == list(DATASET_SCHEMAS['neachitate'])
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.date_index import DateIndex
+
+
+def _vanzari(n=500, seed=11):
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(rng.choice(pd.date_range('2025-01-27', periods=45), n))
+    # Unele rânduri au și oră, altele lipsesc
+    dates[rng.random(n) < 0.2] += pd.Timedelta(hours=9)
+    dates[rng.random(n) < 0.05] = pd.NaT
+    return pd.DataFrame({
+        'Data': dates,
+        'Cantitate': rng.integers(1, 10, n).astype('float32'),
+        'Valoare': rng.uniform(0, 100, n),
+    })
+
+
+def test_date_index_options_match_distinct_days():
+    df = _vanzari()
+
+    index = DateIndex(df)
+
+    expected = sorted({str(value.date()) for value in df['Data'].dropna()})
+    assert index.options == expected
+    assert len(index) == len(expected)
+    assert index.first == pd.Timestamp(expected[0]) and index.last == pd.Timestamp(expected[-1])
+
+
+@pytest.mark.parametrize('start, end', [
+    ('2025-02-03', None),
+    ('2025-02-01', '2025-02-14'),
+    (None, '2025-02-05'),
+    ('2025-01-01', '2025-01-20'),
+    (None, None),
+])
+def test_date_index_range_rows_values_and_totals(start, end):
+    df = _vanzari()
+    index = DateIndex(df)
+    days = df['Data'].dt.normalize()
+    first = pd.Timestamp(start) if start else days.min()
+    last = pd.Timestamp(end) if end else (first if start else days.max())
+    mask = (days >= first) & (days <= last)
+
+    assert sorted(index.rows(start, end)) == list(np.flatnonzero(mask))
+    assert index.values(start, end) == sorted(df.loc[mask, 'Data'].unique())
+    totals = index.totals(start, end)
+    assert totals['randuri'] == mask.sum()
+    assert totals['Valoare'] == pytest.approx(df.loc[mask, 'Valoare'].sum())
+
+
+def test_date_index_week_and_month_rollups():
+    df = _vanzari()
+    index = DateIndex(df)
+    valid = df.dropna(subset=['Data'])
+
+    weekly = index.rollup('W')
+    expected = valid.groupby(valid['Data'].dt.to_period('W').dt.start_time)['Valoare'].sum()
+    np.testing.assert_allclose(weekly['Valoare'], expected)
+    assert list(weekly.index) == list(expected.index)
+    assert index.rollup('W') is weekly
+
+    monthly = index.rollup('M', '2025-02-01', '2025-02-28')
+    february = valid[valid['Data'].dt.month == 2]
+    assert list(monthly.index) == [pd.Timestamp('2025-02-01')]
+    assert monthly['Valoare'].iloc[0] == pytest.approx(february['Valoare'].sum())
+    assert monthly['randuri'].iloc[0] == len(february)
+
+
+def test_date_index_without_date_column_is_empty():
+    index = DateIndex(pd.DataFrame({'Valoare': [1.0, 2.0]}))
+
+    assert not index.available and len(index) == 0
+    assert index.options == [] and index.values('2025-01-01') == []
+    assert index.totals()['Valoare'] == 0
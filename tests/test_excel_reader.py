@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.excel_reader import iter_excel_chunks, read_excel_streaming
+
+
+def _write_export(tmp_path, rows=25):
+    source = tmp_path / "svzc.xlsx"
+    pd.DataFrame({
+        'Client': [f"Client {i % 4}" for i in range(rows)],
+        'Data': pd.date_range("2024-01-01", periods=rows, freq="D"),
+        'Cantitate': [float(i) for i in range(rows)],
+        'Valoare': [i * 10.5 for i in range(rows)],
+    }).to_excel(source, index=False)
+    return source
+
+
+def test_iter_excel_chunks_respects_chunk_size(tmp_path):
+    source = _write_export(tmp_path)
+
+    sizes = [len(chunk) for chunk in iter_excel_chunks(source, chunk_rows=10)]
+
+    assert sizes == [10, 10, 5]
+
+
+def test_read_excel_streaming_matches_read_excel_with_schema(tmp_path):
+    source = _write_export(tmp_path)
+    schema = {'Client': 'category', 'Data': 'datetime', 'Cantitate': 'float32', 'Valoare': 'float'}
+
+    df = read_excel_streaming(source, schema, chunk_rows=7)
+    expected = pd.read_excel(source)
+
+    assert isinstance(df['Client'].dtype, pd.CategoricalDtype)
+    assert df['Client'].astype(str).tolist() == expected['Client'].tolist()
+    assert df['Cantitate'].dtype == 'float32'
+    pd.testing.assert_series_equal(df['Valoare'], expected['Valoare'])
+    assert (df['Data'] == expected['Data']).all()
+    assert df.attrs['memory_report']['rows'] == 25
+
+
+def test_read_excel_streaming_unifies_integer_types_that_differ_between_chunks(tmp_path):
+    source = tmp_path / "Perioada.xlsx"
+    # Prima bucată are doar întregi mici, a doua valori mari, a treia o valoare lipsă
+    zile = [1, 2, 3, 40000, 50000, 60000, 7, None, 9]
+    pd.DataFrame({'Denumire': list('abcdefghi'), 'ZileVechime': zile}).to_excel(source, index=False)
+
+    df = read_excel_streaming(source, {'Denumire': 'category', 'ZileVechime': 'integer'}, chunk_rows=3)
+
+    assert df['ZileVechime'].dtype == 'float32'
+    assert df['ZileVechime'].isna().tolist() == [value is None for value in zile]
+    assert df['Denumire'].astype(str).tolist() == list('abcdefghi')
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.filter_index import FilterIndex
+
+
+def _balanta():
+    return pd.DataFrame({
+        'DenumireGest': ['G1', 'G2', 'G1', None, 'G3', 'G2'],
+        'Grupa': ['A', 'B', 'B', 'A', 'C', 'A'],
+        'Denumire': ['p1', 'p2', 'p3', 'p4', 'p5', 'p1'],
+        'Stoc final': [1, 2, 3, 4, 5, 6],
+    })
+
+
+def test_filter_index_options_follow_first_appearance():
+    index = FilterIndex(_balanta())
+
+    assert index.options('DenumireGest') == ['G1', 'G2', 'G3']
+    assert index.options('Grupa') == ['A', 'B', 'C']
+
+
+def test_filter_index_cascade_matches_isin_chain():
+    df = _balanta()
+    index = FilterIndex(df)
+
+    mask_gest = index.mask({'DenumireGest': ['G1', 'G2']})
+    assert index.options('Grupa', mask_gest) == ['A', 'B']
+
+    mask_grupa = index.mask({'Grupa': ['A']}, base=mask_gest)
+    assert index.options('Denumire', mask_grupa) == ['p1']
+
+    expected = df[df['DenumireGest'].isin(['G1', 'G2']) & df['Grupa'].isin(['A'])]
+    pd.testing.assert_frame_equal(index.take(df, mask_grupa), expected)
+
+
+def test_filter_index_without_selection_returns_original_frame():
+    df = _balanta()
+    index = FilterIndex(df)
+
+    mask = index.mask({'DenumireGest': [], 'Grupa': []})
+
+    assert mask is None
+    assert index.take(df, mask) is df
+
+
+def test_filter_index_dense_and_sparse_masks_agree():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'Denumire': rng.choice([f"p{i}" for i in range(50)], 5000)})
+    index = FilterIndex(df)
+
+    for values in (['p1'], [f"p{i}" for i in range(40)], ['p1', 'lipsa']):
+        np.testing.assert_array_equal(index.value_mask('Denumire', values), df['Denumire'].isin(values).to_numpy())
@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.aggregations import build_stock_cube
+from utils.cache import CacheEntry
+from utils.date_index import DateIndex
+from utils.incremental import carry_forward, compute_delta, row_hashes
+
+
+def _balanta(rows):
+    return pd.DataFrame(rows, columns=['DenumireGest', 'Grupa', 'Denumire', 'Stoc final', 'ValoareStocFinal'])
+
+
+OLD = [('G1', 'A', 'p1', 1.0, 10.0), ('G1', 'B', 'p2', 2.0, 20.0), ('G2', 'A', 'p3', 3.0, 30.0)]
+
+
+def _sorted(cube):
+    return cube.sort_values('ids').reset_index(drop=True)
+
+
+def test_compute_delta_detects_pure_append():
+    old = row_hashes(_balanta(OLD))
+    new = row_hashes(_balanta(OLD + [('G3', 'C', 'p4', 4.0, 40.0)]))
+
+    delta = compute_delta(old, new)
+
+    assert delta.appended
+    assert delta.added.tolist() == [3]
+    assert delta.removed.size == 0
+
+
+def test_compute_delta_reports_changed_rows_as_removed_and_added():
+    changed = [OLD[0], ('G1', 'B', 'p2', 5.0, 50.0), OLD[2]]
+
+    delta = compute_delta(row_hashes(_balanta(OLD)), row_hashes(_balanta(changed)))
+
+    assert not delta.appended
+    assert delta.added.tolist() == [1]
+    assert delta.removed.tolist() == [1]
+
+
+def test_compute_delta_gives_up_on_changed_duplicate_multiplicity():
+    old = row_hashes(_balanta([OLD[0], OLD[0], OLD[1]]))
+    new = row_hashes(_balanta([OLD[0], OLD[1], OLD[2]]))
+
+    assert compute_delta(old, new) is None
+
+
+def test_carry_forward_updates_cube_like_a_rebuild():
+    old_df = _balanta(OLD)
+    new_df = _balanta([OLD[0], ('G1', 'B', 'p2', 5.0, 50.0), OLD[2], ('G3', 'C', 'p4', 4.0, 40.0)])
+    previous = CacheEntry('v1', old_df, 0.0, extra={'stock_cube': build_stock_cube(old_df), 'altul': object()})
+
+    extra = carry_forward(previous, new_df, max_change=1.0)
+
+    assert 'altul' not in extra
+    np.testing.assert_array_equal(extra['row_hashes'], row_hashes(new_df))
+    pd.testing.assert_frame_equal(_sorted(extra['stock_cube']), _sorted(build_stock_cube(new_df)))
+
+
+def test_carry_forward_rebuilds_when_a_node_disappears():
+    old_df = _balanta(OLD)
+    new_df = _balanta(OLD[:2])
+    previous = CacheEntry('v1', old_df, 0.0, extra={'stock_cube': build_stock_cube(old_df)})
+
+    extra = carry_forward(previous, new_df, max_change=1.0)
+
+    assert 'stock_cube' not in extra
+
+
+def _vanzari(n, seed):
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(rng.choice(pd.date_range('2025-01-01', periods=40, freq='13h'), n))
+    dates[rng.random(n) < 0.05] = pd.NaT
+    return pd.DataFrame({'Data': dates, 'Valoare': rng.uniform(0, 100, n), 'Cantitate': rng.integers(1, 5, n)})
+
+
+def test_carry_forward_extends_date_index_on_append():
+    old_df = _vanzari(300, 1)
+    new_df = pd.concat([old_df, _vanzari(50, 2)], ignore_index=True)
+    previous = CacheEntry('v1', old_df, 0.0, extra={'date_index': DateIndex(old_df)})
+
+    extended = carry_forward(previous, new_df, max_change=1.0)['date_index']
+
+    rebuilt = DateIndex(new_df)
+    np.testing.assert_array_equal(extended.order, rebuilt.order)
+    np.testing.assert_array_equal(extended.offsets, rebuilt.offsets)
+    assert extended.options == rebuilt.options
+    assert list(extended.values()) == list(rebuilt.values())
+    for name in rebuilt.daily:
+        np.testing.assert_allclose(extended.daily[name], rebuilt.daily[name])
+    assert extended.totals('2025-01-05', '2025-01-12') == pytest.approx(rebuilt.totals('2025-01-05', '2025-01-12'))
+
+
+def test_carry_forward_rebuilds_date_index_when_rows_change():
+    old_df = _vanzari(300, 1)
+    new_df = old_df.copy()
+    new_df.loc[3, 'Valoare'] += 1
+    previous = CacheEntry('v1', old_df, 0.0, extra={'date_index': DateIndex(old_df)})
+
+    assert 'date_index' not in carry_forward(previous, new_df, max_change=1.0)
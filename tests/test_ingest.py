@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.data_loaders import DATASET_CACHE, load_dataset_cached
+from utils.ingest import ingest_all
+
+
+def test_ingest_all_parses_once_then_reuses_snapshots(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    pd.DataFrame({'DenumireGest': ['G1', 'G2'], 'Stoc final': [1, 2]}).to_excel("data/LaData.xlsx", index=False)
+    keys = ['balanta_la_data', 'neachitate']
+
+    first = ingest_all(keys, parallel=False)
+    second = ingest_all(keys, parallel=False)
+
+    assert [(f['key'], f['status'], f['rows']) for f in first['files']] == [
+        ('balanta_la_data', 'parsat', 2), ('neachitate', 'lipsă', 0)]
+    assert second['files'][0]['status'] == 'snapshot'
+    assert first['mode'] == 'sequential' and first['seconds'] >= first['files'][0]['seconds']
+    # Cheile de produs sunt construite la ingest, nu la prima afișare a paginii
+    assert 'product_keys' in DATASET_CACHE.find(load_dataset_cached('balanta_la_data')).extra
+
+
+def test_ingest_all_parses_in_spawned_processes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    pd.DataFrame({'DenumireGest': ['G1', 'G2'], 'Stoc final': [1, 2]}).to_excel("data/LaData.xlsx", index=False)
+    pd.DataFrame({'Client': ['C1', 'C2', 'C3'], 'Valoare': [1.0, 2.0, 3.0]}).to_excel(
+        "data/Neincasate.xlsx", index=False)
+    keys = ['balanta_la_data', 'neincasate']
+
+    report = ingest_all(keys, parallel=True, max_workers=2)
+
+    assert report['mode'] == 'parallel'
+    assert [(f['key'], f['status'], f['rows']) for f in report['files']] == [
+        ('balanta_la_data', 'parsat', 2), ('neincasate', 'parsat', 3)]
+    assert all('cache_seconds' in f for f in report['files'])
+    assert [f['status'] for f in ingest_all(keys, parallel=True)['files']] == ['snapshot', 'snapshot']
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.metrics import MetricsEngine
+
+
+def _perioada():
+    return pd.DataFrame({
+        'Denumire gestiune': pd.Categorical(['G1', 'G2', 'G1', None, 'G2']),
+        'Denumire': ['p1', 'p2', 'p1', 'p3', 'p4'],
+        'Stoc final': np.array([1, 2, 3, 4, 5], dtype='float32'),
+        'Pret vanzare': [10.0, 20.0, 30.0, 40.0, np.nan],
+        'ZileVechime': [10, 20, 30, 40, 50],
+    })
+
+
+@pytest.mark.parametrize('selections', [
+    {},
+    {'Denumire gestiune': ['G1']},
+    {'Denumire gestiune': ['G2'], 'Denumire': ['p2', 'p4', 'necunoscut']},
+    {'Denumire': ['p3']},
+    {'Denumire gestiune': ['G1', 'G2'], 'Denumire': ['p1', 'p4']},
+])
+def test_metrics_totals_match_scan_of_filtered_rows(selections):
+    df = _perioada()
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in selections.items():
+        mask &= df[column].isin(values).to_numpy()
+    filtered = df[mask]
+
+    engine = MetricsEngine(df)
+    totals = engine.totals(selections)
+
+    assert totals['randuri'] == len(filtered)
+    assert totals['stoc'] == pytest.approx(filtered['Stoc final'].sum())
+    assert totals['valoare_pret_vanzare'] == pytest.approx((filtered['Stoc final'] * filtered['Pret vanzare']).sum())
+    assert totals['valoare_intrare'] == 0
+    assert engine.mean('zile_vechime', selections) == pytest.approx(filtered['ZileVechime'].mean())
+
+
+def test_metrics_partials_are_per_gestiune_not_per_product():
+    engine = MetricsEngine(_perioada())
+
+    # Grupurile sunt doar gestiunile (G1, G2, lipsă); produsele nu multiplică grupurile
+    assert engine.group_columns == ['Denumire gestiune']
+    assert engine.n_groups == 3
+
+
+def test_metrics_reject_filters_on_unindexed_columns():
+    with pytest.raises(KeyError):
+        MetricsEngine(_perioada()).totals({'Pret vanzare': [10.0]})
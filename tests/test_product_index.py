@@ -0,0 +1,134 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.cache import CacheEntry
+from utils.data_loaders import DATASET_CACHE
+from utils.product_index import ProductKeys, StockSalesJoin, get_stock_sales
+
+
+def _stoc(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'DenumireGest': pd.Categorical(rng.choice(['G1', 'G2', 'G3'], n)),
+        'Denumire': rng.choice([f'p{i}' for i in range(60)], n),
+        'Stoc final': np.where(rng.random(n) < 0.2, 0, rng.integers(1, 50, n)).astype('float32'),
+        'ValoareStocFinal': rng.uniform(0, 500, n),
+    })
+
+
+def _vanzari(n=2000, seed=4):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Data': rng.choice(pd.date_range('2025-01-01', periods=180), n),
+        'Denumire': rng.choice([f'p{i}' for i in range(20, 80)], n),
+        'Gestiune': rng.choice(['G1', 'G2', 'G4'], n),
+        'Cantitate': rng.integers(1, 5, n).astype('float32'),
+        'Valoare': rng.uniform(0, 100, n),
+    })
+
+
+def test_product_keys_row_ranges():
+    df = _stoc()
+    keys = ProductKeys(df, gestiune='DenumireGest')
+
+    assert sorted(keys.rows('p7')) == list(np.flatnonzero(df['Denumire'] == 'p7'))
+    mask = (df['Denumire'] == 'p7') & (df['DenumireGest'] == 'G2')
+    assert sorted(keys.rows('p7', 'G2')) == list(np.flatnonzero(mask))
+    assert len(keys.rows('necunoscut')) == 0 and len(keys.rows('p7', 'G9')) == 0
+
+    sums = keys.pair_sums('Stoc final')
+    expected = df.groupby(['Denumire', 'DenumireGest'], observed=True)['Stoc final'].sum()
+    pairs = list(zip(keys.products[keys.pair_products], keys.gestiuni[keys.pair_gestiuni]))
+    np.testing.assert_allclose(sums, expected.loc[pairs])
+
+
+@pytest.mark.parametrize('gestiuni', [None, ['G1'], ['G2', 'G3']])
+def test_turnover_coverage_and_dead_stock_match_pandas(gestiuni):
+    stoc, vanzari = _stoc(), _vanzari()
+    join = StockSalesJoin(stoc, vanzari, dead_days=30)
+
+    table = join.kpis(gestiuni)
+
+    if gestiuni:
+        stoc = stoc[stoc['DenumireGest'].isin(gestiuni)]
+        vanzari = vanzari[vanzari['Gestiune'].isin(gestiuni)]
+    stock = stoc.groupby('Denumire')['Stoc final'].sum()
+    sold = vanzari.groupby('Denumire')['Cantitate'].sum()
+    last_sale = vanzari.groupby('Denumire')['Data'].max()
+    products = stock.index.union(sold.index)
+    assert list(table.index) == list(products)
+
+    stock, sold = stock.reindex(products, fill_value=0), sold.reindex(products, fill_value=0)
+    np.testing.assert_allclose(table['Stoc final'], stock)
+    np.testing.assert_allclose(table['Cantitate vândută'], sold)
+    in_stock = stock > 0
+    np.testing.assert_allclose(table.loc[in_stock, 'Rotație'], (sold / stock)[in_stock])
+
+    daily = sold / 180
+    covered = in_stock & (sold > 0)
+    np.testing.assert_allclose(table.loc[covered, 'Zile acoperire'], (stock / daily)[covered])
+    assert table.loc[in_stock & (sold == 0), 'Zile acoperire'].isna().all()
+
+    idle = (pd.Timestamp('2025-06-29') - last_sale.reindex(products)).dt.days
+    np.testing.assert_allclose(table['Zile fără vânzări'], idle)
+    dead = in_stock & (idle.isna() | (idle > 30))
+    assert (table['Stoc mort'] == dead).all()
+    assert join.kpis(gestiuni) is table
+
+
+def test_summary_counts_dead_stock():
+    join = StockSalesJoin(_stoc(), _vanzari(), dead_days=30)
+    table = join.kpis()
+
+    summary = join.summary()
+
+    with_stock = table[table['Stoc final'] > 0]
+    assert summary['produse_cu_stoc'] == len(with_stock)
+    assert summary['stoc_mort'] == with_stock['Stoc mort'].sum()
+    assert summary['valoare_stoc_mort'] == pytest.approx(with_stock.loc[with_stock['Stoc mort'], 'Valoare stoc'].sum())
+    assert summary['zile_perioada'] == 180
+
+
+@pytest.mark.parametrize('vanzari', [_vanzari(), _vanzari().iloc[:0]])
+def test_no_join_without_cached_sales_export(vanzari):
+    # Exportul de vânzări lipsă: date demo (fără versiune) sau DataFrame gol
+    assert get_stock_sales(_stoc(), vanzari) is None
+
+
+def test_summary_restricted_to_selected_products():
+    join = StockSalesJoin(_stoc(), _vanzari(), dead_days=30)
+    products = [f'p{i}' for i in range(10, 40)]
+    table = join.kpis(['G1'])
+
+    summary = join.summary(['G1'], products)
+
+    with_stock = table[(table['Stoc final'] > 0) & table.index.isin(products)]
+    assert summary['produse_cu_stoc'] == len(with_stock)
+    assert summary['stoc_mort'] == with_stock['Stoc mort'].sum()
+    assert summary['acoperire_mediana'] == pytest.approx(with_stock['Zile acoperire'].median())
+    assert join.summary(['G1'], [])['produse_cu_stoc'] == 0
+
+
+def test_join_lives_in_the_stock_entry_and_follows_the_sales_version():
+    stoc, vanzari, vanzari_noi = _stoc(), _vanzari(), _vanzari(seed=5)
+    for key, version, df in [('test_stoc', 's1', stoc), ('test_vanzari', 'v1', vanzari)]:
+        DATASET_CACHE.put(key, CacheEntry(version, df, 0.0))
+    try:
+        join = get_stock_sales(stoc, vanzari)
+        assert get_stock_sales(stoc, vanzari) is join
+        assert DATASET_CACHE.entry('test_stoc').extra['stock_sales'].join is join
+
+        DATASET_CACHE.put('test_vanzari', CacheEntry('v2', vanzari_noi, 0.0))
+        newer = get_stock_sales(stoc, vanzari_noi)
+        assert newer is not join and newer.sales.frame is vanzari_noi
+        assert DATASET_CACHE.entry('test_stoc').extra['stock_sales'].join is newer
+    finally:
+        DATASET_CACHE.invalidate('test_stoc')
+        DATASET_CACHE.invalidate('test_vanzari')
@@ -0,0 +1,60 @@
+import json
+import sys
+from collections import deque
+from pathlib import Path
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.profiling import current_profile, export_profiles, rerun_profile, span
+
+
+def test_span_is_noop_without_active_profile():
+    with span("încărcare", 'load'):
+        pass
+
+    assert current_profile() is None
+
+
+def test_rerun_profile_records_spans_and_nested_profiles_share_outer():
+    history = deque(maxlen=2)
+
+    with rerun_profile("Pagina", history=history) as profile:
+        with span("încărcare", 'load'):
+            pass
+        with rerun_profile("Fragment", history=history) as inner:
+            assert inner is profile
+            with span("filtre", 'filter'):
+                pass
+
+    assert len(history) == 1
+    assert [item.name for item in profile.spans] == ["încărcare", "filtre"]
+    assert set(profile.stage_totals()) == {'load', 'filter'}
+    assert profile.seconds >= sum(item.seconds for item in profile.spans)
+
+
+def test_disabled_profile_records_nothing():
+    history = []
+
+    with rerun_profile("Pagina", enabled=False, history=history) as profile:
+        with span("încărcare", 'load'):
+            pass
+
+    assert profile is None
+    assert history == []
+
+
+def test_export_profiles_as_csv_and_json():
+    history = []
+    with rerun_profile("Pagina", history=history):
+        with span("tabel", 'render'):
+            pass
+
+    csv_log = export_profiles(history, "csv").splitlines()
+    json_log = json.loads(export_profiles(history, "json"))
+
+    assert csv_log[0].startswith("rerun,pagina")
+    assert len(csv_log) == 2
+    assert json_log[0]['label'] == "Pagina"
+    assert json_log[0]['spans'][0]['stage'] == 'render'
+    assert '_start' not in json_log[0]
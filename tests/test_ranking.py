@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from config.settings import SHOW_OPTIONS
+from utils.ranking import TopNEngine, show_option_limit
+
+
+def _vanzari(n=600, seed=5):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Data': rng.choice(pd.date_range('2025-01-01', periods=20), n),
+        'Client': pd.Categorical(rng.choice([f'C{i}' for i in range(12)], n)),
+        'Denumire': pd.Categorical(rng.choice([f'P{i}' for i in range(60)], n)),
+        'Cantitate': rng.integers(1, 10, n).astype('float32'),
+        'Valoare': rng.uniform(0, 100, n),
+    })
+
+
+def test_show_option_limit_parses_show_options():
+    assert [show_option_limit(option) for option in SHOW_OPTIONS] == [10, 20, 50, 100, None]
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'Data': [pd.Timestamp('2025-01-03'), pd.Timestamp('2025-01-07')]},
+    {'Client': ['C1', 'C4', 'necunoscut']},
+    {'Data': [pd.Timestamp('2025-01-05')], 'Client': ['C2', 'C3']},
+])
+@pytest.mark.parametrize('entity', ['Denumire', 'Client'])
+def test_top_matches_full_sort_of_filtered_rows(filters, entity):
+    df = _vanzari()
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in filters.items():
+        mask &= df[column].isin(values).to_numpy()
+    expected = (
+        df[mask].groupby(entity, observed=True)['Valoare'].sum()
+        .sort_values(ascending=False, kind='stable')
+    )
+
+    engine = TopNEngine(df)
+    top = engine.top(entity, 10, filters=filters)
+
+    np.testing.assert_allclose(top['Valoare'], expected.head(10))
+    assert list(top.index) == list(range(1, len(top) + 1))
+    assert top['Pondere (%)'].iloc[0] == pytest.approx(expected.iloc[0] / expected.sum() * 100)
+
+    everything = engine.top(entity, None, filters=filters)
+    assert len(everything) == len(expected)
+    assert set(everything[entity]) == set(expected.index)
+
+
+def test_top_by_quantity_and_summary():
+    df = _vanzari()
+    engine = TopNEngine(df)
+
+    top = engine.top('Denumire', 5, metric='Cantitate', filters={'Client': ['C0']})
+    rows = df[df['Client'] == 'C0']
+    expected = rows.groupby('Denumire', observed=True)['Cantitate'].sum().nlargest(5)
+    np.testing.assert_allclose(top['Cantitate'], expected)
+
+    summary = engine.summary({'Client': ['C0']})
+    assert summary['randuri'] == len(rows)
+    assert summary['Valoare'] == pytest.approx(rows['Valoare'].sum())
+    assert summary['Denumire'] == rows['Denumire'].nunique()
+    assert summary['Client'] == 1
+
+
+def test_totals_are_memoized_per_selection():
+    engine = TopNEngine(_vanzari())
+    filters = {'Client': ['C1']}
+
+    first = engine.totals('Denumire', filters)
+    engine.top('Denumire', 10, filters=filters)
+    engine.top('Denumire', 100, filters={'Client': ['C1']})
+
+    assert engine.totals('Denumire', filters) is first
+    assert len(engine._selections) == 1
+
+
+def test_filter_on_unpartitioned_column_is_rejected():
+    engine = TopNEngine(_vanzari())
+
+    with pytest.raises(KeyError):
+        engine.top('Denumire', 10, filters={'Gestiune': ['G1']})
+
+
+def test_top_produse_export_without_dates_or_clients():
+    df = pd.DataFrame({
+        'Denumire': ['a', 'b', 'c', 'd'],
+        'Grupa': ['g1', 'g1', 'g2', 'g2'],
+        'Cantitate': [5.0, 1.0, 7.0, 2.0],
+        'Valoare': [10.0, 40.0, 30.0, 20.0],
+    })
+    engine = TopNEngine(df)
+
+    assert engine.entities == ['Denumire'] and engine.partitions == ['Grupa']
+    assert engine.top('Denumire', 2)['Denumire'].tolist() == ['b', 'c']
+    assert engine.top('Denumire', 1, filters={'Grupa': ['g2']})['Denumire'].tolist() == ['c']
+
+
+def test_options_are_limited_to_the_selection():
+    df = _vanzari(n=60)
+    engine = TopNEngine(df)
+    zi = [pd.Timestamp('2025-01-04')]
+    day = df[df['Data'].isin(zi)]
+
+    assert set(engine.options('Client', {'Data': zi})) == set(day['Client'])
+    assert set(engine.options('Data', {'Client': ['C3']})) == set(df.loc[df['Client'] == 'C3', 'Data'])
+    assert engine.options('Client', {'Data': []}) == engine.options('Client')
+    assert len(engine.options('Client')) == df['Client'].nunique()
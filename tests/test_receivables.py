@@ -0,0 +1,125 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.receivables import DAYS_OVERDUE_COLUMN, DueAgeingEngine, overdue_labels
+
+AS_OF = pd.Timestamp('2025-03-15')
+
+
+def _neincasate(n=600, seed=5):
+    rng = np.random.default_rng(seed)
+    due = pd.Series(pd.Timestamp('2024-11-01') + pd.to_timedelta(rng.integers(0, 200, n), unit='D'))
+    due[rng.random(n) < 0.05] = pd.NaT
+    return pd.DataFrame({
+        'Client': pd.Categorical(rng.choice(['C1', 'C2', 'C3', 'C4', None], n)),
+        'Data document': due - pd.Timedelta(days=30),
+        'Data scadenta': due,
+        'Valoare': rng.uniform(100, 20000, n),
+        'Rest de incasat': np.where(rng.random(n) < 0.05, np.nan, rng.uniform(0, 10000, n)),
+    })
+
+
+def _expected_bucket(df, as_of=AS_OF):
+    late = (as_of - df['Data scadenta']).dt.days
+    bucket = pd.cut(late, [-np.inf, 0, 30, 60, 90, np.inf], labels=overdue_labels([30, 60, 90]))
+    return bucket.fillna(overdue_labels([30, 60, 90])[0])
+
+
+def _engine(df):
+    return DueAgeingEngine(df, 'Client', 'Rest de incasat', edges=[30, 60, 90])
+
+
+def test_overdue_labels():
+    assert overdue_labels([30, 60, 90]) == ['Nescadent', '1–30 zile', '31–60 zile', '61–90 zile', 'peste 90 zile']
+
+
+@pytest.mark.parametrize('partners, min_amount', [
+    (None, None),
+    (['C2', 'C4'], None),
+    (None, 2500),
+    (['C1'], 5000),
+])
+def test_buckets_match_pandas(partners, min_amount):
+    df = _neincasate()
+    selected = df
+    if partners:
+        selected = selected[selected['Client'].isin(partners)]
+    if min_amount:
+        selected = selected[selected['Rest de incasat'] >= min_amount]
+    expected = selected.groupby(_expected_bucket(selected), observed=False)['Rest de incasat'].agg(['sum', 'size'])
+
+    table = _engine(df).buckets(AS_OF, partners, min_amount)
+
+    assert list(table.index) == list(expected.index)
+    np.testing.assert_allclose(table['Sold'], expected['sum'])
+    np.testing.assert_array_equal(table['Documente'], expected['size'])
+    assert table['Pondere (%)'].sum() == pytest.approx(100)
+
+
+def test_exposure_per_partner_matches_pandas():
+    df = _neincasate()
+    engine = _engine(df)
+    with_partner = df.dropna(subset=['Client'])
+
+    exposure = engine.exposure(AS_OF)
+
+    expected = with_partner.groupby(
+        [with_partner['Client'], _expected_bucket(with_partner)], observed=True
+    )['Rest de incasat'].sum().unstack(fill_value=0)
+    for label in expected.columns:
+        np.testing.assert_allclose(exposure.loc[expected.index, label], expected[label])
+    late = (AS_OF - with_partner['Data scadenta']).dt.days.clip(lower=0)
+    np.testing.assert_array_equal(
+        exposure.loc[expected.index, 'Zile întârziere maxime'], late.groupby(with_partner['Client'], observed=True).max()
+    )
+    assert exposure['Restant'].is_monotonic_decreasing
+    assert engine.exposure(AS_OF) is exposure
+    assert list(engine.exposure(AS_OF, ['C3']).index) == ['C3']
+
+
+def test_threshold_and_documents():
+    df = _neincasate()
+    engine = _engine(df)
+    amounts = df['Rest de incasat'].fillna(0)
+
+    count, total = engine.above(4000)
+    assert count == (amounts >= 4000).sum()
+    assert total == pytest.approx(amounts[amounts >= 4000].sum())
+
+    rows = engine.documents(AS_OF, ['C2'], 1000, overdue_only=True)
+    mask = (df['Client'] == 'C2') & (amounts >= 1000) & (df['Data scadenta'] < AS_OF)
+    assert sorted(rows) == list(np.flatnonzero(mask))
+    assert engine.due_days[rows].tolist() == sorted(engine.due_days[rows].tolist())
+
+    overdue = engine.documents(AS_OF, overdue_only=True)
+    assert sorted(overdue) == list(np.flatnonzero(df['Data scadenta'] < AS_OF))
+    table = engine.table(overdue, AS_OF)
+    assert (table[DAYS_OVERDUE_COLUMN] == (AS_OF - table['Data scadenta']).dt.days).all()
+
+
+def test_missing_columns_give_empty_engine():
+    engine = DueAgeingEngine(pd.DataFrame({'Valoare': [1.0]}), 'Client', 'Rest de incasat')
+
+    assert not engine.available
+    assert engine.buckets(AS_OF)['Sold'].sum() == 0
+    assert engine.exposure(AS_OF).empty
+
+
+@pytest.mark.parametrize('partners', [['C1', 'C3'], ['C1', 'C2', 'C3', 'C4']])
+def test_exposure_totals_match_buckets_under_threshold(partners):
+    engine = _engine(_neincasate())
+
+    exposure = engine.exposure(AS_OF, partners, min_amount=3000)
+    buckets = engine.buckets(AS_OF, partners, min_amount=3000)
+
+    np.testing.assert_allclose(exposure[engine.labels].sum(), buckets['Sold'])
+    assert exposure['Sold total'].sum() == pytest.approx(buckets['Sold'].sum())
+    assert exposure['Documente restante'].sum() == buckets['Documente'].iloc[1:].sum()
+    assert exposure['Sold total'].sum() < engine.exposure(AS_OF, partners)['Sold total'].sum()
@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.schema import apply_schema, memory_usage_bytes
+
+
+def test_apply_schema_converts_declared_columns():
+    df = pd.DataFrame({
+        'DenumireGest': ['G1', 'G2', 'G1'],
+        'ZileVechime': [10.0, 20.0, 30.0],
+        'Stoc final': [1.5, 2.0, 3.0],
+        'Data': ['01.02.2024', '15.02.2024', None],
+        'Nedeclarat': ['x', 'y', 'z'],
+    })
+    schema = {
+        'DenumireGest': 'category',
+        'ZileVechime': 'integer',
+        'Stoc final': 'float32',
+        'Data': 'datetime',
+        'Lipsa': 'float',
+    }
+
+    typed = apply_schema(df, schema)
+
+    assert isinstance(typed['DenumireGest'].dtype, pd.CategoricalDtype)
+    assert typed['ZileVechime'].dtype == 'int8'
+    assert typed['Stoc final'].dtype == 'float32'
+    assert typed['Data'].iloc[1] == pd.Timestamp(2024, 2, 15)
+    assert pd.isna(typed['Data'].iloc[2])
+    assert typed['Nedeclarat'].dtype == df['Nedeclarat'].dtype
+
+
+def test_apply_schema_keeps_non_integral_values_as_float():
+    typed = apply_schema(pd.DataFrame({'ZileVechime': [1.5, None]}), {'ZileVechime': 'integer'})
+
+    assert typed['ZileVechime'].dtype == 'float32'
+
+
+def test_apply_schema_reduces_memory_of_repetitive_columns():
+    df = pd.DataFrame({'Grupa': ['Grupa lungă de test'] * 1000})
+
+    typed = apply_schema(df, {'Grupa': 'category'})
+
+    assert memory_usage_bytes(typed) < memory_usage_bytes(df)
@@ -0,0 +1,148 @@
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils import snapshots
+from utils.snapshots import load_with_snapshot, read_snapshot_meta
+
+
+def _make_source(tmp_path, rows):
+    source = tmp_path / "LaData.xlsx"
+    pd.DataFrame(rows).to_excel(source, index=False)
+    return source
+
+
+def _counting_reader(calls):
+    def reader(path):
+        calls.append(path)
+        return pd.read_excel(path)
+    return reader
+
+
+def test_snapshot_is_reused_while_source_is_unchanged(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A', 'B'], 'Stoc final': [1, 2]})
+    calls = []
+    reader = _counting_reader(calls)
+
+    first = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+    second = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert read_snapshot_meta('la_data', tmp_path / "cache")['rows'] == 2
+
+
+def test_snapshot_loads_only_requested_columns(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A'], 'Grupa': ['G'], 'Stoc final': [3]})
+    reader = _counting_reader([])
+    load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    df = load_with_snapshot('la_data', source, reader, columns=['Stoc final', 'Lipsa'],
+                            snapshot_dir=tmp_path / "cache")
+
+    assert list(df.columns) == ['Stoc final']
+
+
+def test_snapshot_touched_source_with_same_content_is_not_reparsed(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A'], 'Stoc final': [1]})
+    calls = []
+    reader = _counting_reader(calls)
+    load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    assert len(calls) == 1
+
+
+def test_snapshot_is_rebuilt_when_source_changes(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A'], 'Stoc final': [1]})
+    calls = []
+    reader = _counting_reader(calls)
+    load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    _make_source(tmp_path, {'DenumireGest': ['A', 'B'], 'Stoc final': [1, 5]})
+    df = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache")
+
+    assert len(calls) == 2
+    assert df['Stoc final'].tolist() == [1, 5]
+
+
+def test_source_rewritten_during_parse_is_not_marked_fresh(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A'], 'Stoc final': [1]})
+    calls = []
+
+    def rewriting_reader(path):
+        df = pd.read_excel(path)
+        if not calls:
+            # ERP-ul scrie un export nou în timpul parsării
+            _make_source(tmp_path, {'DenumireGest': ['A', 'B'], 'Stoc final': [1, 5]})
+        calls.append(path)
+        return df
+
+    first = load_with_snapshot('la_data', source, rewriting_reader, snapshot_dir=tmp_path / "cache")
+    second = load_with_snapshot('la_data', source, rewriting_reader, snapshot_dir=tmp_path / "cache")
+
+    assert first['Stoc final'].tolist() == [1]
+    assert len(calls) == 2
+    assert second['Stoc final'].tolist() == [1, 5]
+
+
+def test_arrow_snapshot_is_memory_mapped(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A', 'B', 'A'], 'Stoc final': [1.5, 2.0, 3.0]})
+    calls = []
+    reader = _counting_reader(calls)
+
+    first = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache", fmt="arrow")
+    second = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache", fmt="arrow")
+
+    assert len(calls) == 1
+    assert (tmp_path / "cache" / "la_data.arrow").exists()
+    pd.testing.assert_frame_equal(first, second)
+    values = second['Stoc final'].to_numpy()
+    assert not values.flags['OWNDATA'] and not values.flags['WRITEABLE']
+
+
+def test_snapshot_written_in_other_format_is_rebuilt(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A'], 'Stoc final': [1]})
+    calls = []
+    reader = _counting_reader(calls)
+    load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache", fmt="parquet")
+
+    df = load_with_snapshot('la_data', source, reader, snapshot_dir=tmp_path / "cache", fmt="arrow")
+
+    assert len(calls) == 2
+    assert read_snapshot_meta('la_data', tmp_path / "cache")['format'] == "arrow"
+    assert df['Stoc final'].tolist() == [1]
+
+
+def _slow_reader(path):
+    with open(Path(path).with_suffix(".calls"), "a") as handle:
+        handle.write("x")
+    time.sleep(0.3)
+    return pd.read_excel(path)
+
+
+def _load_in_process(source, snapshot_dir):
+    return len(load_with_snapshot('la_data', source, _slow_reader, snapshot_dir=snapshot_dir, fmt="arrow"))
+
+
+@pytest.mark.skipif(snapshots.fcntl is None, reason="lacătul între procese necesită fcntl")
+def test_concurrent_processes_parse_source_once(tmp_path):
+    source = _make_source(tmp_path, {'DenumireGest': ['A', 'B'], 'Stoc final': [1, 2]})
+
+    context = multiprocessing.get_context("fork")
+    with context.Pool(3) as pool:
+        rows = pool.starmap(_load_in_process, [(source, tmp_path / "cache")] * 3)
+
+    assert rows == [2, 2, 2]
+    assert source.with_suffix(".calls").read_text() == "x"
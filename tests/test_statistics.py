@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils import statistics
+from utils.statistics import StatisticsEngine, stat_specs
+
+CARDS = [
+    {"column": "Stoc final", "label": "Stoc", "format": "sum"},
+    {"column": "Valoare intrare", "label": "Valoare", "format": "currency"},
+    {"column": "ZileVechime", "label": "Vechime", "format": "mean"},
+    {"column": "Denumire", "label": "Produse", "format": "count"},
+    {"column": "Furnizor", "label": "Furnizori", "format": "count"},
+    {"column": "count_rows", "label": "Rânduri", "format": "number"},
+    {"column": "Lipsa", "label": "Lipsă", "format": "sum"},
+]
+
+
+def _perioada(n=1000, seed=2):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Denumire gestiune': pd.Categorical(rng.choice(['G1', 'G2'], n)),
+        'Denumire': rng.choice([f'p{i}' for i in range(50)], n),
+        'Furnizor': rng.choice(['F1', 'F2', 'F3', None], n),
+        'Stoc final': rng.integers(0, 20, n).astype('float32'),
+        'Valoare intrare': np.where(rng.random(n) < 0.1, np.nan, rng.uniform(0, 100, n)),
+        'ZileVechime': rng.integers(0, 300, n),
+    })
+
+
+def test_stat_specs_map_formats_to_aggregates():
+    assert stat_specs(CARDS) == (
+        ('Stoc final', 'sum'), ('Valoare intrare', 'sum'), ('ZileVechime', 'mean'),
+        ('Denumire', 'nunique'), ('Furnizor', 'nunique'), ('count_rows', 'rows'), ('Lipsa', 'sum'),
+    )
+
+
+@pytest.mark.parametrize('block_rows', [7, statistics.BLOCK_ROWS])
+@pytest.mark.parametrize('selected', [None, 'G2'])
+def test_statistics_match_pandas_in_one_pass(monkeypatch, block_rows, selected):
+    monkeypatch.setattr(statistics, 'BLOCK_ROWS', block_rows)
+    df = _perioada()
+    positions = None if selected is None else np.flatnonzero(df['Denumire gestiune'] == selected)
+    filtered = df if positions is None else df.iloc[positions]
+
+    stats = StatisticsEngine(df).compute(stat_specs(CARDS), positions)
+
+    assert stats[('Stoc final', 'sum')] == pytest.approx(filtered['Stoc final'].sum())
+    assert stats[('Valoare intrare', 'sum')] == pytest.approx(filtered['Valoare intrare'].sum())
+    assert stats[('ZileVechime', 'mean')] == pytest.approx(filtered['ZileVechime'].mean())
+    assert stats[('Denumire', 'nunique')] == filtered['Denumire'].nunique()
+    assert stats[('Furnizor', 'nunique')] == filtered['Furnizor'].nunique()
+    assert stats[('count_rows', 'rows')] == len(filtered)
+    assert ('Lipsa', 'sum') not in stats
+
+
+def test_statistics_are_memoized_per_selected_positions():
+    df = _perioada()
+    engine = StatisticsEngine(df)
+    specs = stat_specs(CARDS)
+    positions = np.flatnonzero(df['Denumire gestiune'] == 'G1')
+
+    by_positions = engine.compute(specs, positions)
+    assert engine.compute(specs, positions.copy()) is by_positions
+
+    # Aceleași filtre, restrânse de altceva (ex. căutare): altă selecție, alt rezultat
+    narrowed = engine.compute(specs, positions[:-1])
+    assert narrowed is not by_positions
+    assert narrowed[('count_rows', 'rows')] == len(positions) - 1
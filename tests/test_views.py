@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.filter_index import FilterIndex
+from utils.views import FrameView, search_view, sort_view
+
+
+def _perioada():
+    return pd.DataFrame({
+        'DenumireGest': pd.Categorical(['G1', 'G2', 'G1', 'G3']),
+        'Stoc final': np.array([1.0, 2.0, np.nan, 4.0], dtype='float32'),
+        'Pret vanzare': [10.0, 20.0, 30.0, 40.0],
+        'UM': ['buc', 'kg', 'buc', 'kg'],
+    })
+
+
+def test_view_metrics_match_materialized_frame():
+    df = _perioada()
+    index = FilterIndex(df, columns=['DenumireGest'])
+    mask = index.mask({'DenumireGest': ['G1', 'G2']})
+    view = index.view(df, mask)
+    expected = df[mask]
+
+    assert len(view) == len(expected)
+    assert view.sum('Stoc final') == expected['Stoc final'].sum()
+    assert view.mean('Stoc final') == expected['Stoc final'].mean()
+    assert view.sum_product('Stoc final', 'Pret vanzare') == (expected['Stoc final'] * expected['Pret vanzare']).sum()
+    assert view.nunique('DenumireGest') == 2
+    assert view.first('UM') == 'buc'
+    pd.testing.assert_frame_equal(view.to_frame(), expected)
+
+
+def test_view_group_sum_only_returns_present_groups():
+    df = _perioada()
+    index = FilterIndex(df, columns=['DenumireGest'])
+    view = index.view(df, index.mask({'DenumireGest': ['G1', 'G3']}))
+
+    sums = view.group_sum('DenumireGest', 'Stoc final')
+
+    assert sums.to_dict() == {'G1': 1.0, 'G3': 4.0}
+    assert sums.reset_index().columns.tolist() == ['DenumireGest', 'Stoc final']
+
+
+def test_unfiltered_view_does_not_copy_the_shared_frame():
+    df = _perioada()
+    view = FrameView(df)
+
+    assert view.to_frame() is df
+    assert view.sum('Coloana lipsa') == 0
+    pd.testing.assert_frame_equal(view.to_frame(start=1, stop=3), df.iloc[1:3])
+
+
+def test_sort_view_orders_selection_with_missing_values_last():
+    df = pd.DataFrame({
+        'Denumire': pd.Categorical(['beta', 'alfa', None, 'gama']),
+        'Stoc final': [3.0, np.nan, 1.0, 2.0],
+    })
+    view = FrameView(df, positions=np.array([0, 1, 3]))
+
+    assert sort_view(view, 'Stoc final').positions.tolist() == [3, 0, 1]
+    assert sort_view(view, 'Stoc final', ascending=False).positions.tolist() == [0, 3, 1]
+    assert sort_view(FrameView(df), 'Denumire').positions.tolist() == [1, 0, 3, 2]
+
+
+def test_search_view_matches_text_and_categorical_columns():
+    df = pd.DataFrame({
+        'DenumireGest': pd.Categorical(['Depozit Central', 'Magazin', 'Depozit Nord']),
+        'Denumire': ['Ciment', 'Cărămidă', 'ciment alb'],
+        'Stoc final': [1, 2, 3],
+    })
+
+    assert search_view(FrameView(df), 'CIMENT').positions.tolist() == [0, 2]
+    assert search_view(FrameView(df, np.array([1, 2])), 'depozit').positions.tolist() == [2]
+    assert search_view(FrameView(df), '  ').positions is None
@@ -0,0 +1,36 @@
+import os
+import sys
+from pathlib import Path
+
+# Ensure the project root is on the Python path when tests are executed
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from utils.watcher import DataWatcher
+
+
+def test_watcher_ingests_only_after_signature_is_stable(tmp_path):
+    source = tmp_path / "LaData.xlsx"
+    source.write_bytes(b"v1")
+    changed = []
+    watcher = DataWatcher(changed.append, data_paths={'balanta_la_data': source}, interval=0)
+
+    assert watcher.poll() == []
+    assert watcher.poll() == ['balanta_la_data']
+    assert watcher.poll() == []
+
+    source.write_bytes(b"v2-mai-lung")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert watcher.poll() == []
+    assert watcher.poll() == ['balanta_la_data']
+    assert changed == ['balanta_la_data', 'balanta_la_data']
+
+
+def test_watcher_ignores_missing_files(tmp_path):
+    changed = []
+    watcher = DataWatcher(changed.append, data_paths={'neachitate': tmp_path / "lipsa.xlsx"}, interval=0)
+
+    watcher.poll()
+    watcher.poll()
+
+    assert changed == []
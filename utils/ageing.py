@@ -0,0 +1,244 @@
+"""
+Analiza vechimii stocului (ZileVechime) pe intervale de zile
+
+Fiecare rând al balanței pe perioadă este încadrat o singură dată per
+versiune de date într-un interval de vechime (implicit 0–30, 31–90, 91–180,
+peste 180 de zile). Sumele parțiale (rânduri, stoc, valoare, vechime ×
+valoare) se păstrează pe (grup × interval), unde grupurile sunt combinațiile
+coloanelor de grupare din utils.metrics și ale dimensiunilor de defalcare
+(producător, furnizor); orice astfel de selecție și orice defalcare se
+obține adunând aceste parțiale. Selecțiile pe produse se rezolvă din listele
+inversate ale FilterIndex, adunând doar rândurile selectate.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config.settings import AGEING_BUCKETS, SELECTION_CACHE_SIZE
+from utils.data_loaders import get_derived
+from utils.filter_index import normalize_filters
+from utils.metrics import (
+    GROUP_COLUMNS, get_metrics, group_rows, selection_rows, split_selections,
+)
+
+AGE_COLUMN = 'ZileVechime'
+
+# Eticheta afișată -> coloana de filtrare după care se poate defalca vechimea
+AGEING_DIMENSIONS = {
+    'Gestiune': 'Denumire gestiune',
+    'Producător': 'Producator',
+    'Furnizor': 'Furnizor IN',
+}
+
+# Sumele parțiale păstrate pe (grup, interval)
+_MEASURES = ('randuri', 'stoc', 'valoare', 'vechime_valoare')
+
+
+def bucket_labels(edges=AGEING_BUCKETS):
+    """Etichetele intervalelor de vechime (ex. '0–30 zile', ..., 'peste 180 zile')"""
+    labels, low = [], 0
+    for edge in edges:
+        labels.append(f"{low}–{edge} zile")
+        low = edge + 1
+    labels.append(f"peste {edges[-1]} zile" if len(edges) else "Toate")
+    return labels
+
+
+def assign_buckets(ages, edges=AGEING_BUCKETS):
+    """
+    Intervalul de vechime pentru fiecare valoare (vectorizat)
+
+    Returns:
+        Tablou int64 cu indicele intervalului (-1 pentru vechime lipsă);
+        vechimile negative cad în primul interval
+    """
+    ages = np.asarray(ages, dtype=np.float64)
+    buckets = np.searchsorted(np.asarray(edges, dtype=np.float64), ages, side='left').astype(np.int64)
+    buckets[np.isnan(ages)] = -1
+    return buckets
+
+
+class AgeingEngine:
+    """
+    Intervalele de vechime calculate o singură dată per versiune de date
+
+    Args:
+        df: DataFrame-ul balanței pe perioadă (din cache)
+        edges: Limitele superioare ale intervalelor (implicit AGEING_BUCKETS)
+        value: KPI-ul din utils.metrics folosit ca valoare (ponderea vechimii)
+        quantity: KPI-ul din utils.metrics folosit drept cantitate
+    """
+
+    def __init__(self, df, edges=AGEING_BUCKETS, value='valoare_intrare', quantity='stoc'):
+        self.metrics = get_metrics(df)
+        self.index = self.metrics.index
+        self.labels = bucket_labels(edges)
+        self.available = AGE_COLUMN in df.columns
+        n_buckets = len(self.labels)
+
+        # Grupurile: coloanele de grupare ale KPI-urilor plus dimensiunile de defalcare
+        self.group_columns = [
+            col for col in dict.fromkeys(GROUP_COLUMNS + list(AGEING_DIMENSIONS.values())) if col in self.index
+        ]
+        groups, self._group_codes = group_rows({col: self.index.codes(col) for col in self.group_columns})
+        n_groups = int(groups.max(initial=-1)) + 1
+        self._groups = groups
+
+        ages = df[AGE_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan) if self.available else np.full(len(df), np.nan)
+        self._buckets = assign_buckets(ages, edges)
+        present = self._buckets >= 0
+        cells = groups[present].astype(np.int64) * n_buckets + self._buckets[present]
+
+        def row_values(name):
+            values = self.metrics.row_values.get(name)
+            return np.zeros(len(df)) if values is None else np.nan_to_num(values)
+
+        # Ponderile pe rând (păstrate pentru selecțiile rezolvate pe rânduri)
+        self._weights = {
+            'randuri': np.where(present, 1.0, 0.0),
+            'stoc': row_values(quantity),
+            'valoare': row_values(value),
+        }
+        self._weights['vechime_valoare'] = self._weights['valoare'] * np.nan_to_num(ages)
+
+        # Parțialele pe (grup, interval), ca matrici n_groups × n_buckets
+        self._partials = {
+            name: np.bincount(cells, weights=self._weights[name][present], minlength=n_groups * n_buckets)
+            .reshape(n_groups, n_buckets)
+            for name in _MEASURES
+        }
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _memoized(self, key, compute):
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > SELECTION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+    def _group_mask(self, selections):
+        mask = None
+        for column, values in selections.items():
+            lookup = np.zeros(len(self.index.values(column)) + 1, dtype=bool)
+            lookup[self.index.value_codes(column, values)] = True
+            # Codul -1 (valoare lipsă) cade pe ultima poziție, care rămâne False
+            column_mask = lookup[self._group_codes[column]]
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+    def _selected_rows(self, selections):
+        """Rândurile selectate (cu vechime) când filtrele includ coloane din afara grupurilor, altfel None"""
+        on_groups, on_rows = split_selections(self.index, selections, self.group_columns)
+        rows = selection_rows(self.index, on_rows)
+        if rows is None:
+            return None, self._group_mask(on_groups)
+        mask = self._group_mask(on_groups)
+        if mask is not None:
+            rows = rows[mask[self._groups[rows]]]
+        return rows[self._buckets[rows] >= 0], None
+
+    def _cells(self, keys, n_keys, rows, mask):
+        """Sumele măsurilor pe (cheie, interval), din parțialele pe grupuri sau din rândurile selectate"""
+        n_buckets = len(self.labels)
+        if rows is not None:
+            cells = keys[rows].astype(np.int64) * n_buckets + self._buckets[rows]
+            present = keys[rows] >= 0
+            return {
+                name: np.bincount(cells[present], weights=self._weights[name][rows][present],
+                                  minlength=n_keys * n_buckets).reshape(n_keys, n_buckets)
+                for name in _MEASURES
+            }
+        present = keys >= 0 if mask is None else (keys >= 0) & mask
+        return {
+            name: np.stack([
+                np.bincount(keys[present], weights=partial[present, bucket], minlength=n_keys)
+                for bucket in range(n_buckets)
+            ], axis=1)
+            for name, partial in self._partials.items()
+        }
+
+    def buckets(self, selections=None):
+        """
+        Totalurile pe intervale de vechime pentru o selecție de filtre
+
+        Returns:
+            DataFrame cu o linie per interval: Interval, Produse, Stoc, Valoare,
+            Pondere valoare (%) și Vechime ponderată (zile, ponderată cu valoarea)
+        """
+        def compute():
+            rows, mask = self._selected_rows(selections)
+            keys = np.zeros(len(self._groups) if rows is not None else len(self._partials['randuri']), dtype=np.int64)
+            sums = {name: cells[0] for name, cells in self._cells(keys, 1, rows, mask).items()}
+            return self._table(pd.Index(self.labels, name='Interval'), sums)
+
+        return self._memoized(('buckets', normalize_filters(selections)), compute).copy()
+
+    def by(self, column, selections=None):
+        """
+        Valoarea stocului pe intervale de vechime, defalcată după o coloană de filtrare
+
+        Args:
+            column: Coloana indexată (ex. 'Producator', vezi AGEING_DIMENSIONS)
+            selections: Dicționar coloană -> valori selectate
+
+        Returns:
+            DataFrame indexat după valorile coloanei, cu valoarea pe fiecare
+            interval, Valoare totală și Vechime ponderată, sortat descrescător
+            după valoare; valorile fără stoc în selecție sunt omise
+        """
+        def compute():
+            rows, mask = self._selected_rows(selections)
+            if rows is None and column not in self._group_codes:
+                # Defalcare pe o coloană din afara grupurilor: din rândurile selectate
+                present = self._buckets >= 0
+                rows = np.flatnonzero(present if mask is None else present & mask[self._groups])
+            values = self.index.values(column)
+            # Valorile lipsă (cod -1) sunt ignorate
+            keys = self.index.codes(column) if rows is not None else self._group_codes[column]
+            sums = self._cells(keys, len(values), rows, mask)
+            sums = {name: sums[name] for name in ('randuri', 'valoare', 'vechime_valoare')}
+            table = pd.DataFrame(sums['valoare'], index=pd.Index(values, name=column), columns=self.labels)
+            total = sums['valoare'].sum(axis=1)
+            table['Valoare totală'] = total
+            table['Vechime ponderată'] = _ratio(sums['vechime_valoare'].sum(axis=1), total)
+            table = table[sums['randuri'].sum(axis=1) > 0]
+            return table.sort_values('Valoare totală', ascending=False)
+
+        return self._memoized(('by', column, normalize_filters(selections)), compute).copy()
+
+    def weighted_age(self, selections=None, default=0):
+        """Vechimea medie ponderată cu valoarea stocului pentru o selecție"""
+        table = self.buckets(selections)
+        value = table['Valoare'].sum()
+        return table['Vechime ponderată'].mul(table['Valoare']).sum() / value if value else default
+
+    def _table(self, index, sums):
+        total_value = sums['valoare'].sum()
+        return pd.DataFrame({
+            'Produse': sums['randuri'].astype(np.int64),
+            'Stoc': sums['stoc'],
+            'Valoare': sums['valoare'],
+            'Pondere valoare (%)': _ratio(sums['valoare'] * 100, np.full(len(index), total_value)),
+            'Vechime ponderată': _ratio(sums['vechime_valoare'], sums['valoare']),
+        }, index=index)
+
+
+def _ratio(numerator, denominator):
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+
+
+def get_ageing(df):
+    """Returnează motorul de vechime a stocului construit o singură dată per versiune de date"""
+    return get_derived(df, 'stock_ageing', AgeingEngine)
@@ -0,0 +1,150 @@
+"""
+Cub de agregare ierarhic pentru analizele de stoc
+
+Calculează o singură dată ierarhia Total → Gestiune → Grupă → Produs pentru
+valorile de stoc, cu id-urile și părinții construiți vectorizat, gata de
+folosit în Treemap și în tabelele sumare.
+"""
+
+import pandas as pd
+
+from utils.data_loaders import get_derived
+from utils.incremental import register_delta_updater
+
+ROOT_LABEL = "Brenado For House"
+CUBE_LEVELS = ['DenumireGest', 'Grupa', 'Denumire']
+CUBE_MEASURES = ['ValoareStocFinal', 'ValoareVanzare', 'Stoc final']
+ID_SEPARATOR = "/"
+ID_ESCAPE = "\\"
+
+
+def _id_part(values):
+    """Valorile unei chei ca parte de id: separatorul din nume este precedat de ID_ESCAPE"""
+    return (
+        values.astype(str)
+        .str.replace(ID_ESCAPE, ID_ESCAPE * 2, regex=False)
+        .str.replace(ID_SEPARATOR, ID_ESCAPE + ID_SEPARATOR, regex=False)
+    )
+
+
+def _join_keys(frame, keys):
+    """
+    Concatenează vectorizat valorile cheilor într-un id ierarhic
+
+    Numele care conțin ID_SEPARATOR sunt escapate, deci ('a/b', 'c') și
+    ('a', 'b/c') dau id-uri diferite; id-urile rămân stabile între versiunile
+    datelor (necesar actualizării incrementale a cubului).
+    """
+    joined = _id_part(frame[keys[0]])
+    for key in keys[1:]:
+        joined = joined + ID_SEPARATOR + _id_part(frame[key])
+    return joined.to_numpy()
+
+
+def build_stock_cube(df, levels=CUBE_LEVELS, measures=CUBE_MEASURES, root=ROOT_LABEL):
+    """
+    Construiește cubul ierarhic al măsurilor de stoc
+
+    Se face un singur groupby pe nivelul cel mai detaliat; nivelurile
+    superioare sunt obținute prin agregarea rezultatului (mult mai mic).
+
+    Args:
+        df: DataFrame-ul cu datele de stoc
+        levels: Coloanele ierarhiei, de la general la detaliat
+        measures: Coloanele numerice de însumat
+        root: Eticheta nodului rădăcină
+
+    Returns:
+        DataFrame cu coloanele ids, labels, parents, level, depth și măsurile,
+        câte un rând pentru fiecare nod (rădăcina are depth 0)
+    """
+    levels = [col for col in levels if col in df.columns]
+    measures = [col for col in measures if col in df.columns]
+
+    root_row = {'ids': root, 'labels': root, 'parents': '', 'level': 'total', 'depth': 0}
+    root_row.update({col: df[col].sum() for col in measures})
+    frames = [pd.DataFrame([root_row])]
+
+    if levels:
+        base = df.groupby(levels, observed=True, sort=False, dropna=False)[measures].sum().reset_index()
+        for depth in range(1, len(levels) + 1):
+            keys = levels[:depth]
+            if depth < len(levels):
+                agg = base.groupby(keys, observed=True, sort=False, dropna=False)[measures].sum().reset_index()
+            else:
+                agg = base
+            # Nodurile cu chei lipsă nu au un părinte valid în ierarhie
+            agg = agg[agg[keys].notna().all(axis=1)]
+
+            frames.append(pd.DataFrame({
+                'ids': _join_keys(agg, keys),
+                'labels': agg[keys[-1]].astype(str).to_numpy(),
+                'parents': _join_keys(agg, keys[:-1]) if depth > 1 else root,
+                'level': keys[-1],
+                'depth': depth,
+                **{col: agg[col].to_numpy() for col in measures},
+            }))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def apply_cube_delta(cube, old_df, new_df, delta):
+    """
+    Actualizează cubul cu rândurile adăugate/eliminate (vezi utils.incremental)
+
+    Măsurile sunt sume, deci cubul nou = cubul vechi + cubul rândurilor
+    adăugate - cubul rândurilor eliminate. Dacă un nod ar putea rămâne fără
+    rânduri (eliminat fără a fi și adăugat), returnează None și cubul se
+    recalculează complet.
+    """
+    measures = [col for col in CUBE_MEASURES if col in cube.columns]
+    added = build_stock_cube(new_df.iloc[delta.added])
+    parts = [cube, added]
+    if len(delta.removed):
+        removed = build_stock_cube(old_df.iloc[delta.removed])
+        if not removed['ids'].isin(added['ids']).all():
+            return None
+        removed[measures] = -removed[measures]
+        parts.append(removed)
+
+    merged = pd.concat(parts, ignore_index=True)
+    nodes = merged.drop_duplicates('ids').set_index('ids')
+    nodes[measures] = merged.groupby('ids', sort=False)[measures].sum()
+    return nodes.reset_index().sort_values('depth', kind='stable', ignore_index=True)
+
+
+def get_stock_cube(df):
+    """Returnează cubul de stoc calculat o singură dată per versiune de date"""
+    return get_derived(df, 'stock_cube', build_stock_cube)
+
+
+register_delta_updater('stock_cube', apply_cube_delta)
+
+
+def cube_level(cube, depth):
+    """Returnează nodurile de pe un anumit nivel al cubului"""
+    return cube[cube['depth'] == depth]
+
+
+def cube_totals(cube):
+    """Returnează rândul rădăcină (totalurile generale) ca Series"""
+    return cube.iloc[0]
+
+
+def treemap_nodes(cube, max_depth=2):
+    """Returnează nodurile cubului până la adâncimea dată, pentru Treemap"""
+    return cube[cube['depth'] <= max_depth]
+
+
+def gestiune_summary(cube, sort_by='ValoareStocFinal'):
+    """
+    Sumar pe gestiuni citit din cub, sortat descrescător
+
+    Returns:
+        DataFrame cu coloana DenumireGest și măsurile cubului
+    """
+    summary = cube_level(cube, 1).drop(columns=['ids', 'parents', 'level', 'depth'])
+    summary = summary.rename(columns={'labels': 'DenumireGest'})
+    if sort_by in summary.columns:
+        summary = summary.sort_values(sort_by, ascending=False)
+    return summary.reset_index(drop=True)
@@ -0,0 +1,268 @@
+"""
+Artefacte precalculate pentru dashboard (generate de precompute.py)
+
+Pentru fiecare export din DATA_PATHS, precompute.py scrie într-un director
+versionat datele tipizate (Arrow IPC necomprimat), indexul de filtrare
+(tablouri .npy) și cubul de stoc. Aplicația citește aceste
+fișiere memory-mapped în loc să parseze Excel-ul și să recalculeze
+artefactele la primul click al unui utilizator.
+
+Structura:
+    ARTIFACTS_DIR/CURRENT             - numele versiunii active
+    ARTIFACTS_DIR/<versiune>/manifest.json
+    ARTIFACTS_DIR/<versiune>/<cheie>.arrow, <cheie>.cube.arrow, <cheie>.index/
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from config.schemas import DATASET_SCHEMAS
+from config.settings import ARTIFACTS_DIR, ARTIFACTS_KEEP
+from utils.filter_index import FilterIndex
+from utils.schema import schema_tag
+from utils.snapshots import _prepare_for_arrow, file_hash, file_signature, read_arrow, write_arrow
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "CURRENT"
+INDEX_ARRAYS = ('codes', 'order', 'offsets')
+
+
+def _base(base=None):
+    return Path(base or ARTIFACTS_DIR)
+
+
+def _write_text(path, text):
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def artifact_version(sources):
+    """Versiunea artefactelor: hash-ul surselor (conținut + schemă de tipuri)"""
+    payload = json.dumps(
+        {key: [source['hash'], source['tag']] for key, source in sorted(sources.items())},
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def current_dir(base=None):
+    """Directorul versiunii active sau None dacă nu există artefacte"""
+    base = _base(base)
+    try:
+        version = (base / CURRENT_NAME).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    directory = base / version
+    return directory if (directory / MANIFEST_NAME).exists() else None
+
+
+def read_manifest(base=None):
+    """Manifestul versiunii active sau None"""
+    directory = current_dir(base)
+    if directory is None:
+        return None
+    try:
+        with open(directory / MANIFEST_NAME, encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    manifest['directory'] = str(directory)
+    return manifest
+
+
+def write_frame(path, df):
+    """Scrie un DataFrame ca Arrow IPC necomprimat (poate fi citit memory-mapped)"""
+    write_arrow(path, _prepare_for_arrow(df))
+
+
+def read_frame(path, columns=None):
+    """Citește un fișier Arrow IPC memory-mapped, opțional doar unele coloane"""
+    return read_arrow(path, columns)
+
+
+def write_index(directory, index):
+    """
+    Salvează tablourile unui FilterIndex ca fișiere .npy
+
+    Returns:
+        Metadatele indexului (coloane, valori, număr de rânduri) pentru manifest
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    columns = []
+    for position, (column, arrays) in enumerate(index.state().items()):
+        values = arrays['values'].tolist()
+        json.dumps(values)  # valorile trebuie să poată fi salvate în manifest
+        for name in INDEX_ARRAYS:
+            np.save(directory / f"{position}.{name}.npy", np.ascontiguousarray(arrays[name]))
+        columns.append({'column': column, 'values': values})
+    return {'rows': index.n_rows, 'columns': columns}
+
+
+def read_index(directory, meta):
+    """Reconstruiește un FilterIndex din tablourile .npy, memory-mapped"""
+    state = {}
+    for position, column in enumerate(meta['columns']):
+        arrays = {name: np.load(directory / f"{position}.{name}.npy", mmap_mode="r") for name in INDEX_ARRAYS}
+        arrays['values'] = column['values']
+        state[column['column']] = arrays
+    return FilterIndex.from_state(meta['rows'], state)
+
+
+def _is_fresh(entry, key, source_path):
+    if entry.get('tag') != schema_tag(DATASET_SCHEMAS.get(key)):
+        return False
+    if entry.get('signature') == file_signature(source_path):
+        return True
+    return entry.get('hash') == file_hash(source_path)
+
+
+def load_artifacts(key, source_path, columns=None, base=None):
+    """
+    Încarcă un set de date din artefactele active, dacă acestea corespund sursei
+
+    Args:
+        key: Cheia din DATA_PATHS
+        source_path: Fișierul sursă (artefactele sunt valide doar pentru conținutul lui)
+        columns: Coloanele necesare (None = toate, caz în care se încarcă și
+                 artefactele derivate)
+
+    Returns:
+        (DataFrame, dicționar de artefacte derivate pentru get_derived) sau None
+    """
+    manifest = read_manifest(base)
+    entry = (manifest or {}).get('datasets', {}).get(key)
+    if entry is None:
+        return None
+
+    try:
+        if not _is_fresh(entry, key, source_path):
+            return None
+        directory = Path(manifest['directory'])
+        files = entry['files']
+        if columns is not None:
+            columns = [col for col in columns if col in entry['columns']]
+        df = read_frame(directory / files['data'], columns)
+
+        extra = {}
+        if columns is None:
+            if 'index' in files:
+                extra['filter_index'] = read_index(directory / files['index'], entry['index'])
+            if 'cube' in files:
+                extra['stock_cube'] = read_frame(directory / files['cube'])
+    except Exception as exc:
+        logger.warning("Artefactele pentru %s nu au putut fi citite: %s", key, exc)
+        return None
+    return df, extra
+
+
+def _link_or_copy(source, destination):
+    """Fișierele publicate nu se modifică: hard link când se poate, altfel copie"""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _carry_files(entry, source_dir, target_dir):
+    """Preia într-o versiune nouă fișierele unui set de date dintr-o versiune anterioară"""
+    for name in entry['files'].values():
+        source = Path(source_dir) / name
+        if source.is_dir():
+            shutil.copytree(source, target_dir / name, copy_function=_link_or_copy)
+        else:
+            _link_or_copy(source, target_dir / name)
+
+
+def publish_artifacts(datasets, base=None, keep=ARTIFACTS_KEEP):
+    """
+    Scrie o nouă versiune de artefacte și o face activă (atomic)
+
+    Args:
+        datasets: Dicționar cheie -> dict cu source (calea), frame (DataFrame-ul
+                  tipizat) și opțional filter_index, stock_cube
+        base: Directorul de artefacte (implicit ARTIFACTS_DIR)
+        keep: Numărul de versiuni păstrate
+
+    Seturile de date din versiunea activă care nu sunt în datasets (ex.
+    precompute.py --keys) sunt preluate neschimbate în noua versiune.
+
+    Returns:
+        Manifestul versiunii publicate
+    """
+    base = _base(base)
+    previous = read_manifest(base) or {}
+    carried = {key: entry for key, entry in previous.get('datasets', {}).items() if key not in datasets}
+    sources = {
+        key: {
+            'source': str(item['source']),
+            'signature': file_signature(item['source']),
+            'hash': file_hash(item['source']),
+            'tag': schema_tag(DATASET_SCHEMAS.get(key)),
+        }
+        for key, item in datasets.items()
+    }
+    sources.update({
+        key: {name: entry[name] for name in ('source', 'signature', 'hash', 'tag')}
+        for key, entry in carried.items()
+    })
+    version = artifact_version(sources)
+    directory = base / version
+    manifest = {'version': version, 'created_at': datetime.now().isoformat(timespec="seconds"), 'datasets': {}}
+
+    if not (directory / MANIFEST_NAME).exists():
+        tmp_dir = base / f".tmp-{version}-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        for key, item in datasets.items():
+            df = item['frame']
+            entry = {**sources[key], 'rows': len(df), 'columns': [str(col) for col in df.columns], 'files': {}}
+            write_frame(tmp_dir / f"{key}.arrow", df)
+            entry['files']['data'] = f"{key}.arrow"
+
+            if item.get('filter_index') is not None:
+                try:
+                    entry['index'] = write_index(tmp_dir / f"{key}.index", item['filter_index'])
+                    entry['files']['index'] = f"{key}.index"
+                except (TypeError, ValueError) as exc:
+                    logger.warning("Indexul de filtrare pentru %s nu a fost salvat: %s", key, exc)
+            if item.get('stock_cube') is not None:
+                write_frame(tmp_dir / f"{key}.cube.arrow", item['stock_cube'])
+                entry['files']['cube'] = f"{key}.cube.arrow"
+            manifest['datasets'][key] = entry
+
+        for key, entry in carried.items():
+            _carry_files(entry, previous['directory'], tmp_dir)
+            manifest['datasets'][key] = entry
+
+        _write_text(tmp_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+        if directory.exists():
+            shutil.rmtree(directory)
+        os.replace(tmp_dir, directory)
+    else:
+        with open(directory / MANIFEST_NAME, encoding="utf-8") as handle:
+            manifest = json.load(handle)
+
+    _write_text(base / CURRENT_NAME, version)
+    _prune(base, version, keep)
+    return manifest
+
+
+def _prune(base, current, keep):
+    versions = sorted(
+        (path for path in base.iterdir() if path.is_dir() and not path.name.startswith(".") and path.name != current),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in versions[max(keep - 1, 0):]:
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,233 @@
+"""
+Cache de seturi de date, cu cheie pe amprenta fișierului sursă
+
+Spre deosebire de @st.cache_data fără parametri, intrările expiră după
+CACHE_TTL, sunt evacuate LRU când se depășește numărul maxim de intrări sau
+memoria maximă, iar o intrare veche continuă să fie servită cât timp noua
+versiune se încarcă în fundal.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable
+
+import pandas as pd
+
+from config.settings import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES, CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_nbytes(value):
+    """Estimează memoria ocupată de o valoare din cache"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    return 0
+
+
+@dataclass
+class CacheEntry:
+    """O intrare din cache: valoarea încărcată pentru o anumită amprentă a sursei"""
+    fingerprint: Hashable
+    value: Any
+    loaded_at: float
+    nbytes: int = 0
+    extra: dict = field(default_factory=dict)
+    # Lock-urile artefactelor derivate (per nume) trăiesc și dispar odată cu intrarea
+    locks: dict = field(default_factory=dict, repr=False, compare=False)
+
+
+@dataclass
+class Versioned:
+    """Rezultatul unui loader care aduce și artefacte derivate deja calculate"""
+    value: Any
+    extra: dict = field(default_factory=dict)
+
+
+class DatasetCache:
+    """
+    Cache thread-safe pentru DataFrame-urile încărcate din DATA_PATHS
+
+    Args:
+        ttl: Durata de viață a unei intrări în secunde (None = fără expirare)
+        max_entries: Numărul maxim de intrări păstrate
+        max_bytes: Memoria maximă estimată pentru toate intrările
+        background: Dacă reîncărcarea intrărilor expirate se face în fundal
+        clock: Sursa de timp (înlocuibilă în teste)
+    """
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES,
+                 background=True, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.background = background
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        # Un lock per cheie de set de date (număr limitat de chei); vezi și CacheEntry.locks
+        self._key_locks = {}
+        self._refreshing = {}
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return sum(entry.nbytes for entry in self._entries.values())
+
+    def keys(self):
+        """Returnează cheile intrărilor curente"""
+        with self._lock:
+            return list(self._entries)
+
+    def entry(self, key):
+        """Returnează intrarea curentă pentru o cheie (sau None), fără a o încărca"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def find(self, value):
+        """Returnează intrarea care conține exact obiectul dat (sau None)"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.value is value:
+                    return entry
+        return None
+
+    def derived(self, value, name, builder):
+        """
+        Memoizează un artefact calculat din valoarea unei intrări
+
+        Artefactul este păstrat în intrare, deci dispare odată cu versiunea de
+        date din care a fost calculat. Pentru valori care nu provin din cache
+        (ex. datele demo) se calculează direct, fără memoizare.
+        """
+        entry = self.find(value)
+        if entry is None:
+            return builder(value)
+
+        with self._lock:
+            lock = entry.locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in entry.extra:
+                entry.extra[name] = builder(value)
+            return entry.extra[name]
+
+    def is_fresh(self, entry, fingerprint):
+        """Verifică dacă o intrare corespunde amprentei și nu a expirat"""
+        if entry.fingerprint != fingerprint:
+            return False
+        return self.ttl is None or self._clock() - entry.loaded_at < self.ttl
+
+    def get(self, key, fingerprint, loader):
+        """
+        Returnează valoarea pentru cheie, încărcând-o dacă este nevoie
+
+        Args:
+            key: Cheia intrării (ex. (set de date, coloane))
+            fingerprint: Amprenta curentă a fișierului sursă
+            loader: Funcție fără argumente care produce valoarea
+
+        Returns:
+            Valoarea din cache. Dacă sursa s-a schimbat sau intrarea a expirat,
+            se returnează valoarea anterioară și se pornește reîncărcarea în fundal.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if self.is_fresh(entry, fingerprint):
+                    return entry.value
+                if self.background:
+                    self._schedule_refresh(key, fingerprint, loader)
+                    return entry.value
+
+        return self.refresh(key, fingerprint, loader).value
+
+    def refresh(self, key, fingerprint, loader):
+        """
+        Încarcă sincron valoarea și o înlocuiește atomic în cache
+
+        Loader-ul poate returna un Versioned pentru a publica valoarea împreună
+        cu artefactele derivate (vezi derived) deja calculate.
+        """
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and self.is_fresh(entry, fingerprint):
+                    return entry
+
+            value = loader()
+            extra = {}
+            if isinstance(value, Versioned):
+                value, extra = value.value, dict(value.extra)
+            entry = CacheEntry(fingerprint, value, self._clock(), estimate_nbytes(value), extra)
+            self.put(key, entry)
+            return entry
+
+    def put(self, key, entry):
+        """Inserează o intrare deja construită și aplică evacuarea LRU"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict(protect=key)
+
+    def invalidate(self, key=None):
+        """Elimină o intrare (sau toate intrările când key este None)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def wait(self, timeout=None):
+        """Așteaptă finalizarea reîncărcărilor din fundal"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _schedule_refresh(self, key, fingerprint, loader):
+        thread = self._refreshing.get(key)
+        if thread is not None and thread.is_alive():
+            return
+
+        def run():
+            try:
+                self.refresh(key, fingerprint, loader)
+            except Exception as exc:
+                logger.warning("Reîncărcarea %s a eșuat, se păstrează versiunea anterioară: %s", key, exc)
+            finally:
+                with self._lock:
+                    if self._refreshing.get(key) is threading.current_thread():
+                        del self._refreshing[key]
+
+        thread = threading.Thread(target=run, name=f"cache-refresh-{key}", daemon=True)
+        self._refreshing[key] = thread
+        thread.start()
+
+    def _evict(self, protect=None):
+        total = sum(entry.nbytes for entry in self._entries.values())
+        for key in list(self._entries):
+            over_entries = self.max_entries is not None and len(self._entries) > self.max_entries
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            if not (over_entries or over_bytes):
+                break
+            if key == protect:
+                continue
+            total -= self._entries.pop(key).nbytes
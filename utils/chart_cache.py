@@ -0,0 +1,108 @@
+"""
+Cache LRU pentru figurile Plotly gata de trimis în browser
+
+Cheia unei figuri este (tipul graficului, versiunea datelor, selecția de
+filtre normalizată, opțiunile de afișare). La un rerun cu aceeași selecție
+(inclusiv rerun-uri declanșate de alte widget-uri) nu se mai refac nici
+agregarea, nici construcția și validarea figurii. st.plotly_chart mai face
+doar serializarea în JSON a dicționarului deja validat (o singură trecere
+prin encoder, fără obiecte Plotly intermediare).
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from config.settings import CHART_CACHE_MAX_ENTRIES
+from utils.data_loaders import get_data_version
+from utils.filter_index import normalize_filters
+from utils.profiling import span
+
+
+class FigureSpec(go.Figure):
+    """
+    Figură cu specificația (dicționar JSON simplu) calculată o singură dată
+
+    st.plotly_chart citește figura prin to_dict() și, fiind un go.Figure, nu o
+    mai validează; rămâne doar codificarea JSON a specificației. Specificația
+    este partajată între sesiuni și nu trebuie modificată.
+    """
+
+    def __init__(self, figure):
+        serialized = figure.to_json()
+        # Figura sursă a fost deja validată la construcție
+        super().__init__(json.loads(serialized), _validate=False)
+        self._spec = json.loads(serialized)
+
+    def to_dict(self):
+        return self._spec
+
+
+class ChartCache:
+    """
+    Cache LRU thread-safe pentru figuri
+
+    Args:
+        max_entries: Numărul maxim de figuri păstrate
+    """
+
+    def __init__(self, max_entries=CHART_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_build(self, key, builder):
+        """Returnează figura pentru cheie, construind-o (o singură dată) dacă lipsește"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        figure = builder()
+        spec = FigureSpec(figure) if figure is not None else None
+        with self._lock:
+            self._entries[key] = spec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return spec
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+CHART_CACHE = ChartCache()
+
+
+def cached_figure(chart_type, df, filters, builder, options=None):
+    """
+    Figura memoizată pentru o versiune de date și o selecție de filtre
+
+    Args:
+        chart_type: Numele graficului (ex. 'treemap_stoc')
+        df: DataFrame-ul din cache din care provine figura (dă versiunea datelor)
+        filters: Dicționar coloană -> valori selectate
+        builder: Funcție fără argumente care returnează go.Figure (sau None
+                 când nu există date de afișat)
+        options: Parametri de afișare care influențează figura (titlu, UM etc.)
+
+    Returns:
+        Figura (FigureSpec) sau None; pentru date care nu provin din cache
+        (ex. datele demo) figura este construită fără memoizare
+    """
+    def timed_builder():
+        with span(f"figură {chart_type}", 'render'):
+            return builder()
+
+    version = get_data_version(df)
+    if version is None:
+        return timed_builder()
+    key = (chart_type, version, normalize_filters(filters), tuple(sorted((options or {}).items())))
+    return CHART_CACHE.get_or_build(key, timed_builder)
@@ -2,35 +2,280 @@
 Funcții pentru încărcarea datelor din fișierele Excel
 """
 
-import streamlit as st
+import logging
+
 import pandas as pd
 
-@st.cache_data
-def load_balanta_la_data():
-    """Încarcă datele din Excel - Balanță la dată"""
-    try:
-        df = pd.read_excel("data/LaData.xlsx")
+from config.schemas import DATASET_SCHEMAS
+from config.settings import DATA_PATHS, INGEST_INCREMENTAL
+from utils.cache import DatasetCache, Versioned
+from utils.excel_reader import read_excel_streaming
+from utils.incremental import carry_forward
+from utils.profiling import span
+from utils.schema import schema_tag
+from utils.snapshots import file_signature, load_with_snapshot, read_snapshot_meta
+
+logger = logging.getLogger(__name__)
+
+# Cache partajat de toate sesiunile din procesul Streamlit. DataFrame-urile
+# returnate sunt aceleași obiecte pentru toți utilizatorii și nu trebuie
+# modificate pe loc; paginile lucrează cu selecții de rânduri (utils.views).
+DATASET_CACHE = DatasetCache()
+
+# Copy-on-Write (implicit din pandas 3): obiectele derivate din cadrele
+# partajate nu copiază datele decât dacă sunt modificate
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+
+# Date demo afișate când exportul lipsește (pentru celelalte seturi: DataFrame gol cu coloanele din schemă)
+DEMO_FRAMES = {
+    'balanta_la_data': {
+        'DenumireGest': ['Demo Gestiune'],
+        'Denumire': ['Produs Demo'],
+        'Stoc final': [100],
+        'ValoareStocFinal': [5000]
+    },
+    'balanta_perioada': {
+        'Denumire gestiune': ['Demo Gestiune'],
+        'Denumire': ['Produs Demo'],
+        'Stoc final': [100],
+        'ZileVechime': [10]
+    },
+}
+
+
+def _typed_reader(key):
+    """Returnează un reader care parsează Excel-ul pe bucăți și aplică schema setului de date"""
+    def reader(path):
+        df = read_excel_streaming(path, DATASET_SCHEMAS.get(key))
+        report = df.attrs['memory_report']
+        logger.info(
+            "%s: %d rânduri, memorie %.1f MB -> %.1f MB",
+            key, report['rows'], report['memory_before'] / 1024 ** 2, report['memory_after'] / 1024 ** 2,
+        )
         return df
-    except:
-        return pd.DataFrame({
-            'DenumireGest': ['Demo Gestiune'],
-            'Denumire': ['Produs Demo'],
-            'Stoc final': [100],
-            'ValoareStocFinal': [5000]
-        })
-
-@st.cache_data
-def load_balanta_perioada():
-    """Încarcă datele din Excel - Balanță pe perioadă"""
-    try:
-        df = pd.read_excel("data/Perioada.xlsx")
+    return reader
+
+
+def _load_snapshot(key, path, columns):
+    return load_with_snapshot(key, path, _typed_reader(key), columns, tag=schema_tag(DATASET_SCHEMAS.get(key)))
+
+
+def _load_incremental(key, path):
+    """
+    Încarcă versiunea completă a unui set de date, pornind de la cea din cache
+
+    Exportul este parsat integral (fișierul xlsx nu poate fi citit parțial),
+    dar artefactele derivate ale versiunii anterioare (cubul de stoc etc.)
+    sunt actualizate doar cu rândurile noi sau modificate.
+    """
+    previous = DATASET_CACHE.entry((key, None))
+    df = _load_snapshot(key, path, None)
+    if not INGEST_INCREMENTAL or previous is None:
         return df
-    except:
-        return pd.DataFrame({
-            'Denumire gestiune': ['Demo Gestiune'],
-            'Denumire': ['Produs Demo'],
-            'Stoc final': [100],
-            'ZileVechime': [10]
-        })
-
-# TODO: Adăugare alte funcții load_* pentru celelalte pagini
+    return Versioned(df, carry_forward(previous, df))
+
+
+def _load_precomputed(key, path, columns):
+    """Setul de date din artefactele precompute.py (None dacă nu există sau nu corespund sursei)"""
+    from utils.artifacts import load_artifacts
+
+    artifact = load_artifacts(key, path, columns)
+    if artifact is None:
+        return None
+    df, extra = artifact
+    return df if columns is not None else Versioned(df, extra)
+
+
+def _loader(key, path, columns):
+    def load():
+        precomputed = _load_precomputed(key, path, columns)
+        if precomputed is not None:
+            return precomputed
+        if columns is None:
+            return _load_incremental(key, path)
+        return _load_snapshot(key, path, columns)
+    return load
+
+
+def get_memory_report(key):
+    """
+    Raportul de memorie de la ultima parsare a unui set de date
+
+    Returns:
+        Dicționar cu rows, memory_before, memory_after (octeți) sau None
+    """
+    meta = read_snapshot_meta(key)
+    return meta.get('report') if meta else None
+
+
+def _fingerprint(path):
+    signature = file_signature(path)
+    return signature['mtime_ns'], signature['size']
+
+
+def load_dataset_cached(key, columns=None):
+    """
+    Încarcă un set de date din DATA_PATHS prin cache-ul cu amprentă de fișier
+
+    Amprenta (mtime, dimensiune) se verifică la fiecare rerun, deci un export
+    nou este observat imediat; până la finalizarea încărcării se servește
+    versiunea anterioară.
+
+    Args:
+        key: Cheia din DATA_PATHS
+        columns: Coloanele necesare paginii (None = toate)
+
+    Returns:
+        DataFrame-ul încărcat; ridică FileNotFoundError dacă fișierul lipsește
+    """
+    path = DATA_PATHS[key]
+    columns = tuple(columns) if columns is not None else None
+
+    return DATASET_CACHE.get((key, columns), _fingerprint(path), _loader(key, path, columns))
+
+
+def prewarm_dataset(key):
+    """
+    Reîncarcă un set de date în afara rerun-urilor utilizatorilor
+
+    Parsează fișierul (actualizând snapshot-ul) și înlocuiește atomic toate
+    variantele din cache ale setului de date (toate coloanele și subseturile
+    cerute de pagini), astfel încât rerun-urile să nu mai ajungă la parsare.
+    Subseturile de coloane sunt selectate din noua versiune completă, iar
+    pentru exporturile de stoc și vânzări se construiesc și cheile de produs.
+    """
+    path = DATA_PATHS[key]
+    fingerprint = _fingerprint(path)
+    variants = {cache_key[1] for cache_key in DATASET_CACHE.keys() if cache_key[0] == key}
+    variants.discard(None)
+
+    full = DATASET_CACHE.refresh((key, None), fingerprint, _loader(key, path, None)).value
+    for columns in variants:
+        DATASET_CACHE.refresh(
+            (key, columns),
+            fingerprint,
+            lambda columns=columns: full[[col for col in columns if col in full.columns]],
+        )
+
+    # Cheile de produs (indexul comun stoc-vânzări) se construiesc odată cu noua versiune
+    from utils.product_index import PRODUCT_KEY_DATASETS, get_product_keys
+
+    if key in PRODUCT_KEY_DATASETS:
+        get_product_keys(full, key)
+
+
+def get_derived(df, name, builder):
+    """
+    Calculează o singură dată per versiune de date un artefact derivat din df
+
+    Args:
+        df: DataFrame-ul returnat de un loader
+        name: Numele artefactului (ex. 'stock_cube')
+        builder: Funcția care primește df și construiește artefactul
+    """
+    def timed_builder(value):
+        with span(f"calcul {name}", 'aggregate'):
+            return builder(value)
+
+    return DATASET_CACHE.derived(df, name, timed_builder)
+
+
+def get_data_version(df):
+    """Returnează versiunea datelor (amprenta sursei) pentru un DataFrame din cache"""
+    entry = DATASET_CACHE.find(df)
+    return entry.fingerprint if entry is not None else None
+
+
+def demo_frame(key):
+    """DataFrame-ul afișat când exportul unui set de date lipsește sau nu poate fi citit"""
+    if key in DEMO_FRAMES:
+        return pd.DataFrame(DEMO_FRAMES[key])
+    return pd.DataFrame(columns=list(DATASET_SCHEMAS.get(key, {})))
+
+
+def load_dataset(key, columns=None):
+    """
+    Încarcă orice set de date din DATA_PATHS
+
+    Toate seturile de date trec prin același drum: citire Excel pe bucăți,
+    schemă de tipuri, snapshot (Parquet sau Arrow) și cache cu amprentă de fișier.
+
+    Args:
+        key: Cheia din DATA_PATHS
+        columns: Coloanele necesare paginii (None = toate)
+
+    Returns:
+        DataFrame-ul încărcat sau datele demo dacă fișierul lipsește
+    """
+    try:
+        with span(f"încărcare {key}", 'load'):
+            return load_dataset_cached(key, columns)
+    except Exception as exc:
+        logger.warning("Setul de date %s nu a putut fi încărcat: %s", key, exc)
+        return demo_frame(key)
+
+
+def load_balanta_la_data(columns=None):
+    """
+    Încarcă datele din Excel - Balanță la dată
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('balanta_la_data', columns)
+
+def load_balanta_perioada(columns=None):
+    """
+    Încarcă datele din Excel - Balanță pe perioadă
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('balanta_perioada', columns)
+
+def load_vanzari_zi_clienti(columns=None):
+    """
+    Încarcă datele din Excel - Vânzări pe zile și clienți
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('vanzari_zi_clienti', columns)
+
+def load_top_produse(columns=None):
+    """
+    Încarcă datele din Excel - Top produse
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('top_produse', columns)
+
+def load_neincasate(columns=None):
+    """
+    Încarcă datele din Excel - Facturi neîncasate
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('neincasate', columns)
+
+def load_neachitate(columns=None):
+    """
+    Încarcă datele din Excel - Facturi neachitate
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('neachitate', columns)
+
+def load_plati_cu_efecte(columns=None):
+    """
+    Încarcă datele din Excel - Plăți cu efecte
+
+    Args:
+        columns: Coloanele necesare paginii (None = toate)
+    """
+    return load_dataset('plati_cu_efecte', columns)
@@ -0,0 +1,239 @@
+"""
+Index pe date calendaristice pentru exporturile de vânzări și cumpărări
+
+Coloana de dată este parsată o singură dată per versiune de date: rândurile
+sunt ordonate după zi (cu offset-urile fiecărei zile), iar totalurile zilnice
+sunt păstrate ca sume cumulative. Opțiunile filtrului de dată, rândurile unei
+zile sau ale unui interval și totalurile pe interval sunt apoi simple
+căutări binare și diferențe, fără parcurgerea datelor. Agregările pe
+săptămână și lună se calculează din totalurile zilnice.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loaders import get_derived
+from utils.incremental import register_delta_updater
+
+DATE_COLUMN = 'Data'
+
+# Coloanele însumate pe zile
+DATE_METRICS = ('Valoare', 'Cantitate')
+
+# Granularitatea afișată -> frecvența pandas pentru agregare
+ROLLUP_FREQUENCIES = {
+    'Zi': 'D',
+    'Săptămână': 'W',
+    'Lună': 'M',
+}
+
+
+def _day_numbers(values):
+    """Numărul zilei (de la 1970-01-01) pentru fiecare dată validă"""
+    return np.asarray(values, dtype='datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+
+
+def _as_day(value):
+    return int(np.datetime64(pd.Timestamp(value), 'D').astype(np.int64))
+
+
+class DateIndex:
+    """
+    Rândurile și totalurile unui set de date ordonate pe zile
+
+    Args:
+        df: DataFrame-ul din cache
+        column: Coloana de dată (lipsa ei produce un index gol, vezi available)
+        metrics: Coloanele numerice însumate pe zile (cele lipsă sunt ignorate)
+    """
+
+    def __init__(self, df, column=DATE_COLUMN, metrics=DATE_METRICS):
+        self.column = column
+        self.available = column in df.columns
+        self.metrics = [col for col in metrics if col in df.columns]
+
+        dates = pd.DatetimeIndex(pd.to_datetime(df[column], errors='coerce') if self.available else [])
+        valid = ~dates.isna()
+        positions = np.flatnonzero(valid)
+        day_numbers = _day_numbers(dates[valid])
+
+        # Rândurile ordonate după zi și offset-urile fiecărei zile distincte
+        order = np.argsort(day_numbers, kind='stable')
+        days, counts = np.unique(day_numbers, return_counts=True)
+
+        # Valorile distincte din coloană (pot avea și oră), ordonate, pentru filtrele pe valori
+        raw = pd.DatetimeIndex(dates[valid].unique()).sort_values()
+
+        # Totalurile zilnice
+        day_codes = np.repeat(np.arange(len(counts)), counts)
+        daily = {'randuri': counts.astype(np.float64)}
+        for col in self.metrics:
+            values = np.nan_to_num(df[col].to_numpy(dtype=np.float64, na_value=np.nan))[positions[order]]
+            daily[col] = np.bincount(day_codes, weights=values, minlength=len(counts))
+        self._set_days(positions[order], days, counts, daily, raw)
+
+    def _set_days(self, order, day_numbers, counts, daily, raw):
+        """Atributele derivate din rândurile ordonate pe zile și din totalurile zilnice"""
+        self.order = order
+        self._day_numbers = day_numbers
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.days = pd.DatetimeIndex(day_numbers.astype('datetime64[D]').astype('datetime64[ns]'))
+        self.options = [day.strftime('%Y-%m-%d') for day in self.days]
+        self._raw_values = raw
+        self._raw_days = _day_numbers(raw)
+
+        # Sumele cumulative ale totalurilor zilnice (totalul unui interval = o diferență)
+        self.daily = daily
+        self._cumulative = {name: np.concatenate(([0.0], np.cumsum(values))) for name, values in daily.items()}
+
+        self._rollups = {}
+        self._lock = threading.Lock()
+
+    def extended(self, tail, offset):
+        """
+        Indexul rândurilor curente urmate de rândurile unui index adăugat
+
+        Args:
+            tail: DateIndex-ul rândurilor adăugate (aceleași coloană și metrici)
+            offset: Poziția primului rând adăugat în setul de date complet
+
+        Returns:
+            DateIndex nou, identic cu cel construit pe tot setul de date; în
+            fiecare zi rândurile existente rămân înaintea celor adăugate
+        """
+        days = np.union1d(self._day_numbers, tail._day_numbers)
+        old_at = np.searchsorted(days, self._day_numbers)
+        new_at = np.searchsorted(days, tail._day_numbers)
+        old_counts, new_counts = np.diff(self.offsets), np.diff(tail.offsets)
+
+        counts = np.zeros(len(days), dtype=np.int64)
+        counts[old_at] += old_counts
+        before_new = counts.copy()
+        counts[new_at] += new_counts
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # Fiecare rând își păstrează locul din ziua lui, deplasat la începutul zilei în indexul nou
+        order = np.empty(len(self.order) + len(tail.order), dtype=np.int64)
+        within = np.arange(len(self.order)) - np.repeat(self.offsets[:-1], old_counts)
+        order[np.repeat(starts[old_at], old_counts) + within] = self.order
+        within = np.arange(len(tail.order)) - np.repeat(tail.offsets[:-1], new_counts)
+        new_starts = starts[new_at] + before_new[new_at]
+        order[np.repeat(new_starts, new_counts) + within] = tail.order + offset
+
+        daily = {}
+        for name, values in self.daily.items():
+            daily[name] = np.zeros(len(days))
+            daily[name][old_at] += values
+            daily[name][new_at] += tail.daily[name]
+        raw = self._raw_values.append(tail._raw_values).unique().sort_values()
+
+        merged = object.__new__(DateIndex)
+        merged.column, merged.available, merged.metrics = self.column, self.available, self.metrics
+        merged._set_days(order, days, counts, daily, pd.DatetimeIndex(raw))
+        return merged
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def first(self):
+        return self.days[0] if len(self.days) else None
+
+    @property
+    def last(self):
+        return self.days[-1] if len(self.days) else None
+
+    def day_range(self, start=None, end=None):
+        """
+        Pozițiile (lo, hi) ale zilelor din intervalul [start, end] în self.days
+
+        Args:
+            start: Prima zi (None = prima zi din date)
+            end: Ultima zi, inclusiv (None = aceeași cu start; fără start = ultima zi)
+        """
+        if start is None:
+            lo = 0
+            hi = len(self.days) if end is None else np.searchsorted(self._day_numbers, _as_day(end), side='right')
+            return lo, int(hi)
+        end = start if end is None else end
+        lo = np.searchsorted(self._day_numbers, _as_day(start), side='left')
+        hi = np.searchsorted(self._day_numbers, _as_day(end), side='right')
+        return int(lo), int(max(hi, lo))
+
+    def rows(self, start=None, end=None):
+        """Pozițiile rândurilor din intervalul de zile (ordonate după dată)"""
+        lo, hi = self.day_range(start, end)
+        return self.order[self.offsets[lo]:self.offsets[hi]]
+
+    def values(self, start=None, end=None):
+        """Valorile distincte ale coloanei de dată din interval (pentru filtrele pe valori)"""
+        lo, hi = self.day_range(start, end)
+        if lo >= hi:
+            return []
+        first = np.searchsorted(self._raw_days, self._day_numbers[lo], side='left')
+        last = np.searchsorted(self._raw_days, self._day_numbers[hi - 1], side='right')
+        return list(self._raw_values[first:last])
+
+    def totals(self, start=None, end=None):
+        """Totalurile pe intervalul de zile: 'randuri' și fiecare metrică"""
+        lo, hi = self.day_range(start, end)
+        return {name: float(cumulative[hi] - cumulative[lo]) for name, cumulative in self._cumulative.items()}
+
+    def rollup(self, freq='D', start=None, end=None):
+        """
+        Totalurile pe zi ('D'), săptămână ('W') sau lună ('M')
+
+        Args:
+            freq: Frecvența agregării
+            start, end: Intervalul de zile inclus (None = toate zilele; vezi day_range)
+
+        Returns:
+            DataFrame indexat după începutul perioadei, cu 'randuri' și metricile;
+            tabelul pentru toate zilele este memoizat, partajat și nu trebuie modificat
+        """
+        if start is not None or end is not None:
+            lo, hi = self.day_range(start, end)
+            return self._rollup(freq, lo, hi)
+
+        with self._lock:
+            if freq in self._rollups:
+                return self._rollups[freq]
+        table = self._rollup(freq, 0, len(self.days))
+        with self._lock:
+            self._rollups[freq] = table
+        return table
+
+    def _rollup(self, freq, lo, hi):
+        days = self.days[lo:hi]
+        table = pd.DataFrame(
+            {name: values[lo:hi] for name, values in self.daily.items()},
+            index=pd.DatetimeIndex(days, name=self.column),
+        )
+        if freq != 'D':
+            table = table.groupby(days.to_period(freq).start_time).sum()
+            table.index.name = self.column
+        return table
+
+
+def apply_date_delta(index, old_df, new_df, delta):
+    """
+    Adaugă la index rândurile noi ale unui export care crește prin adăugare
+
+    Doar rândurile adăugate sunt parsate și ordonate; pentru orice altă
+    modificare (rânduri eliminate sau schimbate) returnează None și indexul
+    se recalculează complet (vezi utils.incremental).
+    """
+    if not delta.appended or not index.available:
+        return None
+    tail = DateIndex(new_df.iloc[delta.added], index.column, index.metrics)
+    return index.extended(tail, len(old_df))
+
+
+def get_date_index(df):
+    """Returnează indexul pe date construit o singură dată per versiune de date"""
+    return get_derived(df, 'date_index', DateIndex)
+
+
+register_delta_updater('date_index', apply_date_delta)
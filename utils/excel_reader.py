@@ -0,0 +1,137 @@
+"""
+Citire pe bucăți (streaming) a fișierelor Excel exportate din ERP
+
+Folosește openpyxl în modul read-only, care parcurge foaia rând cu rând fără
+a construi întregul document în memorie. Rândurile sunt grupate în bucăți
+de EXCEL_CHUNK_ROWS, fiecare bucată fiind tipizată conform schemei imediat
+după citire.
+"""
+
+import pandas as pd
+from openpyxl import load_workbook
+from pandas.api.types import union_categoricals
+
+from config.settings import EXCEL_CHUNK_ROWS
+from utils.schema import apply_schema, memory_usage_bytes
+
+
+def _normalize_header(header):
+    """Denumiri de coloane ca în pandas.read_excel: 'Unnamed: i' pentru celule goale, sufix .n pentru duplicate"""
+    columns = []
+    seen = {}
+    for position, name in enumerate(header):
+        name = f"Unnamed: {position}" if name is None else str(name).strip()
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def iter_excel_chunks(path, chunk_rows=EXCEL_CHUNK_ROWS, sheet_name=None):
+    """
+    Parcurge o foaie Excel în bucăți de DataFrame-uri
+
+    Args:
+        path: Calea către fișierul Excel
+        chunk_rows: Numărul maxim de rânduri per bucată
+        sheet_name: Foaia de citit (implicit prima)
+
+    Yields:
+        DataFrame-uri cu aceleași coloane (prima linie a foii este antetul)
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _normalize_header(header)
+        width = len(columns)
+        padding = (None,) * width
+
+        chunk = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            chunk.append((tuple(row) + padding)[:width])
+            if len(chunk) >= chunk_rows:
+                yield pd.DataFrame.from_records(chunk, columns=columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame.from_records(chunk, columns=columns)
+    finally:
+        workbook.close()
+
+
+def concat_typed_chunks(chunks):
+    """
+    Concatenează bucățile tipizate păstrând coloanele categoriale
+
+    pd.concat ar transforma în object categoriile care diferă între bucăți;
+    aici ele sunt unite cu union_categoricals.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+
+    columns = list(chunks[0].columns)
+    categorical = [col for col in columns if isinstance(chunks[0][col].dtype, pd.CategoricalDtype)]
+    frame = pd.concat([chunk.drop(columns=categorical) for chunk in chunks], ignore_index=True)
+
+    for col in categorical:
+        parts = [chunk[col] for chunk in chunks]
+        try:
+            frame[col] = union_categoricals(parts, ignore_order=True)
+        except TypeError:
+            # Categorii de tipuri diferite între bucăți (ex. o bucată doar cu valori lipsă)
+            frame[col] = pd.concat([part.astype(object) for part in parts], ignore_index=True).astype("category")
+    return frame[columns]
+
+
+def _differing_dtypes(chunks, schema):
+    """Coloanele din schemă al căror tip diferă între bucăți (ex. întregi într-o bucată, float în alta)"""
+    return {
+        column: kind
+        for column, kind in (schema or {}).items()
+        if column in chunks[0].columns and len({str(chunk[column].dtype) for chunk in chunks}) > 1
+    }
+
+
+def read_excel_streaming(path, schema=None, chunk_rows=EXCEL_CHUNK_ROWS, sheet_name=None):
+    """
+    Citește un fișier Excel pe bucăți și aplică schema pe fiecare bucată
+
+    Doar bucata netipizată curentă este ținută în memorie, deci bufferul
+    netipizat depinde de chunk_rows, nu de fișier. Bucățile tipizate rămân
+    însă în memorie până la concatenare: vârful este de circa două ori setul
+    de date tipizat. Ele sunt eliberate înainte de corecția finală, care
+    convertește doar coloanele cu tipuri diferite între bucăți, fără o nouă
+    copie a întregului DataFrame.
+
+    Returns:
+        DataFrame-ul tipizat; df.attrs['memory_report'] conține rows,
+        memory_before (estimată pe bucățile netipizate) și memory_after
+    """
+    chunks = []
+    memory_before = 0
+    for chunk in iter_excel_chunks(path, chunk_rows, sheet_name):
+        memory_before += memory_usage_bytes(chunk)
+        chunks.append(apply_schema(chunk, schema, copy=False))
+
+    differing = _differing_dtypes(chunks, schema) if len(chunks) > 1 else {}
+    df = concat_typed_chunks(chunks)
+    chunks.clear()
+    if differing:
+        # Tipurile numerice care diferă între bucăți sunt aduse la tipul din schemă
+        df = apply_schema(df, differing, copy=False)
+    df.attrs['memory_report'] = {
+        'rows': len(df),
+        'memory_before': memory_before,
+        'memory_after': memory_usage_bytes(df),
+    }
+    return df
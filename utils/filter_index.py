@@ -0,0 +1,185 @@
+"""
+Index de filtrare pentru filtrele multiselect în cascadă
+
+Pentru fiecare coloană de filtrare se păstrează codurile categoriale ale
+rândurilor și, pentru fiecare valoare, lista sortată a rândurilor în care
+apare (index inversat). Opțiunile filtrelor și rândurile filtrate se obțin
+din intersecții de măști booleene, fără copii ale DataFrame-ului.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loaders import get_derived
+from utils.views import FrameView
+
+FILTER_COLUMNS = ['DenumireGest', 'Denumire gestiune', 'Grupa', 'Denumire', 'Furnizor IN', 'Producator']
+
+# Sub această fracțiune de rânduri selectate, masca se construiește din listele inversate
+POSTINGS_THRESHOLD = 0.125
+
+
+def normalize_filters(filters):
+    """Selecția de filtre ca tuplu sortat, fără filtrele goale (ordinea selecției nu contează)"""
+    return tuple(sorted(
+        (str(column), tuple(sorted(str(value) for value in values)))
+        for column, values in (filters or {}).items()
+        if len(values)
+    ))
+
+
+class FilterIndex:
+    """
+    Index construit o singură dată per set de date
+
+    Args:
+        df: DataFrame-ul indexat
+        columns: Coloanele pentru care se construiește indexul (cele lipsă sunt ignorate)
+    """
+
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.n_rows = len(df)
+        self._codes = {}
+        self._values = {}
+        self._order = {}
+        self._offsets = {}
+
+        for col in columns:
+            if col not in df.columns:
+                continue
+            codes, values = pd.factorize(df[col], sort=False)
+            codes = codes.astype(np.int32, copy=False)
+            counts = np.bincount(codes[codes >= 0], minlength=len(values))
+            order = np.argsort(codes, kind='stable').astype(np.int64, copy=False)
+
+            self._codes[col] = codes
+            self._values[col] = pd.Index(values)
+            # Rândurile cu valori lipsă (cod -1) sunt la început și nu aparțin niciunei valori
+            self._order[col] = order[self.n_rows - counts.sum():]
+            self._offsets[col] = np.concatenate(([0], np.cumsum(counts)))
+
+    @classmethod
+    def from_state(cls, n_rows, state):
+        """
+        Reconstruiește indexul din tablourile salvate (vezi state), fără a-l recalcula
+
+        Tablourile pot fi memory-mapped read-only; indexul nu le modifică.
+        """
+        index = cls.__new__(cls)
+        index.n_rows = n_rows
+        index._codes = {col: arrays['codes'] for col, arrays in state.items()}
+        index._values = {col: pd.Index(arrays['values']) for col, arrays in state.items()}
+        index._order = {col: arrays['order'] for col, arrays in state.items()}
+        index._offsets = {col: arrays['offsets'] for col, arrays in state.items()}
+        return index
+
+    def state(self):
+        """Tablourile indexului per coloană: codes, values, order, offsets"""
+        return {
+            col: {
+                'codes': self._codes[col],
+                'values': self._values[col],
+                'order': self._order[col],
+                'offsets': self._offsets[col],
+            }
+            for col in self._codes
+        }
+
+    @property
+    def columns(self):
+        return list(self._codes)
+
+    def __contains__(self, column):
+        return column in self._codes
+
+    def codes(self, column):
+        """Codurile categoriale ale rândurilor pentru o coloană (-1 pentru valori lipsă)"""
+        return self._codes[column]
+
+    def values(self, column):
+        """Valorile distincte ale coloanei, în ordinea primei apariții"""
+        return self._values[column]
+
+    def value_codes(self, column, values):
+        """Codurile pentru o listă de valori (valorile necunoscute sunt ignorate)"""
+        codes = self._values[column].get_indexer(pd.Index(list(values)))
+        return codes[codes >= 0]
+
+    def row_count(self, codes, column):
+        """Numărul de rânduri care au unul dintre codurile date în coloană"""
+        offsets = self._offsets[column]
+        return int((offsets[codes + 1] - offsets[codes]).sum())
+
+    def postings(self, codes, column):
+        """Pozițiile (crescătoare) ale rândurilor care au unul dintre codurile date în coloană"""
+        offsets, order = self._offsets[column], self._order[column]
+        parts = [order[offsets[code]:offsets[code + 1]] for code in codes]
+        return np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.int64)
+
+    def value_mask(self, column, values):
+        """Masca booleană a rândurilor care au una dintre valorile date în coloană"""
+        codes = self.value_codes(column, values)
+        selected_rows = self.row_count(codes, column)
+
+        if selected_rows < POSTINGS_THRESHOLD * self.n_rows:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            offsets, order = self._offsets[column], self._order[column]
+            for code in codes:
+                mask[order[offsets[code]:offsets[code + 1]]] = True
+            return mask
+
+        lookup = np.zeros(len(self._values[column]) + 1, dtype=bool)
+        lookup[codes] = True
+        # Codul -1 (valoare lipsă) cade pe ultima poziție, care rămâne False
+        return lookup[self._codes[column]]
+
+    def mask(self, selections, base=None):
+        """
+        Intersecția selecțiilor active
+
+        Args:
+            selections: Dicționar coloană -> valori selectate (listele goale sunt ignorate)
+            base: O mască existentă de restrâns (ex. din etapa anterioară a cascadei)
+
+        Returns:
+            Masca booleană sau None dacă nu există nicio restricție
+        """
+        mask = base
+        for column, values in selections.items():
+            if column not in self._codes or not len(values):
+                continue
+            value_mask = self.value_mask(column, values)
+            mask = value_mask if mask is None else mask & value_mask
+        return mask
+
+    def options(self, column, mask=None):
+        """
+        Valorile coloanei prezente în rândurile selectate de mască
+
+        Păstrează ordinea primei apariții, la fel ca Series.unique().
+        """
+        values = self._values[column]
+        if mask is None:
+            return values.tolist()
+        codes = self._codes[column][mask]
+        present = np.bincount(codes[codes >= 0], minlength=len(values)) > 0
+        return values[present].tolist()
+
+    def positions(self, mask):
+        """Pozițiile rândurilor selectate (None când nu există filtrare)"""
+        return None if mask is None else np.flatnonzero(mask)
+
+    def view(self, df, mask):
+        """Vizualizare read-only a rândurilor selectate de mască, fără copierea datelor"""
+        return FrameView(df, self.positions(mask), self)
+
+    def take(self, df, mask):
+        """Returnează rândurile din df selectate de mască (df neschimbat dacă masca este None)"""
+        if mask is None:
+            return df
+        return df.take(np.flatnonzero(mask))
+
+
+def get_filter_index(df):
+    """Returnează indexul de filtrare construit o singură dată per versiune de date"""
+    return get_derived(df, 'filter_index', FilterIndex)
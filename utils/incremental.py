@@ -0,0 +1,120 @@
+"""
+Încărcare incrementală a exporturilor ERP care cresc prin adăugare
+
+Un export nou este comparat cu versiunea din cache prin hash-ul fiecărui
+rând: rândurile noi sau modificate formează delta. Artefactele derivate cu o
+actualizare înregistrată (register_delta_updater) sunt actualizate doar cu
+această deltă în loc să fie recalculate pe tot istoricul: cubul de stoc
+(orice deltă) și indexul pe date (doar adăugări, ex. exportul de vânzări).
+Celelalte artefacte (ex. motorul de clasamente) se recalculează la prima
+utilizare a noii versiuni.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from config.settings import INCREMENTAL_MAX_CHANGE
+
+logger = logging.getLogger(__name__)
+
+ROW_HASHES = 'row_hashes'
+
+# Nume artefact derivat -> funcție (artefact, df_vechi, df_nou, delta) -> artefact actualizat sau None
+DELTA_UPDATERS = {}
+
+
+@dataclass
+class RowDelta:
+    """Diferența dintre două versiuni ale unui set de date, ca poziții de rânduri"""
+    added: np.ndarray
+    removed: np.ndarray
+    appended: bool
+
+    @property
+    def size(self):
+        return len(self.added) + len(self.removed)
+
+
+def register_delta_updater(name, updater):
+    """Înregistrează actualizarea incrementală pentru un artefact derivat (vezi get_derived)"""
+    DELTA_UPDATERS[name] = updater
+
+
+def row_hashes(df):
+    """Hash-ul (uint64) fiecărui rând, independent de index"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def compute_delta(old_hashes, new_hashes):
+    """
+    Determină rândurile adăugate și eliminate între două versiuni
+
+    Args:
+        old_hashes: Hash-urile rândurilor din versiunea anterioară
+        new_hashes: Hash-urile rândurilor din versiunea nouă
+
+    Returns:
+        RowDelta (un rând modificat apare ca eliminat + adăugat) sau None dacă
+        delta nu poate fi determinată exact (rânduri duplicate cu altă multiplicitate)
+    """
+    old_count = len(old_hashes)
+    if len(new_hashes) >= old_count and np.array_equal(new_hashes[:old_count], old_hashes):
+        return RowDelta(np.arange(old_count, len(new_hashes)), np.array([], dtype=np.int64), True)
+
+    added = np.flatnonzero(~np.isin(new_hashes, old_hashes))
+    removed = np.flatnonzero(~np.isin(old_hashes, new_hashes))
+    if len(new_hashes) - len(added) != old_count - len(removed):
+        return None
+    return RowDelta(added, removed, False)
+
+
+def carry_forward(previous, df, max_change=INCREMENTAL_MAX_CHANGE):
+    """
+    Aplică delta față de versiunea din cache asupra artefactelor derivate
+
+    Args:
+        previous: CacheEntry cu versiunea anterioară a setului de date complet
+        df: DataFrame-ul noii versiuni
+        max_change: Fracția maximă de rânduri modificate pentru care se
+                    actualizează incremental (peste ea, artefactele se recalculează)
+
+    Returns:
+        Dicționarul de artefacte derivate pentru noua versiune: hash-urile
+        rândurilor și artefactele actualizate de un updater înregistrat;
+        artefactele fără updater (sau pentru care updater-ul renunță) lipsesc
+        și se recalculează la cerere
+    """
+    old_df = previous.value
+    extra = dict(previous.extra)
+    new_hashes = row_hashes(df)
+    result = {ROW_HASHES: new_hashes}
+    if list(old_df.columns) != list(df.columns):
+        return result
+
+    old_hashes = extra.get(ROW_HASHES)
+    if old_hashes is None:
+        old_hashes = row_hashes(old_df)
+    delta = compute_delta(old_hashes, new_hashes)
+    if delta is None or delta.size > max_change * max(len(df), 1):
+        return result
+
+    for name, artifact in extra.items():
+        updater = DELTA_UPDATERS.get(name)
+        if updater is None:
+            continue
+        try:
+            updated = updater(artifact, old_df, df, delta)
+        except Exception as exc:
+            logger.warning("Actualizarea incrementală pentru %s a eșuat: %s", name, exc)
+            continue
+        if updated is not None:
+            result[name] = updated
+
+    logger.info(
+        "Încărcare incrementală: +%d / -%d rânduri, artefacte reutilizate: %s",
+        len(delta.added), len(delta.removed), sorted(set(result) - {ROW_HASHES}),
+    )
+    return result
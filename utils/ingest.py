@@ -0,0 +1,128 @@
+"""
+Încărcarea în paralel a exporturilor la pornirea aplicației
+
+Fiecare fișier din DATA_PATHS este parsat într-un proces separat, care scrie
+snapshot-ul (vezi SNAPSHOT_FORMAT); procesul aplicației citește apoi doar snapshot-urile
+și construiește cheile de produs (utils.product_index) pentru seturile care le folosesc.
+Timpul total este dat de cel mai mare fișier, nu de suma tuturor.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config.schemas import DATASET_SCHEMAS
+from config.settings import DATA_PATHS, INGEST_WORKERS
+from utils.schema import schema_tag
+from utils.snapshots import resolve_fresh_snapshot
+
+logger = logging.getLogger(__name__)
+
+LAST_INGEST_REPORT = None
+
+
+def ingest_snapshot(key):
+    """
+    Parsează un export și scrie snapshot-ul (rulează în procesul worker)
+
+    Returns:
+        Dicționar cu key, status ('parsat', 'snapshot', 'lipsă', 'eroare'),
+        rows și seconds
+    """
+    from utils.data_loaders import _load_snapshot
+
+    path = DATA_PATHS[key]
+    start = time.perf_counter()
+    result = {'key': key, 'status': 'lipsă', 'rows': 0, 'seconds': 0.0}
+    if not os.path.exists(path):
+        return result
+
+    try:
+        fresh = resolve_fresh_snapshot(key, path, tag=schema_tag(DATASET_SCHEMAS.get(key)))
+        if fresh is not None:
+            result.update(status='snapshot', rows=fresh.get('rows', 0))
+        else:
+            df = _load_snapshot(key, path, None)
+            result.update(status='parsat', rows=len(df))
+    except Exception as exc:
+        result.update(status='eroare', error=str(exc))
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _needs_parse(key):
+    path = DATA_PATHS[key]
+    if not os.path.exists(path):
+        return False
+    try:
+        return resolve_fresh_snapshot(key, path, tag=schema_tag(DATASET_SCHEMAS.get(key))) is None
+    except OSError:
+        return True
+
+
+def ingest_all(keys=None, parallel=True, max_workers=INGEST_WORKERS):
+    """
+    Pregătește snapshot-urile pentru toate exporturile și le încarcă în cache
+
+    Args:
+        keys: Cheile din DATA_PATHS (implicit toate)
+        parallel: Dacă parsarea se face într-un pool de procese
+        max_workers: Numărul maxim de procese (None = numărul de nuclee)
+
+    Returns:
+        Dicționar cu mode, seconds (timpul total) și files - rezultatele per
+        fișier (vezi ingest_snapshot), completate cu cache_seconds (încărcarea
+        în cache și cheile de produs)
+    """
+    global LAST_INGEST_REPORT
+    from utils.data_loaders import load_dataset_cached
+    from utils.product_index import PRODUCT_KEY_DATASETS, get_product_keys
+
+    keys = list(keys or DATA_PATHS)
+    start = time.perf_counter()
+
+    # Doar fișierele fără snapshot valid ajung în pool; restul se rezolvă imediat
+    to_parse = [key for key in keys if _needs_parse(key)]
+    results = [ingest_snapshot(key) for key in keys if key not in to_parse]
+
+    if parallel and len(to_parse) > 1:
+        # 'spawn' evită fork-ul unui proces cu fire de execuție active (Streamlit, watcher)
+        context = multiprocessing.get_context('spawn')
+        workers = min(len(to_parse), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [pool.submit(ingest_snapshot, key) for key in to_parse]
+            results += [future.result() for future in as_completed(futures)]
+    else:
+        results += [ingest_snapshot(key) for key in to_parse]
+
+    for result in results:
+        if result['status'] not in ('parsat', 'snapshot'):
+            continue
+        cache_start = time.perf_counter()
+        try:
+            df = load_dataset_cached(result['key'])
+            if result['key'] in PRODUCT_KEY_DATASETS:
+                # Cheile de produs sunt gata înainte de prima afișare a paginilor
+                get_product_keys(df, result['key'])
+        except Exception as exc:
+            result.update(status='eroare', error=str(exc))
+        result['cache_seconds'] = time.perf_counter() - cache_start
+
+    results.sort(key=lambda result: keys.index(result['key']))
+    report = {
+        'mode': 'parallel' if parallel else 'sequential',
+        'seconds': time.perf_counter() - start,
+        'files': results,
+    }
+    for result in results:
+        logger.info("Ingest %s: %s, %d rânduri, %.2fs", result['key'], result['status'], result['rows'], result['seconds'])
+    logger.info("Ingest total (%s): %.2fs", report['mode'], report['seconds'])
+    LAST_INGEST_REPORT = report
+    return report
+
+
+def last_ingest_report():
+    """Raportul ultimei încărcări de la pornire (None dacă nu a rulat)"""
+    return LAST_INGEST_REPORT
@@ -0,0 +1,231 @@
+"""
+Indicatorii valorici de stoc (KPI) pentru toate paginile
+
+Valorile pe rând (ex. Stoc final × Preț vânzare) se calculează o singură
+dată per versiune de date, împreună cu sumele parțiale pe grupurile de
+filtrare (combinațiile distincte ale coloanelor cu puține valori: gestiune,
+grupă). Totalul pentru o selecție pe aceste coloane este suma parțialelor
+grupurilor selectate, fără o nouă parcurgere a rândurilor; selecțiile pe
+produse (și celelalte coloane indexate) se rezolvă din listele inversate
+ale FilterIndex, parcurgând doar rândurile selectate.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from config.settings import SELECTION_CACHE_SIZE
+from utils.data_loaders import get_derived
+from utils.filter_index import get_filter_index, normalize_filters
+
+# Nume KPI -> coloană (sumă) sau pereche de coloane (suma produselor pe rând)
+STOCK_KPIS = {
+    'valoare_stoc': 'ValoareStocFinal',
+    'valoare_vanzare': 'ValoareVanzare',
+    'valoare_intrare': 'Valoare intrare',
+    'stoc': 'Stoc final',
+    'valoare_pret_vanzare': ('Stoc final', 'Pret vanzare'),
+    'zile_vechime': 'ZileVechime',
+}
+
+# Coloanele de filtrare cu puține valori pe care se păstrează sumele parțiale
+GROUP_COLUMNS = ['DenumireGest', 'Denumire gestiune', 'Grupa']
+
+
+def _column_values(df, column):
+    return df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _row_values(df, definition):
+    """Valorile KPI pe rând (NaN unde lipsesc datele) sau None dacă lipsesc coloanele"""
+    columns = definition if isinstance(definition, tuple) else (definition,)
+    if not all(col in df.columns for col in columns):
+        return None
+    values = _column_values(df, columns[0])
+    for col in columns[1:]:
+        values = values * _column_values(df, col)
+    return values
+
+
+def group_rows(codes):
+    """
+    Grupează rândurile după combinația codurilor din coloanele de filtrare
+
+    Returns:
+        (codul grupului pentru fiecare rând, codurile fiecărei coloane per grup)
+    """
+    columns = list(codes)
+    n_rows = len(next(iter(codes.values()))) if codes else 0
+    if not columns:
+        return np.zeros(n_rows, dtype=np.int64), {}
+
+    # Codurile (cu -1 pentru valori lipsă) deplasate în [0, n] și combinate într-o singură cheie
+    shifted = [codes[col].astype(np.int64) + 1 for col in columns]
+    radices = [int(values.max(initial=0)) + 1 for values in shifted]
+    if np.prod([float(radix) for radix in radices]) < 2 ** 62:
+        combined = np.zeros(n_rows, dtype=np.int64)
+        for values, radix in zip(shifted, radices):
+            combined = combined * radix + values
+        keys, groups = np.unique(combined, return_inverse=True)
+        group_codes = {}
+        for col, radix in reversed(list(zip(columns, radices))):
+            group_codes[col] = (keys % radix - 1).astype(np.int32)
+            keys = keys // radix
+    else:
+        keys, groups = np.unique(np.column_stack(shifted), axis=0, return_inverse=True)
+        group_codes = {col: (keys[:, i] - 1).astype(np.int32) for i, col in enumerate(columns)}
+    return groups.reshape(-1), group_codes
+
+
+def split_selections(index, selections, group_columns):
+    """
+    Împarte o selecție de filtre în filtrele pe grupuri și cele rezolvate pe rânduri
+
+    Returns:
+        (selecția pe coloanele de grupare, selecția pe celelalte coloane indexate);
+        ridică KeyError pentru filtre pe coloane neindexate
+    """
+    on_groups, on_rows = {}, {}
+    for column, values in (selections or {}).items():
+        if not len(values):
+            continue
+        if column not in index:
+            raise KeyError(f"Coloana {column} nu este indexată pentru KPI")
+        (on_groups if column in group_columns else on_rows)[column] = values
+    return on_groups, on_rows
+
+
+def selection_rows(index, selections):
+    """Pozițiile (crescătoare) ale rândurilor care respectă toate filtrele, din listele inversate (None = fără filtre)"""
+    rows = None
+    for column, values in selections.items():
+        postings = index.postings(index.value_codes(column, values), column)
+        rows = postings if rows is None else np.intersect1d(rows, postings, assume_unique=True)
+    return rows
+
+
+class MetricsEngine:
+    """
+    KPI-uri calculate o singură dată per versiune de date
+
+    Args:
+        df: DataFrame-ul din cache
+        kpis: Definițiile KPI-urilor (implicit STOCK_KPIS); cele ale căror
+              coloane lipsesc au valoarea 0
+        group_columns: Coloanele indexate pe care se păstrează sumele parțiale
+    """
+
+    def __init__(self, df, kpis=STOCK_KPIS, group_columns=GROUP_COLUMNS):
+        self.index = get_filter_index(df)
+        self.n_rows = len(df)
+        self.kpis = list(kpis)
+
+        # Valorile derivate pe rând, partajate (nu se modifică)
+        self.row_values = {}
+        for name, definition in kpis.items():
+            values = _row_values(df, definition)
+            if values is not None:
+                self.row_values[name] = values
+
+        self.group_columns = [col for col in group_columns if col in self.index]
+        groups, self._group_codes = group_rows({col: self.index.codes(col) for col in self.group_columns})
+        n_groups = int(groups.max(initial=-1)) + 1
+        # Grupul fiecărui rând (restrânge la grupurile selectate rândurile rezolvate din listele inversate)
+        self.groups = groups.astype(np.int32) if n_groups < 2 ** 31 else groups
+        self._group_rows = np.bincount(groups, minlength=n_groups)
+        self._partials = {}
+        self._counts = {}
+        for name, values in self.row_values.items():
+            present = ~np.isnan(values)
+            self._partials[name] = np.bincount(groups[present], weights=values[present], minlength=n_groups)
+            self._counts[name] = np.bincount(groups[present], minlength=n_groups)
+
+        self._selections = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def n_groups(self):
+        return len(self._group_rows)
+
+    def group_codes(self, column):
+        """Codul valorii din coloana de filtrare pentru fiecare grup (-1 = valoare lipsă)"""
+        return self._group_codes[column]
+
+    def group_mask(self, selections=None):
+        """
+        Grupurile selectate de filtre
+
+        Args:
+            selections: Dicționar coloană de grupare -> valori selectate (listele goale sunt ignorate)
+
+        Returns:
+            Masca booleană pe grupuri sau None dacă nu există nicio restricție
+        """
+        mask = None
+        for column, values in (selections or {}).items():
+            if not len(values):
+                continue
+            lookup = np.zeros(len(self.index.values(column)) + 1, dtype=bool)
+            lookup[self.index.value_codes(column, values)] = True
+            # Codul -1 (valoare lipsă) cade pe ultima poziție, care rămâne False
+            column_mask = lookup[self._group_codes[column]]
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+    def _summary(self, selections):
+        key = normalize_filters(selections)
+        with self._lock:
+            if key in self._selections:
+                self._selections.move_to_end(key)
+                return self._selections[key]
+
+        on_groups, on_rows = split_selections(self.index, selections, self.group_columns)
+        mask = self.group_mask(on_groups)
+        rows = selection_rows(self.index, on_rows)
+        if rows is None:
+            pick = (lambda values: values) if mask is None else (lambda values: values[mask])
+            summary = {
+                'rows': int(pick(self._group_rows).sum()),
+                'sums': {name: float(pick(partial).sum()) for name, partial in self._partials.items()},
+                'counts': {name: int(pick(counts).sum()) for name, counts in self._counts.items()},
+            }
+        else:
+            # Doar rândurile produselor selectate, restrânse la grupurile selectate
+            if mask is not None:
+                rows = rows[mask[self.groups[rows]]]
+            selected = {name: values[rows] for name, values in self.row_values.items()}
+            summary = {
+                'rows': len(rows),
+                'sums': {name: float(np.nansum(values)) for name, values in selected.items()},
+                'counts': {name: int(np.count_nonzero(~np.isnan(values))) for name, values in selected.items()},
+            }
+        with self._lock:
+            self._selections[key] = summary
+            while len(self._selections) > SELECTION_CACHE_SIZE:
+                self._selections.popitem(last=False)
+        return summary
+
+    def totals(self, selections=None):
+        """
+        Sumele KPI-urilor pentru o selecție de filtre
+
+        Returns:
+            Dicționar nume KPI -> total (0 pentru KPI-urile fără coloane),
+            plus 'randuri' - numărul de rânduri selectate
+        """
+        summary = self._summary(selections)
+        totals = {name: summary['sums'].get(name, 0) for name in self.kpis}
+        totals['randuri'] = summary['rows']
+        return totals
+
+    def mean(self, name, selections=None, default=0):
+        """Media unui KPI pe rândurile selectate (valorile lipsă sunt ignorate)"""
+        summary = self._summary(selections)
+        count = summary['counts'].get(name, 0)
+        return summary['sums'][name] / count if count else default
+
+
+def get_metrics(df):
+    """Returnează motorul de KPI construit o singură dată per versiune de date"""
+    return get_derived(df, 'metrics', MetricsEngine)
@@ -0,0 +1,291 @@
+"""
+Index comun pe produse între exporturile de stoc și cele de vânzări
+
+Fiecare set de date primește, o singură dată per versiune, cheile de produs:
+rândurile ordonate după (produs, gestiune), cu offset-urile fiecărui produs
+și ale fiecărei perechi (produs, gestiune). Stocul (LaData) și vânzările
+(svzc) sunt apoi legate printr-un vocabular comun de produse, fără merge pe
+DataFrame-uri: sumele pe perechi se calculează o dată, iar rotația, zilele
+de acoperire și stocul mort pentru orice selecție de gestiuni sunt
+agregări pe perechi, nu pe rânduri.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config.settings import DEAD_STOCK_DAYS, SELECTION_CACHE_SIZE
+from utils.data_loaders import get_data_version, get_derived
+from utils.date_index import get_date_index
+from utils.filter_index import normalize_filters
+
+PRODUCT_COLUMN = 'Denumire'
+
+# Setul de date -> coloana gestiunii (None = exportul nu are gestiuni)
+PRODUCT_KEY_DATASETS = {
+    'balanta_la_data': 'DenumireGest',
+    'balanta_perioada': 'Denumire gestiune',
+    'vanzari_zi_clienti': 'Gestiune',
+    'top_produse': None,
+}
+
+# Coloanele folosite pentru rotație și acoperire
+STOCK_QUANTITY, STOCK_VALUE = 'Stoc final', 'ValoareStocFinal'
+SALES_QUANTITY, SALES_VALUE = 'Cantitate', 'Valoare'
+
+
+class ProductKeys:
+    """
+    Rândurile unui set de date grupate pe produs și pe (produs, gestiune)
+
+    Args:
+        df: DataFrame-ul din cache
+        product: Coloana produsului
+        gestiune: Coloana gestiunii (None sau lipsă = o singură gestiune)
+    """
+
+    def __init__(self, df, product=PRODUCT_COLUMN, gestiune=None):
+        self.frame = df
+        self.available = product in df.columns
+        self.gestiune = gestiune if gestiune in df.columns else None
+
+        if self.available:
+            product_codes, products = pd.factorize(df[product], sort=True)
+        else:
+            product_codes, products = np.full(len(df), -1), []
+        if self.gestiune is not None:
+            gestiune_codes, gestiuni = pd.factorize(df[self.gestiune], sort=True)
+        else:
+            gestiune_codes, gestiuni = np.full(len(df), -1), []
+        self.products = pd.Index(np.asarray(products, dtype=object))
+        self.gestiuni = pd.Index(np.asarray(gestiuni, dtype=object))
+
+        # Cheia perechii: produs × (gestiune + 1); gestiunea lipsă are codul 0
+        self._stride = len(self.gestiuni) + 1
+        rows = np.flatnonzero(product_codes >= 0)
+        keys = product_codes[rows].astype(np.int64) * self._stride + gestiune_codes[rows] + 1
+        order = np.argsort(keys, kind='stable')
+        self.order = rows[order]
+        sorted_keys = keys[order]
+        self.offsets = np.searchsorted(sorted_keys, np.arange(len(self.products) + 1) * self._stride)
+
+        # Perechile (produs, gestiune) prezente și offset-urile lor în order
+        self._pair_keys, pair_starts = np.unique(sorted_keys, return_index=True)
+        self.pair_offsets = np.append(pair_starts, len(sorted_keys))
+        self.pair_products = self._pair_keys // self._stride
+        self.pair_gestiuni = self._pair_keys % self._stride - 1
+
+    def __len__(self):
+        return len(self.products)
+
+    def rows(self, product, gestiune=None):
+        """Pozițiile rândurilor unui produs (opțional doar dintr-o gestiune)"""
+        code = self.products.get_indexer([product])[0]
+        if code < 0:
+            return self.order[:0]
+        if gestiune is None:
+            return self.order[self.offsets[code]:self.offsets[code + 1]]
+        gestiune_code = self.gestiuni.get_indexer([gestiune])[0]
+        pair = np.searchsorted(self._pair_keys, code * self._stride + gestiune_code + 1)
+        if gestiune_code < 0 or pair == len(self._pair_keys) or self.pair_products[pair] != code \
+                or self.pair_gestiuni[pair] != gestiune_code:
+            return self.order[:0]
+        return self.order[self.pair_offsets[pair]:self.pair_offsets[pair + 1]]
+
+    def pair_sums(self, column):
+        """Suma coloanei pe fiecare pereche (produs, gestiune); zero când coloana lipsește"""
+        if column not in self.frame.columns or not len(self.order):
+            return np.zeros(len(self.pair_products))
+        values = np.nan_to_num(self.frame[column].to_numpy(dtype=np.float64, na_value=np.nan))[self.order]
+        return np.add.reduceat(values, self.pair_offsets[:-1])
+
+    def pair_max(self, values):
+        """Maximul unor valori (aliniate cu rândurile) pe fiecare pereche"""
+        if not len(self.order):
+            return np.zeros(0, dtype=np.asarray(values).dtype)
+        return np.maximum.reduceat(np.asarray(values)[self.order], self.pair_offsets[:-1])
+
+    def gestiune_mask(self, gestiuni):
+        """Masca perechilor din gestiunile date (toate perechile când selecția e goală)"""
+        if not gestiuni:
+            return np.ones(len(self.pair_products), dtype=bool)
+        codes = self.gestiuni.get_indexer(pd.Index(list(gestiuni)))
+        return np.isin(self.pair_gestiuni, codes[codes >= 0])
+
+
+def get_product_keys(df, key):
+    """
+    Returnează cheile de produs ale unui set de date, construite o singură dată per versiune
+
+    Args:
+        df: DataFrame-ul din cache
+        key: Cheia setului de date din PRODUCT_KEY_DATASETS
+    """
+    return get_derived(df, 'product_keys', lambda value: ProductKeys(value, gestiune=PRODUCT_KEY_DATASETS[key]))
+
+
+class StockSalesJoin:
+    """
+    Rotația, acoperirea și stocul mort pe produs, din stoc (LaData) și vânzări (svzc)
+
+    Args:
+        stock_df: Balanța de stoc la dată
+        sales_df: Vânzările pe zile și clienți
+        dead_days: Zilele fără vânzări după care un produs cu stoc este stoc mort
+    """
+
+    def __init__(self, stock_df, sales_df, dead_days=DEAD_STOCK_DAYS):
+        self.stock = get_product_keys(stock_df, 'balanta_la_data')
+        self.sales = get_product_keys(sales_df, 'vanzari_zi_clienti')
+        self.dead_days = dead_days
+
+        # Vocabularul comun și maparea codurilor locale în el
+        self.products = self.stock.products.union(self.sales.products)
+        self._stock_codes = self.products.get_indexer(self.stock.products)[self.stock.pair_products]
+        self._sales_codes = self.products.get_indexer(self.sales.products)[self.sales.pair_products]
+
+        # Sumele pe perechi (produs, gestiune), calculate o singură dată
+        self._stock_sums = {column: self.stock.pair_sums(column) for column in (STOCK_QUANTITY, STOCK_VALUE)}
+        self._sales_sums = {column: self.sales.pair_sums(column) for column in (SALES_QUANTITY, SALES_VALUE)}
+
+        # Perioada vânzărilor și ultima zi cu vânzări pe fiecare pereche
+        dates = get_date_index(sales_df)
+        self.first, self.last = dates.first, dates.last
+        self.period_days = (self.last - self.first).days + 1 if len(dates) else 0
+        day_numbers = dates.days.values.astype('datetime64[D]').astype(np.int64)
+        self._last_day = int(day_numbers[-1]) if len(day_numbers) else 0
+        sale_days = np.full(len(sales_df), -1, dtype=np.int64)
+        sale_days[dates.order] = np.repeat(day_numbers, np.diff(dates.offsets))
+        self._last_sale = self.sales.pair_max(sale_days)
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def kpis(self, gestiuni=None):
+        """
+        Indicatorii pe produs pentru gestiunile selectate
+
+        Args:
+            gestiuni: Gestiunile incluse (None / listă goală = toate); numele
+                      sunt comparate între exporturi ca atare
+
+        Returns:
+            DataFrame indexat după produs, cu stocul, vânzările din perioadă,
+            Rotație, Zile acoperire (NaN pentru stocul fără vânzări), Zile fără
+            vânzări și Stoc mort; produsele fără stoc și fără vânzări sunt omise. Rezultatul este memoizat,
+            partajat și nu trebuie modificat
+        """
+        key = normalize_filters({'gestiune': gestiuni or []})
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        result = self._kpis(gestiuni)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > SELECTION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+    def _kpis(self, gestiuni):
+        n = len(self.products)
+        stock_pairs, sales_pairs = self.stock.gestiune_mask(gestiuni), self.sales.gestiune_mask(gestiuni)
+        stock_codes, sales_codes = self._stock_codes[stock_pairs], self._sales_codes[sales_pairs]
+
+        def per_product(codes, values, mask):
+            return np.bincount(codes, weights=values[mask], minlength=n)
+
+        stoc = per_product(stock_codes, self._stock_sums[STOCK_QUANTITY], stock_pairs)
+        valoare_stoc = per_product(stock_codes, self._stock_sums[STOCK_VALUE], stock_pairs)
+        vandut = per_product(sales_codes, self._sales_sums[SALES_QUANTITY], sales_pairs)
+        valoare_vanzari = per_product(sales_codes, self._sales_sums[SALES_VALUE], sales_pairs)
+        has_stock = np.bincount(stock_codes, minlength=n) > 0
+        has_sales = np.bincount(sales_codes, minlength=n) > 0
+
+        # Ultima zi cu vânzări (număr de zi; -1 = fără vânzări cu dată)
+        last_sale = np.full(n, -1, dtype=np.int64)
+        np.maximum.at(last_sale, sales_codes, self._last_sale[sales_pairs])
+        zile_fara_vanzari = np.where(last_sale >= 0, self._last_day - last_sale, np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            zilnic = vandut / self.period_days if self.period_days else np.zeros(n)
+            rotatie = np.where(stoc > 0, vandut / stoc, np.nan)
+            # Stoc fără vânzări în perioadă: acoperire nedefinită (celulă goală)
+            acoperire = np.where(stoc > 0, np.where(zilnic > 0, stoc / zilnic, np.nan), 0.0)
+        stoc_mort = (stoc > 0) & ((last_sale < 0) | (zile_fara_vanzari > self.dead_days))
+
+        table = pd.DataFrame({
+            STOCK_QUANTITY: stoc,
+            'Valoare stoc': valoare_stoc,
+            'Cantitate vândută': vandut,
+            'Valoare vânzări': valoare_vanzari,
+            'Rotație': rotatie,
+            'Zile acoperire': acoperire,
+            'Zile fără vânzări': zile_fara_vanzari,
+            'Stoc mort': stoc_mort,
+        }, index=pd.Index(self.products, name=PRODUCT_COLUMN))
+        return table[has_stock | has_sales]
+
+    def summary(self, gestiuni=None, products=None):
+        """
+        Totalurile pentru carduri: produse cu stoc, stoc mort (număr și valoare), acoperirea mediană
+
+        Args:
+            gestiuni: Gestiunile incluse (vezi kpis)
+            products: Produsele incluse (None = toate), ex. cele rămase după
+                      filtrele de grupă/produs ale paginii
+        """
+        table = self.kpis(gestiuni)
+        if products is not None:
+            table = table[table.index.isin(products)]
+        with_stock = table[table[STOCK_QUANTITY] > 0]
+        dead = with_stock['Stoc mort']
+        coverage = with_stock['Zile acoperire'].dropna()
+        return {
+            'produse_cu_stoc': len(with_stock),
+            'stoc_mort': int(dead.sum()),
+            'valoare_stoc_mort': float(with_stock.loc[dead, 'Valoare stoc'].sum()),
+            'acoperire_mediana': float(coverage.median()) if len(coverage) else 0.0,
+            'zile_perioada': self.period_days,
+        }
+
+
+class _JoinSlot:
+    """Legătura stoc-vânzări păstrată în intrarea stocului, pentru ultima versiune de vânzări folosită"""
+
+    def __init__(self, stock_df):
+        self.stock_df = stock_df
+        self.version = None
+        self.join = None
+        self._lock = threading.Lock()
+
+    def get(self, sales_df, version):
+        with self._lock:
+            # Aceeași versiune, dar și același obiect: o versiune reîncărcată după evacuare se reconstruiește
+            if self.join is None or self.version != version or self.join.sales.frame is not sales_df:
+                self.join = None  # legătura veche (și vânzările ei) se eliberează înainte de construcție
+                self.join = StockSalesJoin(self.stock_df, sales_df)
+                self.version = version
+            return self.join
+
+
+def get_stock_sales(stock_df, sales_df):
+    """
+    Returnează legătura stoc-vânzări pentru versiunile curente ale celor două exporturi
+
+    Legătura este un artefact derivat al stocului, cheiat după versiunea
+    vânzărilor: se eliberează odată cu versiunea stocului (în limitele de
+    intrări și memorie ale cache-ului), iar o versiune nouă de vânzări o
+    înlocuiește. Pentru un stoc care nu provine din cache se construiește direct.
+
+    Returns:
+        StockSalesJoin sau None când exportul de vânzări lipsește (date demo
+        sau DataFrame gol) - legătura nu se mai construiește
+    """
+    version = get_data_version(sales_df)
+    if version is None or sales_df.empty:
+        return None
+    return get_derived(stock_df, 'stock_sales', _JoinSlot).get(sales_df, version)
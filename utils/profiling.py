@@ -0,0 +1,203 @@
+"""
+Profilarea rerun-urilor: intervale de timp pe etapele paginilor
+
+Fiecare rerun (sau rerun de fragment) cu profilarea activă primește un
+RerunProfile; intervalele (span) deschise în timpul lui înregistrează durata
+și variația memoriei procesului (RSS) pentru etapele load, filter, aggregate
+și render. Fără un profil activ, span() nu face nimic.
+"""
+
+import contextvars
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import wraps
+
+from config.settings import PROFILE_HISTORY
+
+DEBUG_KEY = "debug_profiling"
+HISTORY_KEY = "debug_profiling_history"
+
+STAGES = ('load', 'filter', 'aggregate', 'render')
+
+_CURRENT = contextvars.ContextVar("rerun_profile", default=None)
+
+
+def rss_bytes():
+    """Memoria rezidentă a procesului (octeți) sau None dacă nu poate fi citită"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _delta(start, end):
+    return None if start is None or end is None else end - start
+
+
+@dataclass
+class Span:
+    """Un interval măsurat în timpul unui rerun"""
+    name: str
+    stage: str
+    offset: float
+    seconds: float
+    memory_delta: int = None
+
+
+@dataclass
+class RerunProfile:
+    """Intervalele unui rerun, în ordinea închiderii lor"""
+    label: str
+    started_at: str
+    seconds: float = 0.0
+    memory_delta: int = None
+    spans: list = field(default_factory=list)
+    _start: float = field(default=0.0, init=False, repr=False)
+
+    def stage_totals(self):
+        """Timpul total pe etape (intervalele imbricate sunt numărate la fiecare etapă)"""
+        totals = {}
+        for item in self.spans:
+            totals[item.stage] = totals.get(item.stage, 0.0) + item.seconds
+        return totals
+
+
+def current_profile():
+    """Profilul rerun-ului curent (None când profilarea nu este activă)"""
+    return _CURRENT.get()
+
+
+@contextmanager
+def rerun_profile(label, enabled=True, history=None):
+    """
+    Profilează un rerun
+
+    Dacă un profil este deja activ (ex. un fragment rulat în timpul rerun-ului
+    complet), intervalele sunt adăugate la acesta.
+
+    Args:
+        label: Numele rerun-ului (pagina sau fragmentul)
+        enabled: Dacă profilarea este activă
+        history: Colecția (ex. deque) în care se adaugă profilul la final
+    """
+    if not enabled or _CURRENT.get() is not None:
+        yield _CURRENT.get()
+        return
+
+    profile = RerunProfile(label, datetime.now().isoformat(timespec="seconds"))
+    token = _CURRENT.set(profile)
+    start, memory_start = time.perf_counter(), rss_bytes()
+    profile._start = start
+    try:
+        yield profile
+    finally:
+        profile.seconds = time.perf_counter() - start
+        profile.memory_delta = _delta(memory_start, rss_bytes())
+        _CURRENT.reset(token)
+        if history is not None:
+            history.append(profile)
+
+
+@contextmanager
+def span(name, stage):
+    """Măsoară un bloc de cod în profilul rerun-ului curent"""
+    profile = _CURRENT.get()
+    if profile is None:
+        yield
+        return
+
+    start, memory_start = time.perf_counter(), rss_bytes()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        profile.spans.append(Span(
+            name, stage, start - profile._start, end - start, _delta(memory_start, rss_bytes()),
+        ))
+
+
+def profile_records(profiles):
+    """Intervalele profilurilor ca listă de dicționare (câte unul per interval)"""
+    records = []
+    for number, profile in enumerate(profiles, start=1):
+        for item in profile.spans:
+            records.append({
+                'rerun': number,
+                'pagina': profile.label,
+                'pornit': profile.started_at,
+                'rerun_secunde': profile.seconds,
+                **asdict(item),
+            })
+    return records
+
+
+def export_profiles(profiles, fmt="csv"):
+    """
+    Exportă jurnalul de profilare
+
+    Args:
+        profiles: Profilurile de exportat
+        fmt: 'csv' (câte un rând per interval) sau 'json' (profilurile complete)
+    """
+    if fmt == "json":
+        payload = [
+            {**{k: v for k, v in asdict(profile).items() if k != 'spans' and not k.startswith('_')},
+             'stages': profile.stage_totals(),
+             'spans': [asdict(item) for item in profile.spans]}
+            for profile in profiles
+        ]
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    records = profile_records(profiles)
+    buffer = io.StringIO()
+    fields = ['rerun', 'pagina', 'pornit', 'rerun_secunde', 'name', 'stage', 'offset', 'seconds', 'memory_delta']
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue()
+
+
+def _session_state():
+    import streamlit as st
+    return st.session_state
+
+
+def is_profiling_enabled():
+    """Dacă utilizatorul a activat panoul de depanare în sesiunea curentă"""
+    try:
+        return bool(_session_state().get(DEBUG_KEY, False))
+    except Exception:
+        return False
+
+
+def profile_history():
+    """Ultimele profiluri ale sesiunii curente (cel mult PROFILE_HISTORY)"""
+    state = _session_state()
+    if HISTORY_KEY not in state:
+        state[HISTORY_KEY] = deque(maxlen=PROFILE_HISTORY)
+    return state[HISTORY_KEY]
+
+
+def session_profile(label):
+    """rerun_profile pentru sesiunea Streamlit curentă (activ doar cu panoul de depanare pornit)"""
+    enabled = is_profiling_enabled()
+    return rerun_profile(label, enabled, profile_history() if enabled else None)
+
+
+def profiled(label):
+    """Decorator pentru fragmente: un rerun al fragmentului are propriul profil"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with session_profile(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
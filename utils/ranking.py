@@ -0,0 +1,253 @@
+"""
+Clasamente Top-N pentru paginile de vânzări (produse, clienți)
+
+Sumele pe entitate (produs, client) se păstrează precalculate per versiune
+de date, atât global cât și pe partiții (zi, client, grupă): pentru fiecare
+valoare a partiției, sumele entităților care apar în ea. Totalurile pentru o
+selecție de zile/clienți se obțin adunând doar partițiile selectate, iar
+Top-K este o selecție parțială (np.argpartition) urmată de sortarea celor K
+rezultate - fără sortarea tuturor produselor la fiecare rerun.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config.settings import SELECTION_CACHE_SIZE
+from utils.data_loaders import get_derived
+from utils.filter_index import FilterIndex, normalize_filters
+
+# Eticheta afișată -> coloana entității clasate
+RANKING_ENTITIES = {
+    'Produse': 'Denumire',
+    'Clienți': 'Client',
+}
+
+# Coloanele după care se poate filtra, cu sume parțiale precalculate per valoare
+RANKING_PARTITIONS = ('Data', 'Client', 'Grupa')
+
+# Coloanele însumate (prima este criteriul implicit de clasare)
+RANKING_METRICS = ('Valoare', 'Cantitate')
+
+
+def show_option_limit(option):
+    """
+    Numărul de poziții pentru o opțiune din SHOW_OPTIONS
+
+    Returns:
+        K pentru "Top K", None pentru "Toate produsele"
+    """
+    match = re.search(r"\d+", str(option))
+    return int(match.group()) if match else None
+
+
+class TopNEngine:
+    """
+    Sumele pe entități calculate o singură dată per versiune de date
+
+    Args:
+        df: DataFrame-ul de vânzări (din cache)
+        entities: Coloanele clasate (cele lipsă sunt ignorate)
+        partitions: Coloanele de filtrare cu sume parțiale precalculate
+        metrics: Coloanele numerice însumate
+    """
+
+    def __init__(self, df, entities=tuple(RANKING_ENTITIES.values()), partitions=RANKING_PARTITIONS,
+                 metrics=RANKING_METRICS):
+        columns = list(dict.fromkeys([*entities, *partitions]))
+        self.index = FilterIndex(df, columns)
+        self.entities = [col for col in entities if col in self.index]
+        self.partitions = [col for col in partitions if col in self.index]
+        self.metrics = [col for col in metrics if col in df.columns]
+        self._row_values = {
+            col: np.nan_to_num(df[col].to_numpy(dtype=np.float64, na_value=np.nan)) for col in self.metrics
+        }
+
+        # Entitate -> totalurile globale; (partiție, entitate) -> sumele pe perechi
+        self._totals = {entity: self._sums(entity) for entity in self.entities}
+        self._pairs = {
+            (partition, entity): self._pair_sums(partition, entity)
+            for partition in self.partitions
+            for entity in self.entities
+            if partition != entity
+        }
+
+        self._selections = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sums(self, entity, rows=None):
+        """Numărul de rânduri și sumele metricilor per entitate (valorile lipsă sunt ignorate)"""
+        codes = self.index.codes(entity)
+        values = self._row_values
+        if rows is not None:
+            codes = codes[rows]
+            values = {col: array[rows] for col, array in values.items()}
+        present = codes >= 0
+        codes = codes[present]
+        size = len(self.index.values(entity))
+        sums = {'randuri': np.bincount(codes, minlength=size).astype(np.float64)}
+        for col, array in values.items():
+            sums[col] = np.bincount(codes, weights=array[present], minlength=size)
+        return sums
+
+    def _pair_sums(self, partition, entity):
+        """
+        Sumele pe perechi (valoare partiție, entitate) prezente în date
+
+        Perechile sunt sortate după partiție; offsets delimitează perechile
+        fiecărei valori a partiției.
+        """
+        partition_codes = self.index.codes(partition).astype(np.int64)
+        entity_codes = self.index.codes(entity).astype(np.int64)
+        present = (partition_codes >= 0) & (entity_codes >= 0)
+        n_entities = len(self.index.values(entity))
+
+        combined = partition_codes[present] * n_entities + entity_codes[present]
+        keys, pair_of_row = np.unique(combined, return_inverse=True)
+        pair_of_row = pair_of_row.reshape(-1)
+        sums = {'randuri': np.bincount(pair_of_row, minlength=len(keys)).astype(np.float64)}
+        for col, array in self._row_values.items():
+            sums[col] = np.bincount(pair_of_row, weights=array[present], minlength=len(keys))
+
+        n_partition = len(self.index.values(partition))
+        offsets = np.searchsorted(keys // n_entities, np.arange(n_partition + 1))
+        return {'entity': (keys % n_entities).astype(np.int32), 'offsets': offsets, 'sums': sums}
+
+    def _active(self, filters):
+        """Filtrele active: coloană -> codurile valorilor selectate (ridică KeyError pentru coloane nepartiționate)"""
+        active = {}
+        for column, values in (filters or {}).items():
+            if not len(values):
+                continue
+            if column not in self.partitions:
+                raise KeyError(f"Coloana {column} nu este partiționată pentru clasament")
+            active[column] = self.index.value_codes(column, values)
+        return active
+
+    def totals(self, entity, filters=None):
+        """
+        Sumele pe entitate pentru o selecție de filtre
+
+        Args:
+            entity: Coloana clasată (ex. 'Denumire')
+            filters: Dicționar coloană de partiție -> valori selectate
+
+        Returns:
+            Dicționar 'randuri' / metrică -> tablou indexat după codul entității
+            (tablourile sunt partajate și nu trebuie modificate)
+        """
+        key = (entity, normalize_filters(filters))
+        with self._lock:
+            if key in self._selections:
+                self._selections.move_to_end(key)
+                return self._selections[key]
+
+        result = self._compute_totals(entity, self._active(filters))
+        with self._lock:
+            self._selections[key] = result
+            while len(self._selections) > SELECTION_CACHE_SIZE:
+                self._selections.popitem(last=False)
+        return result
+
+    def _compute_totals(self, entity, active):
+        if not active:
+            return self._totals[entity]
+
+        if len(active) == 1:
+            (partition, codes), = active.items()
+            pairs = self._pairs.get((partition, entity))
+            if pairs is not None:
+                # Doar perechile valorilor selectate, fără parcurgerea rândurilor
+                offsets = pairs['offsets']
+                positions = np.concatenate(
+                    [np.arange(offsets[code], offsets[code + 1]) for code in codes] or [np.array([], dtype=np.int64)]
+                )
+                entity_codes = pairs['entity'][positions]
+                size = len(self.index.values(entity))
+                return {
+                    name: np.bincount(entity_codes, weights=values[positions], minlength=size)
+                    for name, values in pairs['sums'].items()
+                }
+
+        # Mai multe filtre: rândurile celei mai selective partiții, restrânse de celelalte
+        first = min(active, key=lambda column: self.index.row_count(active[column], column))
+        rows = self.index.postings(active[first], first)
+        for column, codes in active.items():
+            if column == first:
+                continue
+            lookup = np.zeros(len(self.index.values(column)) + 1, dtype=bool)
+            lookup[codes] = True
+            rows = rows[lookup[self.index.codes(column)[rows]]]
+        return self._sums(entity, rows)
+
+    def top(self, entity, k=None, metric=None, filters=None):
+        """
+        Primele K entități după o metrică
+
+        Args:
+            entity: Coloana clasată (ex. 'Denumire')
+            k: Numărul de poziții (None = toate)
+            metric: Coloana după care se clasează (implicit prima din RANKING_METRICS)
+            filters: Dicționar coloană de partiție -> valori selectate
+
+        Returns:
+            DataFrame cu entitatea, metricile și Pondere (%) din totalul
+            selecției, indexat după loc (1..K); doar entitățile cu vânzări
+        """
+        metric = metric or self.metrics[0]
+        totals = self.totals(entity, filters)
+        values = totals[metric]
+        candidates = np.flatnonzero(totals['randuri'] > 0)
+
+        if k is None or k >= len(candidates):
+            picked = candidates
+        else:
+            # Selecție parțială: O(n) pentru găsirea celor K, apoi sortarea doar a lor
+            picked = candidates[np.argpartition(-values[candidates], k - 1)[:k]]
+        picked = picked[np.lexsort((picked, -values[picked]))]
+
+        table = pd.DataFrame({entity: self.index.values(entity)[picked]})
+        for col in self.metrics:
+            table[col] = totals[col][picked]
+        total = values[candidates].sum()
+        table['Pondere (%)'] = values[picked] / total * 100 if total else 0.0
+        table.index = pd.RangeIndex(1, len(table) + 1, name='Loc')
+        return table
+
+    def summary(self, filters=None):
+        """Totalurile selecției: metricile, numărul de rânduri și de entități distincte"""
+        result = {}
+        for position, entity in enumerate(self.entities):
+            totals = self.totals(entity, filters)
+            if position == 0:
+                result.update({col: float(totals[col].sum()) for col in self.metrics})
+                result['randuri'] = int(totals['randuri'].sum())
+            result[entity] = int((totals['randuri'] > 0).sum())
+        return result
+
+    def options(self, column, filters=None):
+        """
+        Valorile distincte ale unei coloane indexate prezente în selecție
+
+        Args:
+            column: Coloana indexată (ex. 'Client')
+            filters: Dicționar coloană de partiție -> valori selectate (ex. ziua aleasă)
+
+        Returns:
+            Lista valorilor, în ordinea din index; pentru entități se folosesc
+            totalurile memoizate ale selecției, fără parcurgerea rândurilor
+        """
+        values = self.index.values(column)
+        if not self._active(filters):
+            return values.tolist()
+        if column in self.entities:
+            return values[self.totals(column, filters)['randuri'] > 0].tolist()
+        return self.index.options(column, self.index.mask(filters))
+
+
+def get_ranking(df):
+    """Returnează motorul de clasamente construit o singură dată per versiune de date"""
+    return get_derived(df, 'ranking', TopNEngine)
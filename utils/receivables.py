@@ -0,0 +1,302 @@
+"""
+Scadențele documentelor deschise: facturi neîncasate, neachitate și efecte de plată
+
+Pentru fiecare versiune de date, soldurile sunt ordonate o singură dată după
+scadență (global și pe partener) și după sumă, cu sumele cumulative asociate.
+Pentru orice dată de referință („la data”), intervalele de întârziere și
+expunerea pe partener se obțin prin căutări binare în aceste tablouri, iar
+pragul de sumă minimă este o felie din soldurile ordonate - fără refiltrarea
+DataFrame-ului.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config.settings import OVERDUE_BUCKETS, SELECTION_CACHE_SIZE
+from utils.data_loaders import get_derived
+from utils.date_index import DateIndex
+from utils.filter_index import FilterIndex, normalize_filters
+
+# Setul de date -> coloanele partenerului, scadenței și soldului deschis
+DUE_DATASETS = {
+    'neincasate': {'partner': 'Client', 'due': 'Data scadenta', 'amount': 'Rest de incasat'},
+    'neachitate': {'partner': 'Furnizor', 'due': 'Data scadenta', 'amount': 'Rest de plata'},
+    'plati_cu_efecte': {'partner': 'Furnizor', 'due': 'Data scadenta', 'amount': 'Suma'},
+}
+
+NOT_DUE_LABEL = "Nescadent"
+DAYS_OVERDUE_COLUMN = 'Zile întârziere'
+
+# Ziua folosită pentru scadențele lipsă: documentul nu ajunge niciodată restant
+_NO_DUE = np.iinfo(np.int64).max // 4
+
+
+def overdue_labels(edges=OVERDUE_BUCKETS):
+    """Etichetele intervalelor: nescadent, apoi zilele de întârziere (ex. '1–30 zile', ..., 'peste 90 zile')"""
+    labels, low = [NOT_DUE_LABEL], 1
+    for edge in edges:
+        labels.append(f"{low}–{edge} zile")
+        low = edge + 1
+    labels.append(f"peste {edges[-1]} zile" if edges else "Restant")
+    return labels
+
+
+def _as_day(value):
+    return int(np.datetime64(pd.Timestamp(value), 'D').astype(np.int64))
+
+
+def _split_buckets(before, total):
+    """
+    Valorile pe intervale din valorile cumulate „scadență înainte de limita i”
+
+    Limitele sunt descrescătoare (data de referință, apoi data minus fiecare
+    prag), deci diferențele consecutive dau intervalele de întârziere.
+    """
+    before = np.asarray(before, dtype=np.float64)
+    not_due = np.asarray(total, dtype=np.float64)[..., None] - before[..., :1]
+    return np.concatenate([not_due, before[..., :-1] - before[..., 1:], before[..., -1:]], axis=-1)
+
+
+class DueAgeingEngine:
+    """
+    Soldurile documentelor deschise ordonate după scadență
+
+    Args:
+        df: DataFrame-ul exportului (din cache)
+        partner: Coloana partenerului (client / furnizor)
+        amount: Coloana soldului deschis
+        due: Coloana datei de scadență
+        edges: Limitele superioare (zile de întârziere, inclusiv) ale intervalelor
+    """
+
+    def __init__(self, df, partner, amount, due='Data scadenta', edges=OVERDUE_BUCKETS):
+        self.frame = df
+        self.partner, self.amount, self.due = partner, amount, due
+        self.available = all(column in df.columns for column in (partner, amount, due))
+        self.edges = list(edges)
+        self.labels = overdue_labels(self.edges)
+        self.n_rows = len(df)
+
+        self.index = FilterIndex(df, [partner])
+        codes = self.index.codes(partner) if partner in self.index else np.full(len(df), -1, dtype=np.int32)
+        self.partners = self.index.values(partner) if partner in self.index else pd.Index([])
+
+        amounts = df[amount].to_numpy(dtype=np.float64, na_value=np.nan) if amount in df.columns else np.zeros(len(df))
+        self.amounts = np.nan_to_num(amounts)
+        dates = pd.DatetimeIndex(pd.to_datetime(df[due], errors='coerce') if due in df.columns else [pd.NaT] * len(df))
+        days = np.full(len(df), _NO_DUE, dtype=np.int64)
+        valid = ~dates.isna()
+        days[valid] = np.asarray(dates[valid], dtype='datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+        self.due_days = days
+
+        # Global: rândurile ordonate după scadență, cu soldurile cumulate
+        self._by_due = np.argsort(days, kind='stable')
+        self._due_sorted = days[self._by_due]
+        self._due_cumulative = np.concatenate(([0.0], np.cumsum(self.amounts[self._by_due])))
+
+        # Pe partener: rândurile ordonate după (partener, rangul scadenței); cheia
+        # combinată permite căutarea binară simultană pentru toți partenerii
+        self._distinct_days = np.unique(days)
+        self._stride = len(self._distinct_days) + 1
+        with_partner = np.flatnonzero(codes >= 0)
+        ranks = np.searchsorted(self._distinct_days, days[with_partner])
+        order = np.lexsort((ranks, codes[with_partner]))
+        self._partner_rows = with_partner[order]
+        partner_codes = codes[with_partner][order].astype(np.int64)
+        self._partner_keys = partner_codes * self._stride + ranks[order]
+        self._partner_cumulative = np.concatenate(([0.0], np.cumsum(self.amounts[self._partner_rows])))
+        self._partner_offsets = np.searchsorted(partner_codes, np.arange(len(self.partners) + 1))
+
+        # Soldurile ordonate crescător, pentru pragul de sumă minimă
+        self._by_amount = np.argsort(self.amounts, kind='stable')
+        self._amount_sorted = self.amounts[self._by_amount]
+        self._amount_cumulative = np.concatenate(([0.0], np.cumsum(self._amount_sorted)))
+
+        # Calendarul scadențelor: soldurile pe zile, săptămâni și luni
+        self.calendar = DateIndex(df, due, (amount,))
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cuts(self, as_of):
+        """Limitele intervalelor: scadența înainte de limita i = cel puțin edges[i-1] zile de întârziere"""
+        day = _as_day(as_of)
+        return np.array([day] + [day - edge for edge in self.edges], dtype=np.int64)
+
+    def _memoized(self, key, compute):
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > SELECTION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+    def _partner_buckets(self, as_of):
+        """Documentele și soldurile pe (partener, interval), prin căutări binare pe partener"""
+        cuts = np.searchsorted(self._distinct_days, self._cuts(as_of), side='left')
+        starts, ends = self._partner_offsets[:-1], self._partner_offsets[1:]
+        # Pozițiile limitelor pentru fiecare (partener, limită)
+        keys = np.arange(len(self.partners), dtype=np.int64)[:, None] * self._stride + cuts[None, :]
+        bounds = np.searchsorted(self._partner_keys, keys, side='left')
+        counts = _split_buckets(bounds - starts[:, None], ends - starts)
+        sums = _split_buckets(
+            self._partner_cumulative[bounds] - self._partner_cumulative[starts][:, None],
+            self._partner_cumulative[ends] - self._partner_cumulative[starts],
+        )
+        return counts, sums
+
+    def buckets(self, as_of, partners=None, min_amount=None):
+        """
+        Soldurile pe intervale de întârziere la o dată de referință
+
+        Args:
+            as_of: Data de referință
+            partners: Partenerii selectați (None / listă goală = toți)
+            min_amount: Soldul minim al documentelor incluse (None / 0 = toate)
+
+        Returns:
+            DataFrame indexat după interval, cu Documente, Sold și Pondere (%);
+            rezultatul este memoizat, partajat și nu trebuie modificat
+        """
+        def compute():
+            if min_amount:
+                rows = self.documents(as_of, partners, min_amount)
+                bucket = np.searchsorted(-self._cuts(as_of), -self.due_days[rows], side='left')
+                counts = np.bincount(bucket, minlength=len(self.labels))
+                sums = np.bincount(bucket, weights=self.amounts[rows], minlength=len(self.labels))
+            elif partners:
+                partner_counts, partner_sums = self._partner_buckets(as_of)
+                selected = self.index.value_codes(self.partner, partners) if len(self.partners) else []
+                counts, sums = partner_counts[selected].sum(axis=0), partner_sums[selected].sum(axis=0)
+            else:
+                # Doar căutări binare în scadențele ordonate global
+                bounds = np.searchsorted(self._due_sorted, self._cuts(as_of), side='left')
+                counts = _split_buckets(bounds, self.n_rows)
+                sums = _split_buckets(self._due_cumulative[bounds], self._due_cumulative[-1])
+
+            total = sums.sum()
+            return pd.DataFrame({
+                'Documente': np.asarray(counts, dtype=np.int64),
+                'Sold': sums,
+                'Pondere (%)': sums / total * 100 if total else np.zeros(len(self.labels)),
+            }, index=pd.Index(self.labels, name='Interval'))
+
+        key = ('intervale', _as_day(as_of), normalize_filters({'partner': partners or []}), min_amount or 0)
+        return self._memoized(key, compute)
+
+    def exposure(self, as_of, partners=None, min_amount=None):
+        """
+        Expunerea pe partener la o dată de referință
+
+        Args:
+            as_of: Data de referință
+            partners: Partenerii selectați (None / listă goală = toți)
+            min_amount: Soldul minim al documentelor incluse (None / 0 = toate),
+                        ca în buckets
+
+        Returns:
+            DataFrame indexat după partener, cu soldul pe fiecare interval, Sold
+            total, Restant, Documente restante și Zile întârziere maxime,
+            ordonat descrescător după restant; partenerii fără documente sunt omiși
+        """
+        def compute():
+            n_partners = len(self.partners)
+            if min_amount:
+                # Doar documentele peste prag (felie din soldurile ordonate)
+                rows = self.documents(as_of, partners, min_amount)
+                codes = self.index.codes(self.partner)[rows] if n_partners else np.zeros(0, dtype=np.int64)
+                rows, codes = rows[codes >= 0], codes[codes >= 0].astype(np.int64)
+                bucket = np.searchsorted(-self._cuts(as_of), -self.due_days[rows], side='left')
+                cells = codes * len(self.labels) + bucket
+                shape = (n_partners, len(self.labels))
+                counts = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+                sums = np.bincount(cells, weights=self.amounts[rows], minlength=shape[0] * shape[1]).reshape(shape)
+                has_rows = counts.sum(axis=1) > 0
+                first_due = np.full(n_partners, _NO_DUE, dtype=np.int64)
+                np.minimum.at(first_due, codes, self.due_days[rows])
+            else:
+                counts, sums = self._partner_buckets(as_of)
+                starts, ends = self._partner_offsets[:-1], self._partner_offsets[1:]
+                has_rows = ends > starts
+                # Scadența cea mai veche a fiecărui partener: primul rând din grupul lui
+                first_due = np.full(n_partners, _NO_DUE, dtype=np.int64)
+                first_due[has_rows] = self.due_days[self._partner_rows[starts[has_rows]]]
+            day = _as_day(as_of)
+
+            table = pd.DataFrame(sums, index=pd.Index(self.partners, name=self.partner), columns=self.labels)
+            table['Sold total'] = sums.sum(axis=1)
+            table['Restant'] = sums[:, 1:].sum(axis=1)
+            table['Documente restante'] = counts[:, 1:].sum(axis=1).astype(np.int64)
+            table['Zile întârziere maxime'] = np.where(first_due < day, day - np.minimum(first_due, day), 0)
+            table = table[has_rows]
+            if partners:
+                table = table[table.index.isin(partners)]
+            return table.sort_values(['Restant', 'Sold total'], ascending=False)
+
+        key = ('expunere', _as_day(as_of), normalize_filters({'partner': partners or []}), min_amount or 0)
+        return self._memoized(key, compute)
+
+    def above(self, min_amount):
+        """Numărul de documente și soldul total pentru documentele cu sold >= min_amount"""
+        start = int(np.searchsorted(self._amount_sorted, min_amount, side='left')) if min_amount else 0
+        return self.n_rows - start, float(self._amount_cumulative[-1] - self._amount_cumulative[start])
+
+    def documents(self, as_of=None, partners=None, min_amount=None, overdue_only=False):
+        """
+        Pozițiile documentelor selectate, ordonate după scadență
+
+        Args:
+            as_of: Data de referință (necesară pentru overdue_only)
+            partners: Partenerii selectați (None / listă goală = toți)
+            min_amount: Soldul minim (felie din soldurile ordonate)
+            overdue_only: Doar documentele restante la data de referință
+        """
+        overdue_only = overdue_only and as_of is not None
+        if partners:
+            codes = self.index.value_codes(self.partner, partners) if len(self.partners) else []
+            rows = self.index.postings(codes, self.partner) if len(codes) else np.array([], dtype=np.int64)
+        elif min_amount:
+            rows = self._by_amount[np.searchsorted(self._amount_sorted, min_amount, side='left'):]
+        elif overdue_only:
+            return self._by_due[:np.searchsorted(self._due_sorted, _as_day(as_of), side='left')]
+        else:
+            return self._by_due
+
+        if min_amount:
+            rows = rows[self.amounts[rows] >= min_amount]
+        if overdue_only:
+            rows = rows[self.due_days[rows] < _as_day(as_of)]
+        return rows[np.argsort(self.due_days[rows], kind='stable')]
+
+    def days_overdue(self, rows, as_of):
+        """Zilele de întârziere la data de referință (0 pentru documentele nescadente sau fără scadență)"""
+        days = self.due_days[rows]
+        return np.where(days < _as_day(as_of), _as_day(as_of) - np.minimum(days, _as_day(as_of)), 0)
+
+    def table(self, rows, as_of):
+        """Documentele selectate, cu coloana zilelor de întârziere la data de referință"""
+        table = self.frame.iloc[rows].copy()
+        table[DAYS_OVERDUE_COLUMN] = self.days_overdue(rows, as_of)
+        return table
+
+
+def get_due_ageing(df, key):
+    """
+    Returnează motorul de scadențe construit o singură dată per versiune de date
+
+    Args:
+        df: DataFrame-ul exportului (din cache)
+        key: Cheia setului de date din DUE_DATASETS
+    """
+    columns = DUE_DATASETS[key]
+    return get_derived(
+        df, f'due_ageing_{key}',
+        lambda value: DueAgeingEngine(value, columns['partner'], columns['amount'], columns['due']),
+    )
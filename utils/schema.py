@@ -0,0 +1,80 @@
+"""
+Aplicarea schemei de tipuri (config.schemas) pe DataFrame-urile încărcate
+"""
+
+import hashlib
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def memory_usage_bytes(df):
+    """Memoria totală ocupată de un DataFrame (inclusiv conținutul șirurilor)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def schema_tag(schema):
+    """Identificator scurt al unei scheme, folosit pentru invalidarea snapshot-urilor"""
+    payload = json.dumps(schema or {}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _to_category(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True).startswith("mixed"):
+        # Categoriile trebuie să fie de un singur tip pentru a putea fi salvate în Parquet
+        series = series.where(series.isna(), series.astype(str))
+    return series.astype("category")
+
+
+def _to_integer(series):
+    numeric = pd.to_numeric(series, errors="coerce")
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+    if np.isnan(values).any() or not np.array_equal(values, np.round(values)):
+        return numeric.astype("float32")
+    return pd.to_numeric(numeric.astype("int64"), downcast="integer")
+
+
+def _to_datetime(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors="coerce", dayfirst=True)
+
+
+_CONVERTERS = {
+    'category': _to_category,
+    'integer': _to_integer,
+    'float32': lambda series: pd.to_numeric(series, errors="coerce").astype("float32"),
+    'float': lambda series: pd.to_numeric(series, errors="coerce").astype("float64"),
+    'datetime': _to_datetime,
+}
+
+
+def apply_schema(df, schema, copy=True):
+    """
+    Convertește coloanele unui DataFrame conform schemei declarate
+
+    Args:
+        df: DataFrame-ul citit din Excel
+        schema: Dicționar coloană -> tip (vezi config.schemas)
+        copy: False pentru a înlocui coloanele direct în df (fără copia
+              întregului DataFrame), când apelantul nu mai folosește originalul
+
+    Returns:
+        DataFrame-ul cu tipurile aplicate (coloanele nedeclarate rămân neschimbate)
+    """
+    if copy:
+        df = df.copy()
+    for column, kind in (schema or {}).items():
+        if column not in df.columns:
+            continue
+        try:
+            df[column] = _CONVERTERS[kind](df[column])
+        except (TypeError, ValueError) as exc:
+            logger.warning("Coloana %s nu a putut fi convertită la %s: %s", column, kind, exc)
+    return df
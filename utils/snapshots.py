@@ -0,0 +1,283 @@
+"""
+Snapshot-uri columnare pentru exporturile Excel din ERP
+
+Fiecare fișier din DATA_PATHS este parsat o singură dată și salvat tipizat.
+Cât timp fișierul sursă nu se schimbă (mtime + hash), încărcarea se face
+direct din snapshot, doar pentru coloanele cerute.
+
+Formate (SNAPSHOT_FORMAT):
+    'parquet' - comprimat; fiecare proces decodează propria copie a datelor
+    'arrow'   - Arrow IPC necomprimat, citit memory-mapped: coloanele numerice
+                și categoriale folosesc direct paginile fișierului, partajate
+                prin page cache de toate procesele (replicile) de pe server
+
+Scrierea unui snapshot este protejată de un lacăt pe fișier, per server:
+dintre replicile care pornesc simultan, doar una parsează exportul, iar
+celelalte așteaptă și citesc snapshot-ul scris de ea.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from config.settings import SNAPSHOT_DIR, SNAPSHOT_FORMAT
+
+try:
+    import fcntl
+except ImportError:  # Windows - fără lacăt între procese
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Formatul snapshot-ului -> extensia fișierului de date
+SNAPSHOT_EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+
+def file_signature(path):
+    """
+    Semnătura rapidă a unui fișier (fără citirea conținutului)
+
+    Returns:
+        Dicționar {"mtime_ns": ..., "size": ...}; ridică FileNotFoundError dacă fișierul lipsește
+    """
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Calculează hash-ul SHA-1 al conținutului unui fișier"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _format(fmt):
+    fmt = fmt or SNAPSHOT_FORMAT
+    if fmt not in SNAPSHOT_EXTENSIONS:
+        raise ValueError(f"Format de snapshot necunoscut: {fmt}")
+    return fmt
+
+
+def snapshot_paths(key, snapshot_dir=None, fmt=None):
+    """Returnează căile (date, metadate) pentru snapshot-ul unui set de date"""
+    base = Path(snapshot_dir or SNAPSHOT_DIR)
+    return base / f"{key}.{SNAPSHOT_EXTENSIONS[_format(fmt)]}", base / f"{key}.json"
+
+
+@contextmanager
+def snapshot_lock(key, snapshot_dir=None):
+    """
+    Lacăt exclusiv (per server) pentru scrierea snapshot-ului unui set de date
+
+    Blochează până când celelalte procese care scriu același snapshot termină.
+    """
+    base = Path(snapshot_dir or SNAPSHOT_DIR)
+    base.mkdir(parents=True, exist_ok=True)
+    with open(base / f"{key}.lock", "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def write_arrow(path, df):
+    """Scrie un DataFrame ca Arrow IPC necomprimat (poate fi citit memory-mapped)"""
+    feather.write_feather(df.reset_index(drop=True), path, compression="uncompressed")
+
+
+def read_arrow(path, columns=None):
+    """
+    Citește un fișier Arrow IPC memory-mapped, opțional doar unele coloane
+
+    Coloanele numerice fără valori lipsă și codurile coloanelor categoriale
+    nu sunt copiate: tablourile (read-only) indică direct în fișier.
+    """
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def read_snapshot_meta(key, snapshot_dir=None):
+    """Citește metadatele snapshot-ului sau None dacă nu există"""
+    _, meta_path = snapshot_paths(key, snapshot_dir)
+    try:
+        with open(meta_path, encoding="utf-8") as handle:
+            meta = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return meta
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = meta_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(meta, handle, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+
+def resolve_fresh_snapshot(key, source_path, snapshot_dir=None, tag=None, fmt=None):
+    """
+    Verifică dacă snapshot-ul existent corespunde fișierului sursă
+
+    Compară întâi semnătura (mtime, dimensiune); doar dacă aceasta diferă se
+    calculează hash-ul conținutului. Un fișier copiat din nou cu același
+    conținut nu declanșează o nouă parsare.
+
+    Args:
+        tag: Identificatorul schemei de tipuri; un snapshot scris cu altă schemă este invalid
+        fmt: Formatul snapshot-ului (implicit SNAPSHOT_FORMAT); un snapshot
+             scris în alt format este invalid
+
+    Returns:
+        Metadatele snapshot-ului valid sau None dacă trebuie regenerat
+    """
+    fmt = _format(fmt)
+    meta = read_snapshot_meta(key, snapshot_dir)
+    data_path, meta_path = snapshot_paths(key, snapshot_dir, fmt)
+    if meta is None or not data_path.exists() or meta.get("tag") != tag:
+        return None
+    if meta.get("format", "parquet") != fmt:
+        return None
+
+    signature = file_signature(source_path)
+    if meta.get("signature") == signature:
+        return meta
+
+    if meta.get("hash") != file_hash(source_path):
+        return None
+
+    # Conținut identic, doar mtime diferit - actualizăm semnătura
+    meta["signature"] = signature
+    _write_meta(meta_path, meta)
+    return meta
+
+
+def _prepare_for_arrow(df):
+    """Normalizează coloanele cu tipuri amestecate astfel încât să poată fi scrise în Parquet"""
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+    for col in df.columns:
+        if df[col].dtype == object:
+            inferred = pd.api.types.infer_dtype(df[col], skipna=True)
+            if inferred.startswith("mixed") and inferred != "mixed-integer-float":
+                df[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+    return df
+
+
+def write_snapshot(key, df, source_path, snapshot_dir=None, digest=None, tag=None, fmt=None, signature=None):
+    """
+    Scrie snapshot-ul și metadatele asociate (atomic)
+
+    Raportul de memorie din df.attrs['memory_report'] (dacă există) este
+    păstrat în metadate.
+
+    Args:
+        digest, signature: Hash-ul și semnătura sursei citite înainte de
+                           parsare; dacă lipsesc, se citesc acum (fișierul
+                           poate fi fost rescris între timp)
+
+    Returns:
+        DataFrame-ul normalizat, exact cum a fost salvat
+    """
+    fmt = _format(fmt)
+    data_path, meta_path = snapshot_paths(key, snapshot_dir, fmt)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+
+    df = _prepare_for_arrow(df)
+    # Fișierul temporar este unic per proces; os.replace nu afectează
+    # procesele care au deja versiunea anterioară memory-mapped
+    tmp_path = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+    if fmt == "arrow":
+        write_arrow(tmp_path, df)
+    else:
+        df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, data_path)
+
+    _write_meta(meta_path, {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "format": fmt,
+        "source": str(source_path),
+        "signature": signature or file_signature(source_path),
+        "hash": digest or file_hash(source_path),
+        "columns": list(df.columns),
+        "rows": len(df),
+        "tag": tag,
+        "report": df.attrs.get("memory_report"),
+    })
+    return df
+
+
+def read_snapshot(key, columns=None, snapshot_dir=None, meta=None, fmt=None):
+    """
+    Citește snapshot-ul, opțional doar un subset de coloane
+
+    Coloanele cerute care nu există în snapshot sunt ignorate.
+    """
+    fmt = _format(fmt)
+    data_path, _ = snapshot_paths(key, snapshot_dir, fmt)
+    if columns is not None:
+        meta = meta or read_snapshot_meta(key, snapshot_dir) or {}
+        available = meta.get("columns", [])
+        columns = [col for col in columns if col in available]
+    if fmt == "arrow":
+        return read_arrow(data_path, columns)
+    return pd.read_parquet(data_path, columns=columns)
+
+
+def load_with_snapshot(key, source_path, reader, columns=None, snapshot_dir=None, tag=None, fmt=None):
+    """
+    Încarcă un set de date folosind snapshot-ul când este valid
+
+    Args:
+        key: Cheia setului de date (din DATA_PATHS)
+        source_path: Calea către fișierul Excel sursă
+        reader: Funcția care parsează fișierul sursă într-un DataFrame
+        columns: Coloanele necesare paginii (None = toate)
+        snapshot_dir: Directorul pentru snapshot-uri (implicit SNAPSHOT_DIR)
+        tag: Identificatorul schemei de tipuri aplicate de reader
+        fmt: Formatul snapshot-ului (implicit SNAPSHOT_FORMAT)
+
+    Returns:
+        DataFrame-ul încărcat
+    """
+    fmt = _format(fmt)
+    meta = resolve_fresh_snapshot(key, source_path, snapshot_dir, tag, fmt)
+    if meta is not None:
+        return read_snapshot(key, columns, snapshot_dir, meta, fmt)
+
+    with snapshot_lock(key, snapshot_dir):
+        # Între timp, alt proces poate să fi scris deja snapshot-ul
+        meta = resolve_fresh_snapshot(key, source_path, snapshot_dir, tag, fmt)
+        if meta is not None:
+            return read_snapshot(key, columns, snapshot_dir, meta, fmt)
+
+        # Semnătura și hash-ul fișierului parsat, luate înainte de parsare: dacă
+        # ERP-ul rescrie exportul între timp, snapshot-ul apare învechit, nu proaspăt
+        signature = file_signature(source_path)
+        digest = file_hash(source_path)
+        df = reader(source_path)
+        try:
+            df = write_snapshot(key, df, source_path, snapshot_dir, digest, tag, fmt, signature)
+            if fmt == "arrow":
+                # Și procesul care a scris folosește paginile partajate ale fișierului
+                return read_snapshot(key, columns, snapshot_dir, fmt=fmt)
+        except Exception as exc:
+            logger.warning("Nu s-a putut scrie snapshot-ul pentru %s: %s", key, exc)
+
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    return df
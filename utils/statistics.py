@@ -0,0 +1,163 @@
+"""
+Statistici pentru cardurile de metrici ale paginilor
+
+Toate agregările cerute de o pagină (sume, medii, valori distincte, număr de
+rânduri) se calculează împreună, într-o singură parcurgere a rândurilor
+selectate: coloanele numerice sunt citite pe blocuri într-o matrice și
+reduse vectorizat. Rezultatele sunt memoizate per versiune de date și
+amprenta rândurilor selectate, deci un rerun cu aceeași selecție (oricum ar
+fi fost produsă: filtre, căutare, prag) nu recalculează.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config.settings import SELECTION_CACHE_SIZE
+from utils.data_loaders import get_derived
+from utils.filter_index import get_filter_index
+
+# Formatul unui card (din columns_config) -> agregarea calculată
+STAT_AGGREGATES = {
+    'sum': 'sum',
+    'currency': 'sum',
+    'number': 'sum',
+    'mean': 'mean',
+    'count': 'nunique',
+}
+
+# Coloana virtuală pentru numărul de rânduri selectate
+COUNT_ROWS = 'count_rows'
+
+# Numărul de rânduri citite dintr-o dată în matricea de reducere
+BLOCK_ROWS = 65_536
+
+
+def stat_specs(columns_config):
+    """Agregările (coloană, agregare) cerute de o configurare de carduri, fără duplicate"""
+    specs = []
+    for config in columns_config:
+        column = config['column']
+        aggregate = 'rows' if column == COUNT_ROWS else STAT_AGGREGATES.get(config.get('format', 'number'), 'sum')
+        specs.append((column, aggregate))
+    return tuple(dict.fromkeys(specs))
+
+
+class StatisticsEngine:
+    """
+    Agregări memoizate pentru o versiune de date
+
+    Args:
+        df: DataFrame-ul din cache
+    """
+
+    def __init__(self, df):
+        self.frame = df
+        self.index = get_filter_index(df)
+        self._converted = {}
+        self._factorized = {}
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compute(self, specs, positions=None):
+        """
+        Calculează toate agregările cerute pentru rândurile selectate
+
+        Args:
+            specs: Perechi (coloană, agregare) - agregare: 'sum', 'mean',
+                   'nunique' sau 'rows' (vezi stat_specs)
+            positions: Pozițiile rândurilor selectate (None = toate); cheia de
+                       memoizare este amprenta lor
+
+        Returns:
+            Dicționar (coloană, agregare) -> valoare; coloanele care lipsesc
+            din date nu apar în rezultat
+        """
+        specs = tuple(specs)
+        if positions is None:
+            selection = ('toate',)
+        else:
+            positions = np.asarray(positions)
+            selection = ('pozitii', len(positions), hashlib.blake2b(positions.tobytes(), digest_size=16).hexdigest())
+
+        key = (specs, selection)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        result = self._compute(specs, positions)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > SELECTION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+    def _compute(self, specs, positions):
+        n_rows = len(self.frame) if positions is None else len(positions)
+        numeric = list(dict.fromkeys(
+            column for column, aggregate in specs
+            if aggregate in ('sum', 'mean') and column in self.frame.columns
+        ))
+
+        # O singură parcurgere: blocuri de rânduri × toate coloanele numerice
+        sums = np.zeros(len(numeric))
+        counts = np.zeros(len(numeric), dtype=np.int64)
+        if numeric:
+            arrays = [self._numeric(column) for column in numeric]
+            block = np.empty((min(BLOCK_ROWS, max(n_rows, 1)), len(numeric)))
+            for start in range(0, n_rows, BLOCK_ROWS):
+                rows = slice(start, min(start + BLOCK_ROWS, n_rows))
+                selected = rows if positions is None else positions[rows]
+                values = block[:rows.stop - rows.start]
+                for i, array in enumerate(arrays):
+                    values[:, i] = array[selected]
+                present = ~np.isnan(values)
+                sums += np.where(present, values, 0.0).sum(axis=0)
+                counts += present.sum(axis=0)
+
+        result = {}
+        for column, aggregate in specs:
+            if aggregate == 'rows':
+                result[(column, aggregate)] = n_rows
+            elif column not in self.frame.columns:
+                continue
+            elif aggregate == 'sum':
+                result[(column, aggregate)] = float(sums[numeric.index(column)])
+            elif aggregate == 'mean':
+                i = numeric.index(column)
+                result[(column, aggregate)] = float(sums[i] / counts[i]) if counts[i] else 0.0
+            elif aggregate == 'nunique':
+                result[(column, aggregate)] = self._nunique(column, positions)
+        return result
+
+    def _numeric(self, column):
+        """Coloana ca float64 (NaN pentru valori lipsă), convertită o singură dată"""
+        with self._lock:
+            if column not in self._converted:
+                self._converted[column] = self.frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            return self._converted[column]
+
+    def _codes(self, column):
+        """Codurile categoriale ale coloanei: din FilterIndex sau factorizate o singură dată"""
+        if column in self.index:
+            return self.index.codes(column), len(self.index.values(column))
+        with self._lock:
+            if column not in self._factorized:
+                codes, values = pd.factorize(self.frame[column], sort=False)
+                self._factorized[column] = codes, len(values)
+            return self._factorized[column]
+
+    def _nunique(self, column, positions):
+        codes, n_values = self._codes(column)
+        if positions is not None:
+            codes = codes[positions]
+        return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=n_values)))
+
+
+def get_statistics(df):
+    """Returnează motorul de statistici (cu memoizarea lui) pentru o versiune de date"""
+    return get_derived(df, 'statistics', StatisticsEngine)
@@ -0,0 +1,215 @@
+"""
+Vizualizări read-only peste DataFrame-urile partajate din cache
+
+Un FrameView combină DataFrame-ul partajat de toate sesiunile cu o selecție
+de rânduri (poziții). Metricile se calculează direct pe coloanele necesare,
+iar DataFrame-ul filtrat se materializează doar la afișare.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loaders import get_derived
+
+
+class FrameView:
+    """
+    Selecție de rânduri peste un DataFrame partajat
+
+    Args:
+        frame: DataFrame-ul partajat (nu se modifică niciodată)
+        positions: Pozițiile rândurilor selectate (None = toate rândurile)
+        index: FilterIndex-ul setului de date, folosit pentru grupări pe coduri
+    """
+
+    def __init__(self, frame, positions=None, index=None):
+        self.frame = frame
+        self.positions = positions
+        self.index = index
+
+    def __len__(self):
+        return len(self.frame) if self.positions is None else len(self.positions)
+
+    def __contains__(self, column):
+        return column in self.frame.columns
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def columns(self):
+        return self.frame.columns
+
+    def values(self, column):
+        """Valorile unei coloane pentru rândurile selectate, ca array numpy"""
+        values = self.frame[column].to_numpy()
+        return values if self.positions is None else values[self.positions]
+
+    def _numeric(self, column):
+        return self.values(column).astype(np.float64, copy=False)
+
+    def sum(self, column, default=0):
+        """Suma unei coloane (valorile lipsă sunt ignorate, ca în pandas)"""
+        if column not in self:
+            return default
+        return float(np.nansum(self._numeric(column)))
+
+    def mean(self, column, default=0):
+        """Media unei coloane pentru rândurile selectate"""
+        if column not in self or self.empty:
+            return default
+        values = self._numeric(column)
+        values = values[~np.isnan(values)]
+        return float(values.mean()) if len(values) else default
+
+    def sum_product(self, left, right, default=0):
+        """Suma produselor a două coloane (ex. Stoc final × Preț vânzare)"""
+        if left not in self or right not in self:
+            return default
+        return float(np.nansum(self._numeric(left) * self._numeric(right)))
+
+    def nunique(self, column):
+        """Numărul de valori distincte (fără valori lipsă)"""
+        if self.index is not None and column in self.index:
+            codes = self.index.codes(column)
+            codes = codes if self.positions is None else codes[self.positions]
+            return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=1)))
+        return int(self.frame[column].iloc[self._row_selector()].nunique())
+
+    def first(self, column, default=None):
+        """Prima valoare a unei coloane din selecție"""
+        if column not in self or self.empty:
+            return default
+        row = 0 if self.positions is None else self.positions[0]
+        return self.frame[column].iloc[row]
+
+    def group_sum(self, by, column):
+        """
+        Suma coloanei pe grupuri, doar pentru grupurile prezente în selecție
+
+        Folosește codurile din FilterIndex (np.bincount) când sunt disponibile.
+
+        Returns:
+            Series indexată după valorile coloanei de grupare
+        """
+        if self.index is not None and by in self.index:
+            codes = self.index.codes(by)
+            values = self.frame[column].to_numpy().astype(np.float64, copy=False)
+            if self.positions is not None:
+                codes, values = codes[self.positions], values[self.positions]
+            valid = (codes >= 0) & ~np.isnan(values)
+            group_values = self.index.values(by)
+            sums = np.bincount(codes[valid], weights=values[valid], minlength=len(group_values))
+            present = np.bincount(codes[codes >= 0], minlength=len(group_values)) > 0
+            return pd.Series(sums[present], index=group_values[present], name=column).rename_axis(by)
+        frame = self.frame.iloc[self._row_selector()]
+        return frame.groupby(by, observed=True, sort=False)[column].sum()
+
+    def select(self, positions):
+        """Restrânge selecția la pozițiile date (relative la selecția curentă)"""
+        positions = np.asarray(positions)
+        if self.positions is not None:
+            positions = self.positions[positions]
+        return FrameView(self.frame, positions, self.index)
+
+    def to_frame(self, columns=None, start=None, stop=None):
+        """
+        Materializează rândurile selectate (opțional doar o fereastră)
+
+        Este singura operație care copiază date și trebuie folosită doar pentru afișare.
+        """
+        frame = self.frame if columns is None else self.frame[list(columns)]
+        rows = self._row_selector()
+        if start is not None or stop is not None:
+            rows = rows[start:stop] if not isinstance(rows, slice) else slice(start, stop)
+        if isinstance(rows, slice) and rows == slice(None):
+            return frame
+        return frame.iloc[rows]
+
+    def _row_selector(self):
+        return slice(None) if self.positions is None else self.positions
+
+
+def _sort_key(series):
+    """Cheie numerică de sortare; valorile lipsă primesc NaN (ajung la final)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        if not len(series.cat.categories):
+            return np.full(len(series), np.nan)
+        # Rangul lexical al fiecărei categorii
+        rank = np.argsort(np.argsort(series.cat.categories.astype(str), kind='stable')).astype(np.float64)
+        return np.where(codes >= 0, rank[codes], np.nan)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        key = series.to_numpy().astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+        key[series.isna().to_numpy()] = np.nan
+        return key
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes, _ = pd.factorize(series.astype(str).where(series.notna()), sort=True)
+    return np.where(codes >= 0, codes, np.nan)
+
+
+def _build_sort_order(frame, column):
+    key = _sort_key(frame[column])
+    order = np.argsort(key, kind='stable')
+    return order, int(np.isnan(key).sum())
+
+
+def sort_order(frame, column):
+    """
+    Ordinea crescătoare a tuturor rândurilor după o coloană
+
+    Calculată o singură dată per versiune de date și coloană; valorile lipsă
+    sunt la final.
+
+    Returns:
+        (pozițiile sortate, numărul de valori lipsă)
+    """
+    return get_derived(frame, f"sort_order:{column}", lambda df: _build_sort_order(df, column))
+
+
+def sort_view(view, column, ascending=True):
+    """
+    Sortează o selecție folosind ordinea precalculată a întregului set de date
+
+    Costul este liniar (filtrarea ordinii globale), fără o nouă sortare.
+    """
+    order, n_missing = sort_order(view.frame, column)
+    if not ascending:
+        present = order[:len(order) - n_missing]
+        order = np.concatenate((present[::-1], order[len(order) - n_missing:]))
+    if view.positions is not None:
+        selected = np.zeros(len(view.frame), dtype=bool)
+        selected[view.positions] = True
+        order = order[selected[order]]
+    return FrameView(view.frame, order, view.index)
+
+
+def search_view(view, text, columns=None):
+    """
+    Păstrează rândurile în care textul apare în cel puțin una dintre coloane
+
+    Pentru coloanele categoriale căutarea se face o singură dată pe categorii,
+    apoi rezultatul se propagă pe coduri.
+    """
+    text = (text or "").strip()
+    if not text:
+        return view
+    frame = view.frame
+    if columns is None:
+        columns = [col for col in frame.columns
+                   if isinstance(frame[col].dtype, pd.CategoricalDtype) or not pd.api.types.is_numeric_dtype(frame[col])]
+
+    rows = view.positions if view.positions is not None else np.arange(len(frame))
+    match = np.zeros(len(rows), dtype=bool)
+    for column in columns:
+        series = frame[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            hits = pd.Index(series.cat.categories.astype(str)).str.contains(text, case=False, regex=False)
+            lookup = np.append(np.asarray(hits, dtype=bool), False)
+            match |= lookup[series.cat.codes.to_numpy()[rows]]
+        else:
+            values = series.iloc[rows].astype(str).where(series.iloc[rows].notna(), "")
+            match |= values.str.contains(text, case=False, regex=False).to_numpy(dtype=bool)
+    return FrameView(frame, rows[match], view.index)
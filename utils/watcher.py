@@ -0,0 +1,123 @@
+"""
+Watcher în fundal pentru exporturile din directorul data/
+
+Verifică periodic fișierele din DATA_PATHS și, când un export se schimbă,
+îl reîncarcă pe un fir separat, astfel încât utilizatorii să primească
+direct versiunea deja încălzită.
+"""
+
+import logging
+import os
+import threading
+
+from config.settings import DATA_PATHS, STARTUP_INGEST_MODE, WATCHER_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+_WATCHER = None
+_WATCHER_LOCK = threading.Lock()
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DataWatcher(threading.Thread):
+    """
+    Fir de execuție care urmărește fișierele din DATA_PATHS
+
+    Un fișier este reîncărcat doar după ce semnătura sa rămâne stabilă două
+    verificări consecutive, pentru a nu parsa un export copiat pe jumătate.
+
+    Args:
+        on_change: Funcția apelată cu cheia setului de date modificat
+        data_paths: Dicționarul cheie -> cale (implicit DATA_PATHS)
+        interval: Secunde între verificări
+        warmup: Funcție apelată o dată la pornire, înaintea primei verificări
+    """
+
+    def __init__(self, on_change, data_paths=None, interval=WATCHER_INTERVAL, warmup=None):
+        super().__init__(name="data-watcher", daemon=True)
+        self.on_change = on_change
+        self.data_paths = dict(data_paths or DATA_PATHS)
+        self.interval = interval
+        self.warmup = warmup
+        self._stop_event = threading.Event()
+        self._ingested = {}
+        self._pending = {}
+
+    def stop(self):
+        """Oprește watcher-ul după verificarea curentă"""
+        self._stop_event.set()
+
+    def poll(self):
+        """
+        Execută o singură verificare a fișierelor
+
+        Returns:
+            Lista cheilor reîncărcate la această verificare
+        """
+        changed = []
+        for key, path in self.data_paths.items():
+            signature = _signature(path)
+            if signature is None or signature == self._ingested.get(key):
+                self._pending.pop(key, None)
+                continue
+
+            if self._pending.get(key) != signature:
+                # Prima observare a noii semnături - așteptăm să se stabilizeze
+                self._pending[key] = signature
+                continue
+
+            try:
+                self.on_change(key)
+            except Exception as exc:
+                logger.warning("Preîncărcarea %s a eșuat: %s", key, exc)
+                continue
+            self._ingested[key] = signature
+            self._pending.pop(key, None)
+            changed.append(key)
+        return changed
+
+    def run(self):
+        if self.warmup is not None:
+            # Semnăturile de dinainte de încărcare: un fișier schimbat între timp va fi reîncărcat
+            signatures = {key: _signature(path) for key, path in self.data_paths.items()}
+            try:
+                self.warmup()
+                self._ingested.update({key: sig for key, sig in signatures.items() if sig is not None})
+            except Exception as exc:
+                logger.warning("Încărcarea la pornire a eșuat: %s", exc)
+
+        while not self._stop_event.is_set():
+            self.poll()
+            self._stop_event.wait(self.interval)
+
+
+def start_data_watcher(interval=WATCHER_INTERVAL, startup_mode=STARTUP_INGEST_MODE):
+    """
+    Pornește (o singură dată per proces) watcher-ul pentru data/
+
+    La pornire, watcher-ul încarcă toate exporturile conform startup_mode
+    ("parallel" într-un pool de procese, "sequential" sau None).
+
+    Returns:
+        Instanța DataWatcher activă
+    """
+    global _WATCHER
+    from utils.data_loaders import prewarm_dataset
+    from utils.ingest import ingest_all
+
+    warmup = None
+    if startup_mode:
+        warmup = lambda: ingest_all(parallel=startup_mode == "parallel")
+
+    with _WATCHER_LOCK:
+        if _WATCHER is None or not _WATCHER.is_alive():
+            _WATCHER = DataWatcher(prewarm_dataset, interval=interval, warmup=warmup)
+            _WATCHER.start()
+        return _WATCHER